@@ -8,15 +8,17 @@ from src.resources.game_config_resource import GameConfigResource
 
 
 def test_scoremanager_sums_only_top_k(monkeypatch):
-    # Build a full 5x5 grid with arbitrary identical cards
+    # Build a full 5x5 grid of distinct cards, so every line is evaluated
+    # (identical lines would share one cached evaluation)
     config = GameConfigResource()
     config.lines_scored_per_hand = 3
     rows, cols = config.grid_rows, config.grid_cols
 
+    distinct_cards = [(rank, suit) for suit in "HDSC" for rank in "A23456789TJQK"]
     grid = [[GridCellResource(row=r, col=c) for c in range(cols)] for r in range(rows)]
     for r in range(rows):
         for c in range(cols):
-            grid[r][c].set_card(CardResource("A", "H"))
+            grid[r][c].set_card(CardResource(*distinct_cards[r * cols + c]))
 
     state = GameStateResource(grid=grid, config=config)
 
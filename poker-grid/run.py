@@ -9,19 +9,35 @@ import io
 
 # Set UTF-8 encoding for Windows terminal
 if sys.platform == "win32":
-    sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8')
+    try:
+        # Reuse the existing stream instead of stacking a second wrapper on top
+        sys.stdout.reconfigure(encoding='utf-8', line_buffering=False)
+    except AttributeError:
+        sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8', line_buffering=False)
+
+from typing import TYPE_CHECKING
 
 from src.managers.game_manager import GameManager
-from src.managers.joker_manager import JokerManager
-from src.managers.shop_manager import ShopManager
-from src.resources.game_config_resource import GameConfigResource
-from src.ui_adapter import UIAdapter
-from src.ui.terminal_ui import TerminalUI
-from src.utils.joker_loader import JokerLoader
+from src.ui.terminal_ui import TerminalUI, batched_output
+
+if TYPE_CHECKING:
+    # Type hints only - these are imported lazily inside run_game()/run_round()
+    from src.managers.joker_manager import JokerManager
+    from src.managers.shop_manager import ShopManager
+
+
+# Round summary templates (rendered with str.format_map on a state snapshot)
+_ROUND_RESULT_HEADER = "ROUND {round} COMPLETE!\nCumulative Score: {score} chips\nRequired: {required} chips\n"
+_REWARD_TOKENS = "\n🎫 TOKENS EARNED:\n   Base reward: {reward_amount} tokens\n"
+_REWARD_TOKENS_BONUS = "   Early completion bonus: +{reward_bonus} tokens\n"
+_REWARD_TOKENS_TOTAL = "   Total: {reward_total} tokens\n"
+_REWARD_MONEY = "💰 Earned ${reward_total} from {reward_total} unutilized hand(s)!\n"
+_QUOTA_MET = "✓ Round {round} quota met! (+{surplus} chips surplus)\n"
+_QUOTA_FAILED = "❌ ROUND {round} FAILED!\nShort by: {shortfall} chips\n"
 
 
-def run_shop(game_manager: GameManager, joker_manager: JokerManager,
-             shop_manager: ShopManager, ui: TerminalUI, currency_reward: dict = None):
+def run_shop(game_manager: GameManager, joker_manager: 'JokerManager',
+             shop_manager: 'ShopManager', ui: TerminalUI, currency_reward: dict = None):
     """
     Run the shop phase between rounds.
     Player can buy, sell, and reroll jokers.
@@ -29,10 +45,11 @@ def run_shop(game_manager: GameManager, joker_manager: JokerManager,
     shop_manager.open_shop()
 
     # Display shop header
-    ui.print_shop_header(currency_reward)
-    ui.print_active_jokers(joker_manager)
-    ui.print_shop_inventory(shop_manager)
-    ui.print_shop_commands(shop_manager.get_reroll_cost())
+    with batched_output():
+        ui.print_shop_header(currency_reward)
+        ui.print_active_jokers(joker_manager)
+        ui.print_shop_inventory(shop_manager)
+        ui.print_shop_commands(shop_manager.get_reroll_cost())
 
     # Shop loop
     while True:
@@ -48,10 +65,11 @@ def run_shop(game_manager: GameManager, joker_manager: JokerManager,
                 ui.print_error(message)
 
             # Refresh display
-            ui.print_shop_header()
-            ui.print_active_jokers(joker_manager)
-            ui.print_shop_inventory(shop_manager)
-            ui.print_shop_commands(shop_manager.get_reroll_cost())
+            with batched_output():
+                ui.print_shop_header()
+                ui.print_active_jokers(joker_manager)
+                ui.print_shop_inventory(shop_manager)
+                ui.print_shop_commands(shop_manager.get_reroll_cost())
 
         elif action == "sell":
             slot = args[0]
@@ -62,10 +80,11 @@ def run_shop(game_manager: GameManager, joker_manager: JokerManager,
                 ui.print_error(message)
 
             # Refresh display
-            ui.print_shop_header()
-            ui.print_active_jokers(joker_manager)
-            ui.print_shop_inventory(shop_manager)
-            ui.print_shop_commands(shop_manager.get_reroll_cost())
+            with batched_output():
+                ui.print_shop_header()
+                ui.print_active_jokers(joker_manager)
+                ui.print_shop_inventory(shop_manager)
+                ui.print_shop_commands(shop_manager.get_reroll_cost())
 
         elif action == "reroll":
             success, message = shop_manager.reroll_shop()
@@ -75,10 +94,11 @@ def run_shop(game_manager: GameManager, joker_manager: JokerManager,
                 ui.print_error(message)
 
             # Refresh display
-            ui.print_shop_header()
-            ui.print_active_jokers(joker_manager)
-            ui.print_shop_inventory(shop_manager)
-            ui.print_shop_commands(shop_manager.get_reroll_cost())
+            with batched_output():
+                ui.print_shop_header()
+                ui.print_active_jokers(joker_manager)
+                ui.print_shop_inventory(shop_manager)
+                ui.print_shop_commands(shop_manager.get_reroll_cost())
 
         elif action == "done":
             shop_manager.close_shop()
@@ -90,175 +110,196 @@ def run_shop(game_manager: GameManager, joker_manager: JokerManager,
             ui.print_error("Invalid command. Try 'b <slot>', 's <slot>', 'r', or 'd'")
 
 
-def run_round(game_manager: GameManager, joker_manager: JokerManager, ui: TerminalUI):
+def run_round(game_manager: GameManager, joker_manager: 'JokerManager', ui: TerminalUI):
     """
     Run a single round: 7 spins with column rerolls.
     Auto-score after each spin.
     Returns (continue_game, currency_reward) tuple.
     """
+    from src.ui_adapter import UIAdapter
+
     # Use UIAdapter to bridge between new architecture and old UI
     adapter = UIAdapter(game_manager)
 
+    # Quota for this round is fixed for the whole spin loop
+    round_index = game_manager.state.current_round - 1  # 0-indexed
+    required_score = game_manager.config.round_quotas[round_index]
+
+    # Freeze settings can't change mid-round - read them once
+    freeze_enabled = game_manager.config.enable_freeze
+    show_auto_freeze = freeze_enabled and game_manager.config.auto_freeze_highest_pair
+
     # Calculate and display current spin's score IMMEDIATELY
     current_score, row_hands, col_hands, top_lines = game_manager.score_manager.score_current_grid()
 
     # Display initial state with top 3 highlighted
-    ui.print_round_header(current_score)
-    ui.print_trophy_box(top_lines, current_score)
-    ui.print_grid_with_scores(row_hands, col_hands, top_lines)
+    with batched_output():
+        ui.print_round_header(current_score)
+        ui.print_trophy_box(top_lines, current_score)
+        ui.print_grid_with_scores(row_hands, col_hands, top_lines)
 
-    # Show auto-freeze message if applicable (only if freeze enabled)
-    if game_manager.config.enable_freeze and game_manager.config.auto_freeze_highest_pair:
-        ui.print_auto_freeze_message()
+        # Show auto-freeze message if applicable (only if freeze enabled)
+        if show_auto_freeze:
+            ui.print_auto_freeze_message()
 
-    if game_manager.config.enable_freeze:
-        ui.print_freeze_info()
+        if freeze_enabled:
+            ui.print_freeze_info()
 
-    # Show active jokers if any
-    if joker_manager.get_joker_count() > 0:
-        print(f"\nActive Jokers ({joker_manager.get_joker_count()}/{joker_manager.max_slots}):")
-        for joker in joker_manager.active_jokers:
-            print(f"  • {joker.get_display_name()}")
-        print()
+        # Show active jokers if any
+        joker_count = joker_manager.get_joker_count()
+        if joker_count:
+            names = "\n".join(f"  • {joker.get_display_name()}" for joker in joker_manager.active_jokers)
+            print(f"\nActive Jokers ({joker_count}/{joker_manager.max_slots}):\n{names}\n")
 
-    ui.print_commands()
+        ui.print_commands()
 
-    # Spin phase - player can reroll columns and complete spins
-    while game_manager.state.spins_left > 0:
-        cmd_str = ui.get_input()
-        action, args = ui.parse_command(cmd_str)
+    # Command handlers - each returns True when the spin loop should end
+    def _reroll(column_indices) -> bool:
+        # Reroll columns (GDD v1.1)
+        success, message = adapter.reroll_columns(column_indices)
+        if not success:
+            # Grid is untouched - the frame on screen is still current
+            ui.print_error(message)
+            return False
 
-        if action == "reroll":
-            # Reroll columns (GDD v1.1)
-            column_indices = args
-            success, message = adapter.reroll_columns(column_indices)
-            if success:
-                ui.print_message(f"✓ {message}")
-            else:
-                ui.print_error(message)
+        ui.print_message(f"✓ {message}")
 
-            # Recalculate score with new cards
-            current_score, row_hands, col_hands, top_lines = game_manager.score_manager.score_current_grid()
+        # Recalculate score with new cards
+        current_score, row_hands, col_hands, top_lines = game_manager.score_manager.score_current_grid()
 
-            # Refresh display with updated top 3
+        # Refresh display with updated top 3
+        with batched_output():
             ui.print_round_header(current_score)
             ui.print_trophy_box(top_lines, current_score)
             ui.print_grid_with_scores(row_hands, col_hands, top_lines)
 
-            if game_manager.config.enable_freeze:
+            if freeze_enabled:
                 ui.print_freeze_info()
+        return False
 
-        elif action == "freeze":
-            # Only allow freeze commands if freeze system is enabled
-            if not game_manager.config.enable_freeze:
-                ui.print_error("Freeze system is disabled")
-                continue
-
-            row, col = args
-            success, message = adapter.toggle_freeze(row, col)
-            if success:
-                ui.print_message(message)
-            else:
-                ui.print_error(message)
-
-            # Refresh display
-            ui.print_grid()
-            ui.print_freeze_info()
+    def _freeze(cell) -> bool:
+        row, col = cell
+        success, message = adapter.toggle_freeze(row, col)
+        if success:
+            ui.print_message(message)
+        else:
+            ui.print_error(message)
 
-        elif action == "unfreeze_all":
-            # Only allow unfreeze if freeze system is enabled
-            if not game_manager.config.enable_freeze:
-                ui.print_error("Freeze system is disabled")
-                continue
+        # Refresh display
+        ui.print_grid()
+        ui.print_freeze_info()
+        return False
 
-            adapter.unfreeze_all()
-            ui.print_message("All cells unfrozen")
-            ui.print_grid()
-            ui.print_freeze_info()
+    def _unfreeze_all(_args) -> bool:
+        adapter.unfreeze_all()
+        ui.print_message("All cells unfrozen")
+        ui.print_grid()
+        ui.print_freeze_info()
+        return False
 
-        elif action == "play_hand":
-            # Score current grid FIRST (this locks in the spin)
-            current_score, row_hands, col_hands, top_lines = adapter.score_and_update()
+    def _freeze_disabled(_args) -> bool:
+        ui.print_error("Freeze system is disabled")
+        return False
 
-            # Mark spin as complete
-            game_manager.state.complete_spin()
+    def _play_hand(_args) -> bool:
+        # Score current grid FIRST (this locks in the spin)
+        adapter.score_and_update()
 
-            # Check if quota reached mid-round
-            round_index = game_manager.state.current_round - 1
-            required_score = game_manager.config.round_quotas[round_index]
+        # Mark spin as complete
+        game_manager.state.complete_spin()
 
-            if game_manager.state.cumulative_score >= required_score:
-                print(f"\n🎉 ROUND QUOTA REACHED! ({game_manager.state.cumulative_score}/{required_score})")
-                print(f"Auto-ending round with {game_manager.state.spins_left} spins remaining...")
-                input("\nPress Enter to continue...")
-                print()
-                break  # Exit spin loop - quota reached!
+        # Check if quota reached mid-round
+        if game_manager.state.cumulative_score >= required_score:
+            print(f"\n🎉 ROUND QUOTA REACHED! ({game_manager.state.cumulative_score}/{required_score})")
+            print(f"Auto-ending round with {game_manager.state.spins_left} spins remaining...")
+            print()
+            ui.wait_ack()
+            print()
+            return True  # Exit spin loop - quota reached!
 
-            # THEN deal new grid for next spin (if spins remain)
-            if game_manager.state.spins_left > 0:
-                adapter.play_spin()
+        # THEN deal new grid for next spin (if spins remain)
+        if game_manager.state.spins_left > 0:
+            adapter.play_spin()
 
-                # Calculate score for NEW grid
-                current_score, row_hands, col_hands, top_lines = game_manager.score_manager.score_current_grid()
+            # Calculate score for NEW grid
+            current_score, row_hands, col_hands, top_lines = game_manager.score_manager.score_current_grid()
 
-                # Refresh display with new grid and top 3 highlighted
+            # Refresh display with new grid and top 3 highlighted
+            with batched_output():
                 ui.print_round_header(current_score)
                 ui.print_trophy_box(top_lines, current_score)
                 ui.print_grid_with_scores(row_hands, col_hands, top_lines)
 
                 # Show auto-refreeze message if applicable
-                if game_manager.config.enable_freeze and game_manager.config.auto_freeze_highest_pair:
+                if show_auto_freeze:
                     ui.print_auto_freeze_message()
 
-                if game_manager.config.enable_freeze:
+                if freeze_enabled:
                     ui.print_freeze_info()
 
                 # Show commands again
                 ui.print_commands()
+        return False
+
+    # Freeze commands only get real handlers when the freeze system is on
+    handlers = {"reroll": _reroll, "play_hand": _play_hand}
+    if freeze_enabled:
+        handlers.update({"freeze": _freeze, "unfreeze_all": _unfreeze_all})
+    else:
+        handlers.update({"freeze": _freeze_disabled, "unfreeze_all": _freeze_disabled})
 
-        elif action == "quit":
+    # Spin phase - player can reroll columns and complete spins
+    while game_manager.state.spins_left > 0:
+        cmd_str = ui.get_input()
+        action, args = ui.parse_command(cmd_str)
+
+        if action == "quit":
             return (False, 0)
 
-        else:
+        handler = handlers.get(action)
+        if handler is None:
             ui.print_error("Invalid command")
             ui.print_commands()
+            continue
+
+        if handler(args):
+            break  # Quota reached
 
     # Round complete - calculate currency reward
     currency_reward = game_manager.complete_round()
 
-    # Get required score for this round
-    round_index = game_manager.state.current_round - 1  # 0-indexed
-    required_score = game_manager.config.round_quotas[round_index]
-
-    # Show final results
-    ui.print_divider("=")
-    print(f"ROUND {game_manager.state.current_round} COMPLETE!")
-    print(f"Cumulative Score: {game_manager.state.cumulative_score} chips")
-    print(f"Required: {required_score} chips")
-
-    # Show currency reward
+    # Snapshot everything the summary needs once
+    cumulative_score = game_manager.state.cumulative_score
+    snapshot = {
+        'round': game_manager.state.current_round,
+        'score': cumulative_score,
+        'required': required_score,
+        'surplus': cumulative_score - required_score,
+        'shortfall': required_score - cumulative_score,
+        'reward_amount': currency_reward['amount'],
+        'reward_bonus': currency_reward['bonus'],
+        'reward_total': currency_reward['total'],
+    }
+    quota_met = cumulative_score >= required_score
+
+    # Pick templates for this outcome, then render the block in one write
+    parts = [_ROUND_RESULT_HEADER]
     if currency_reward['currency_type'] == 'tokens':
-        print(f"\n🎫 TOKENS EARNED:")
-        print(f"   Base reward: {currency_reward['amount']} tokens")
+        parts.append(_REWARD_TOKENS)
         if currency_reward['bonus'] > 0:
-            print(f"   Early completion bonus: +{currency_reward['bonus']} tokens")
-        print(f"   Total: {currency_reward['total']} tokens")
-    else:
-        if currency_reward['total'] > 0:
-            print(f"💰 Earned ${currency_reward['total']} from {currency_reward['total']} unutilized hand(s)!")
+            parts.append(_REWARD_TOKENS_BONUS)
+        parts.append(_REWARD_TOKENS_TOTAL)
+    elif currency_reward['total'] > 0:
+        parts.append(_REWARD_MONEY)
+    parts.append(_QUOTA_MET if quota_met else _QUOTA_FAILED)
 
-    # Check if quota met for this round
-    if game_manager.state.cumulative_score >= required_score:
-        surplus = game_manager.state.cumulative_score - required_score
-        print(f"✓ Round {game_manager.state.current_round} quota met! (+{surplus} chips surplus)")
-    else:
-        shortfall = required_score - game_manager.state.cumulative_score
-        print(f"❌ ROUND {game_manager.state.current_round} FAILED!")
-        print(f"Short by: {shortfall} chips")
-        ui.print_divider("=")
+    ui.print_divider("=")
+    sys.stdout.write("".join(parts).format_map(snapshot))
+    ui.print_divider("=")
+
+    if not quota_met:
         return (False, currency_reward)  # End game - quota not met
 
-    ui.print_divider("=")
     print()
 
     return (True, currency_reward)
@@ -266,6 +307,13 @@ def run_round(game_manager: GameManager, joker_manager: JokerManager, ui: Termin
 
 def run_game():
     """Main game loop with shop system."""
+    # Deferred imports: keep module import (and time-to-first-frame) cheap
+    from src.managers.joker_manager import JokerManager
+    from src.managers.shop_manager import ShopManager
+    from src.resources.game_config_resource import GameConfigResource
+    from src.ui_adapter import UIAdapter
+    from src.utils.joker_loader import JokerLoader
+
     # Initialize with new architecture
     config = GameConfigResource()
     joker_manager = JokerManager(max_slots=5)
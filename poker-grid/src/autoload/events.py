@@ -4,10 +4,99 @@ Central event system using signal pattern.
 In Godot: extends Node (autoload singleton)
 """
 
-from typing import Dict, List, Callable
-
-
-class Events:
+import sys
+from typing import Dict, List, Callable, Tuple
+
+# Signal names, interned once so emit/connect share the same key object
+_SIG_CELL_FROZEN = sys.intern("cell_frozen")
+_SIG_CELL_UNFROZEN = sys.intern("cell_unfrozen")
+_SIG_GRID_UPDATED = sys.intern("grid_updated")
+_SIG_HAND_STARTED = sys.intern("hand_started")
+_SIG_HAND_COMPLETED = sys.intern("hand_completed")
+_SIG_CARDS_DEALT = sys.intern("cards_dealt")
+_SIG_SCORE_UPDATED = sys.intern("score_updated")
+_SIG_POKER_HAND_SCORED = sys.intern("poker_hand_scored")
+_SIG_HANDS_SCORED = sys.intern("hands_scored")
+_SIG_ROUND_STARTED = sys.intern("round_started")
+_SIG_ROUND_COMPLETED = sys.intern("round_completed")
+_SIG_GAME_STARTED = sys.intern("game_started")
+_SIG_GAME_WON = sys.intern("game_won")
+_SIG_GAME_LOST = sys.intern("game_lost")
+_SIG_FREEZE_LIMIT_REACHED = sys.intern("freeze_limit_reached")
+_SIG_HAND_LIMIT_REACHED = sys.intern("hand_limit_reached")
+_SIG_COLUMNS_REROLLED = sys.intern("columns_rerolled")
+_SIG_SPIN_COMPLETED = sys.intern("spin_completed")
+_SIG_REROLL_TOKENS_UPDATED = sys.intern("reroll_tokens_updated")
+
+# Built-in signal -> class attribute holding its callbacks (read directly by emit_*)
+_SIGNALS: Dict[str, str] = {
+    _SIG_CELL_FROZEN: "_cb_cell_frozen",
+    _SIG_CELL_UNFROZEN: "_cb_cell_unfrozen",
+    _SIG_GRID_UPDATED: "_cb_grid_updated",
+    _SIG_HAND_STARTED: "_cb_hand_started",
+    _SIG_HAND_COMPLETED: "_cb_hand_completed",
+    _SIG_CARDS_DEALT: "_cb_cards_dealt",
+    _SIG_SCORE_UPDATED: "_cb_score_updated",
+    _SIG_POKER_HAND_SCORED: "_cb_poker_hand_scored",
+    _SIG_HANDS_SCORED: "_cb_hands_scored",
+    _SIG_ROUND_STARTED: "_cb_round_started",
+    _SIG_ROUND_COMPLETED: "_cb_round_completed",
+    _SIG_GAME_STARTED: "_cb_game_started",
+    _SIG_GAME_WON: "_cb_game_won",
+    _SIG_GAME_LOST: "_cb_game_lost",
+    _SIG_FREEZE_LIMIT_REACHED: "_cb_freeze_limit_reached",
+    _SIG_HAND_LIMIT_REACHED: "_cb_hand_limit_reached",
+    _SIG_COLUMNS_REROLLED: "_cb_columns_rerolled",
+    _SIG_SPIN_COMPLETED: "_cb_spin_completed",
+    _SIG_REROLL_TOKENS_UPDATED: "_cb_reroll_tokens_updated",
+}
+
+
+# Bit per built-in signal, set in Events._active_signals while it has subscribers
+_MASK_CELL_FROZEN = 1 << 0
+_MASK_CELL_UNFROZEN = 1 << 1
+_MASK_GRID_UPDATED = 1 << 2
+_MASK_HAND_STARTED = 1 << 3
+_MASK_HAND_COMPLETED = 1 << 4
+_MASK_CARDS_DEALT = 1 << 5
+_MASK_SCORE_UPDATED = 1 << 6
+_MASK_POKER_HAND_SCORED = 1 << 7
+_MASK_ROUND_STARTED = 1 << 8
+_MASK_ROUND_COMPLETED = 1 << 9
+_MASK_GAME_STARTED = 1 << 10
+_MASK_GAME_WON = 1 << 11
+_MASK_GAME_LOST = 1 << 12
+_MASK_FREEZE_LIMIT_REACHED = 1 << 13
+_MASK_HAND_LIMIT_REACHED = 1 << 14
+_MASK_COLUMNS_REROLLED = 1 << 15
+_MASK_SPIN_COMPLETED = 1 << 16
+_MASK_REROLL_TOKENS_UPDATED = 1 << 17
+_MASK_HANDS_SCORED = 1 << 18
+
+_SIGNAL_MASKS: Dict[str, int] = {
+    _SIG_CELL_FROZEN: _MASK_CELL_FROZEN,
+    _SIG_CELL_UNFROZEN: _MASK_CELL_UNFROZEN,
+    _SIG_GRID_UPDATED: _MASK_GRID_UPDATED,
+    _SIG_HAND_STARTED: _MASK_HAND_STARTED,
+    _SIG_HAND_COMPLETED: _MASK_HAND_COMPLETED,
+    _SIG_CARDS_DEALT: _MASK_CARDS_DEALT,
+    _SIG_SCORE_UPDATED: _MASK_SCORE_UPDATED,
+    _SIG_POKER_HAND_SCORED: _MASK_POKER_HAND_SCORED,
+    _SIG_HANDS_SCORED: _MASK_HANDS_SCORED,
+    _SIG_ROUND_STARTED: _MASK_ROUND_STARTED,
+    _SIG_ROUND_COMPLETED: _MASK_ROUND_COMPLETED,
+    _SIG_GAME_STARTED: _MASK_GAME_STARTED,
+    _SIG_GAME_WON: _MASK_GAME_WON,
+    _SIG_GAME_LOST: _MASK_GAME_LOST,
+    _SIG_FREEZE_LIMIT_REACHED: _MASK_FREEZE_LIMIT_REACHED,
+    _SIG_HAND_LIMIT_REACHED: _MASK_HAND_LIMIT_REACHED,
+    _SIG_COLUMNS_REROLLED: _MASK_COLUMNS_REROLLED,
+    _SIG_SPIN_COMPLETED: _MASK_SPIN_COMPLETED,
+    _SIG_REROLL_TOKENS_UPDATED: _MASK_REROLL_TOKENS_UPDATED,
+}
+
+
+class _EventBus:
     """
     Global event bus for game-wide signals.
     In Godot, this would be an autoload Node with signals.
@@ -28,6 +117,7 @@ class Events:
     # Score-related events
     signal score_updated(current_score: int, cumulative_score: int)
     signal poker_hand_scored(hand: HandResource, is_row: bool, index: int)
+    signal hands_scored(row_hands: Array[HandResource], col_hands: Array[HandResource])
 
     # Round-related events
     signal round_started(round_number: int)
@@ -48,137 +138,231 @@ class Events:
     signal reroll_tokens_updated(tokens_left: int)
     """
 
-    # Event callbacks storage
-    _callbacks: Dict[str, List[Callable]] = {}
+    def __init__(self) -> None:
+        """Create empty callback storage (instantiated once as the Events autoload)."""
+        # Event callbacks storage (immutable tuples, rebuilt on connect/disconnect
+        # so emit can iterate them directly and stays safe if a callback reconnects)
+        self._callbacks: Dict[str, Tuple[Callable, ...]] = {}
+
+        # Bitmask of built-in signals with >= 1 subscriber (emit_* skip the rest)
+        self._active_signals: int = 0
+
+        # Per-signal callback tuples for the built-in signals, mirrored from _callbacks
+        # so each emit_* iterates its own instance attribute without a name lookup
+        self._cb_cell_frozen: Tuple[Callable, ...] = ()
+        self._cb_cell_unfrozen: Tuple[Callable, ...] = ()
+        self._cb_grid_updated: Tuple[Callable, ...] = ()
+        self._cb_hand_started: Tuple[Callable, ...] = ()
+        self._cb_hand_completed: Tuple[Callable, ...] = ()
+        self._cb_cards_dealt: Tuple[Callable, ...] = ()
+        self._cb_score_updated: Tuple[Callable, ...] = ()
+        self._cb_poker_hand_scored: Tuple[Callable, ...] = ()
+        self._cb_hands_scored: Tuple[Callable, ...] = ()
+        self._cb_round_started: Tuple[Callable, ...] = ()
+        self._cb_round_completed: Tuple[Callable, ...] = ()
+        self._cb_game_started: Tuple[Callable, ...] = ()
+        self._cb_game_won: Tuple[Callable, ...] = ()
+        self._cb_game_lost: Tuple[Callable, ...] = ()
+        self._cb_freeze_limit_reached: Tuple[Callable, ...] = ()
+        self._cb_hand_limit_reached: Tuple[Callable, ...] = ()
+        self._cb_columns_rerolled: Tuple[Callable, ...] = ()
+        self._cb_spin_completed: Tuple[Callable, ...] = ()
+        self._cb_reroll_tokens_updated: Tuple[Callable, ...] = ()
 
     # Grid-related events
-    @classmethod
-    def emit_cell_frozen(cls, row: int, col: int) -> None:
+    def emit_cell_frozen(self, row: int, col: int) -> None:
         """Emit cell_frozen signal."""
-        cls._emit("cell_frozen", row, col)
+        if self._active_signals & _MASK_CELL_FROZEN:
+            for callback in self._cb_cell_frozen:
+                callback(row, col)
 
-    @classmethod
-    def emit_cell_unfrozen(cls, row: int, col: int) -> None:
+    def emit_cell_unfrozen(self, row: int, col: int) -> None:
         """Emit cell_unfrozen signal."""
-        cls._emit("cell_unfrozen", row, col)
+        if self._active_signals & _MASK_CELL_UNFROZEN:
+            for callback in self._cb_cell_unfrozen:
+                callback(row, col)
 
-    @classmethod
-    def emit_grid_updated(cls) -> None:
+    def emit_grid_updated(self) -> None:
         """Emit grid_updated signal."""
-        cls._emit("grid_updated")
+        if self._active_signals & _MASK_GRID_UPDATED:
+            for callback in self._cb_grid_updated:
+                callback()
 
     # Hand-related events
-    @classmethod
-    def emit_hand_started(cls) -> None:
+    def emit_hand_started(self) -> None:
         """Emit hand_started signal."""
-        cls._emit("hand_started")
+        if self._active_signals & _MASK_HAND_STARTED:
+            for callback in self._cb_hand_started:
+                callback()
 
-    @classmethod
-    def emit_hand_completed(cls) -> None:
+    def emit_hand_completed(self) -> None:
         """Emit hand_completed signal."""
-        cls._emit("hand_completed")
+        if self._active_signals & _MASK_HAND_COMPLETED:
+            for callback in self._cb_hand_completed:
+                callback()
 
-    @classmethod
-    def emit_cards_dealt(cls) -> None:
+    def emit_cards_dealt(self) -> None:
         """Emit cards_dealt signal."""
-        cls._emit("cards_dealt")
+        if self._active_signals & _MASK_CARDS_DEALT:
+            for callback in self._cb_cards_dealt:
+                callback()
 
     # Score-related events
-    @classmethod
-    def emit_score_updated(cls, current_score: int, cumulative_score: int) -> None:
+    def emit_score_updated(self, current_score: int, cumulative_score: int) -> None:
         """Emit score_updated signal."""
-        cls._emit("score_updated", current_score, cumulative_score)
+        if self._active_signals & _MASK_SCORE_UPDATED:
+            for callback in self._cb_score_updated:
+                callback(current_score, cumulative_score)
 
-    @classmethod
-    def emit_poker_hand_scored(cls, hand: 'HandResource', is_row: bool, index: int) -> None:
+    def emit_poker_hand_scored(self, hand: 'HandResource', is_row: bool, index: int) -> None:
         """Emit poker_hand_scored signal."""
-        cls._emit("poker_hand_scored", hand, is_row, index)
+        if self._active_signals & _MASK_POKER_HAND_SCORED:
+            for callback in self._cb_poker_hand_scored:
+                callback(hand, is_row, index)
+
+    def emit_hands_scored(self, row_hands: List['HandResource'], col_hands: List['HandResource']) -> None:
+        """Emit hands_scored signal (once per grid scoring, with every line's hand)."""
+        if self._active_signals & _MASK_HANDS_SCORED:
+            for callback in self._cb_hands_scored:
+                callback(row_hands, col_hands)
 
     # Round-related events
-    @classmethod
-    def emit_round_started(cls, round_number: int) -> None:
+    def emit_round_started(self, round_number: int) -> None:
         """Emit round_started signal."""
-        cls._emit("round_started", round_number)
+        if self._active_signals & _MASK_ROUND_STARTED:
+            for callback in self._cb_round_started:
+                callback(round_number)
 
-    @classmethod
-    def emit_round_completed(cls, round_number: int, final_score: int) -> None:
+    def emit_round_completed(self, round_number: int, final_score: int) -> None:
         """Emit round_completed signal."""
-        cls._emit("round_completed", round_number, final_score)
+        if self._active_signals & _MASK_ROUND_COMPLETED:
+            for callback in self._cb_round_completed:
+                callback(round_number, final_score)
 
     # Game-related events
-    @classmethod
-    def emit_game_started(cls) -> None:
+    def emit_game_started(self) -> None:
         """Emit game_started signal."""
-        cls._emit("game_started")
+        if self._active_signals & _MASK_GAME_STARTED:
+            for callback in self._cb_game_started:
+                callback()
 
-    @classmethod
-    def emit_game_won(cls, final_score: int) -> None:
+    def emit_game_won(self, final_score: int) -> None:
         """Emit game_won signal."""
-        cls._emit("game_won", final_score)
+        if self._active_signals & _MASK_GAME_WON:
+            for callback in self._cb_game_won:
+                callback(final_score)
 
-    @classmethod
-    def emit_game_lost(cls, final_score: int) -> None:
+    def emit_game_lost(self, final_score: int) -> None:
         """Emit game_lost signal."""
-        cls._emit("game_lost", final_score)
+        if self._active_signals & _MASK_GAME_LOST:
+            for callback in self._cb_game_lost:
+                callback(final_score)
 
     # UI-related events
-    @classmethod
-    def emit_freeze_limit_reached(cls) -> None:
+    def emit_freeze_limit_reached(self) -> None:
         """Emit freeze_limit_reached signal."""
-        cls._emit("freeze_limit_reached")
+        if self._active_signals & _MASK_FREEZE_LIMIT_REACHED:
+            for callback in self._cb_freeze_limit_reached:
+                callback()
 
-    @classmethod
-    def emit_hand_limit_reached(cls) -> None:
+    def emit_hand_limit_reached(self) -> None:
         """Emit hand_limit_reached signal."""
-        cls._emit("hand_limit_reached")
+        if self._active_signals & _MASK_HAND_LIMIT_REACHED:
+            for callback in self._cb_hand_limit_reached:
+                callback()
 
     # Reroll-related events (GDD v1.1)
-    @classmethod
-    def emit_columns_rerolled(cls, column_indices: List[int], cost: int) -> None:
+    def emit_columns_rerolled(self, column_indices: List[int], cost: int) -> None:
         """Emit columns_rerolled signal."""
-        cls._emit("columns_rerolled", column_indices, cost)
+        if self._active_signals & _MASK_COLUMNS_REROLLED:
+            for callback in self._cb_columns_rerolled:
+                callback(column_indices, cost)
 
-    @classmethod
-    def emit_spin_completed(cls, spins_taken: int, total_spins: int) -> None:
+    def emit_spin_completed(self, spins_taken: int, total_spins: int) -> None:
         """Emit spin_completed signal."""
-        cls._emit("spin_completed", spins_taken, total_spins)
+        if self._active_signals & _MASK_SPIN_COMPLETED:
+            for callback in self._cb_spin_completed:
+                callback(spins_taken, total_spins)
 
-    @classmethod
-    def emit_reroll_tokens_updated(cls, tokens_left: int) -> None:
+    def emit_reroll_tokens_updated(self, tokens_left: int) -> None:
         """Emit reroll_tokens_updated signal."""
-        cls._emit("reroll_tokens_updated", tokens_left)
+        if self._active_signals & _MASK_REROLL_TOKENS_UPDATED:
+            for callback in self._cb_reroll_tokens_updated:
+                callback(tokens_left)
 
     # Core signal system
-    @classmethod
-    def connect(cls, signal_name: str, callback: Callable) -> None:
+    def connect(self, signal_name: str, callback: Callable) -> None:
         """
         Connect a callback to a signal.
         In Godot: Events.signal_name.connect(callback)
         """
-        if signal_name not in cls._callbacks:
-            cls._callbacks[signal_name] = []
-        cls._callbacks[signal_name].append(callback)
+        signal_name = sys.intern(signal_name)
+        self._set_callbacks(signal_name, self._callbacks.get(signal_name, ()) + (callback,))
 
-    @classmethod
-    def disconnect(cls, signal_name: str, callback: Callable) -> None:
+    def disconnect(self, signal_name: str, callback: Callable) -> None:
         """
         Disconnect a callback from a signal.
         In Godot: Events.signal_name.disconnect(callback)
         """
-        if signal_name in cls._callbacks:
-            cls._callbacks[signal_name].remove(callback)
-
-    @classmethod
-    def _emit(cls, signal_name: str, *args) -> None:
+        callbacks = self._callbacks.get(signal_name)
+        if callbacks is not None:
+            index = callbacks.index(callback)  # ValueError if not connected (like list.remove)
+            self._set_callbacks(signal_name, callbacks[:index] + callbacks[index + 1:])
+
+    def _set_callbacks(self, signal_name: str, callbacks: Tuple[Callable, ...]) -> None:
+        """Store a signal's callbacks and refresh its direct attribute (built-in signals)."""
+        self._callbacks[signal_name] = callbacks
+        attr = _SIGNALS.get(signal_name)
+        if attr is not None:
+            setattr(self, attr, callbacks)
+            if callbacks:
+                self._active_signals |= _SIGNAL_MASKS[signal_name]
+            else:
+                self._active_signals &= ~_SIGNAL_MASKS[signal_name]
+
+    def _emit(self, signal_name: str, *args) -> None:
         """
         Emit a signal with arguments.
         In Godot: Events.signal_name.emit(args...)
+
+        Reentrant without copying: callbacks are an immutable tuple, so a callback
+        that connects/disconnects rebinds the signal's tuple and this loop keeps
+        iterating the snapshot it started with.
         """
-        if signal_name in cls._callbacks:
-            for callback in cls._callbacks[signal_name]:
-                callback(*args)
+        for callback in self._callbacks.get(signal_name, ()):
+            callback(*args)
 
-    @classmethod
-    def clear_all_connections(cls) -> None:
+    def clear_all_connections(self) -> None:
         """Clear all signal connections (useful for cleanup/testing)."""
-        cls._callbacks.clear()
+        self._callbacks.clear()
+        self._active_signals = 0
+        for attr in _SIGNALS.values():
+            setattr(self, attr, ())
+
+
+# The autoload singleton: plain instance methods and instance attributes, so emits
+# skip classmethod binding and class-dict lookups
+Events = _EventBus()
+
+# Module-level emit functions bound to the singleton. Call sites import these
+# directly (from src.autoload.events import emit_grid_updated), so each call is a
+# single cached global/local load instead of Events + attribute lookup.
+emit_cell_frozen = Events.emit_cell_frozen
+emit_cell_unfrozen = Events.emit_cell_unfrozen
+emit_grid_updated = Events.emit_grid_updated
+emit_hand_started = Events.emit_hand_started
+emit_hand_completed = Events.emit_hand_completed
+emit_cards_dealt = Events.emit_cards_dealt
+emit_score_updated = Events.emit_score_updated
+emit_poker_hand_scored = Events.emit_poker_hand_scored
+emit_hands_scored = Events.emit_hands_scored
+emit_round_started = Events.emit_round_started
+emit_round_completed = Events.emit_round_completed
+emit_game_started = Events.emit_game_started
+emit_game_won = Events.emit_game_won
+emit_game_lost = Events.emit_game_lost
+emit_freeze_limit_reached = Events.emit_freeze_limit_reached
+emit_hand_limit_reached = Events.emit_hand_limit_reached
+emit_columns_rerolled = Events.emit_columns_rerolled
+emit_spin_completed = Events.emit_spin_completed
+emit_reroll_tokens_updated = Events.emit_reroll_tokens_updated
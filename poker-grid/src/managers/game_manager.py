@@ -35,7 +35,6 @@ class GameManager:
         from src.resources.game_state_resource import GameStateResource
         from src.resources.grid_cell_resource import GridCellResource
         from src.utils.card_factory import CardFactory
-        from src.autoload.events import Events
 
         self.config = config if config else GameConfigResource()
 
@@ -74,7 +73,7 @@ class GameManager:
             deck=deck,
             spins_left=self.config.max_spins,
             spins_taken=0,
-            frozen_cells=[],
+            frozen_cells=set(),
             current_round=0,
             cumulative_score=0,
             spin_scores=[],
@@ -89,7 +88,7 @@ class GameManager:
         Deck persists between rounds (Balatro-style).
         Emits Events.round_started signal.
         """
-        from src.autoload.events import Events
+        from src.autoload.events import emit_round_started
 
         self.state.current_round += 1
         self.state.reset_round()
@@ -102,7 +101,7 @@ class GameManager:
             self.grid_manager.auto_freeze_highest_pair()
 
         # Emit event
-        Events.emit_round_started(self.state.current_round)
+        emit_round_started(self.state.current_round)
 
     def play_spin(self) -> bool:
         """
@@ -110,18 +109,18 @@ class GameManager:
         Returns True if successful, False if no spins left.
         Emits Events.hand_started and Events.hand_completed signals.
         """
-        from src.autoload.events import Events
+        from src.autoload.events import emit_hand_limit_reached, emit_hand_started, emit_hand_completed
 
         if self.state.spins_left <= 0:
-            Events.emit_hand_limit_reached()
+            emit_hand_limit_reached()
             return False
 
-        Events.emit_hand_started()
+        emit_hand_started()
 
         # Deal new grid (all 25 cells)
         self.grid_manager.deal_grid()
 
-        Events.emit_hand_completed()
+        emit_hand_completed()
 
         return True
 
@@ -131,7 +130,7 @@ class GameManager:
         Emits Events.cell_frozen or Events.cell_unfrozen signals.
         Only works if freeze system is enabled.
         """
-        from src.autoload.events import Events
+        from src.autoload.events import emit_cell_unfrozen, emit_cell_frozen, emit_freeze_limit_reached
 
         # Check if freeze system is enabled
         if not self.config.enable_freeze:
@@ -146,15 +145,15 @@ class GameManager:
         # If already frozen, unfreeze it
         if cell.is_frozen:
             self.state.unfreeze_cell(row, col)
-            Events.emit_cell_unfrozen(row, col)
+            emit_cell_unfrozen(row, col)
             return True, f"Unfroze cell ({row}, {col})"
 
         # Try to freeze it
         if self.state.freeze_cell(row, col):
-            Events.emit_cell_frozen(row, col)
+            emit_cell_frozen(row, col)
             return True, f"Froze cell ({row}, {col})"
         else:
-            Events.emit_freeze_limit_reached()
+            emit_freeze_limit_reached()
             return False, f"Max freezes reached ({self.config.max_freezes})"
 
     def unfreeze_all(self) -> None:
@@ -163,13 +162,13 @@ class GameManager:
         Only works if freeze system is enabled.
         Emits Events.grid_updated signal.
         """
-        from src.autoload.events import Events
+        from src.autoload.events import emit_grid_updated
 
         if not self.config.enable_freeze:
             return
 
         self.state.unfreeze_all()
-        Events.emit_grid_updated()
+        emit_grid_updated()
 
     def auto_refreeze_if_better(self) -> None:
         """
@@ -210,13 +209,13 @@ class GameManager:
         Get the final session result (WIN/LOSE).
         Emits Events.game_won or Events.game_lost signals.
         """
-        from src.autoload.events import Events
+        from src.autoload.events import emit_game_won, emit_game_lost
 
         if self.is_quota_met():
-            Events.emit_game_won(self.state.cumulative_score)
+            emit_game_won(self.state.cumulative_score)
             return "WIN"
         else:
-            Events.emit_game_lost(self.state.cumulative_score)
+            emit_game_lost(self.state.cumulative_score)
             return "LOSE"
 
     def reroll_columns(self, column_indices: List[int]) -> Tuple[bool, str]:
@@ -252,7 +251,7 @@ class GameManager:
         Returns dict with 'currency_type', 'amount', 'bonus', 'early_completion'.
         Emits Events.round_completed signal.
         """
-        from src.autoload.events import Events
+        from src.autoload.events import emit_round_completed
 
         # Determine if player completed early (with spins remaining)
         early_completion = self.state.spins_left > 0
@@ -286,7 +285,7 @@ class GameManager:
                 'early_completion': early_completion
             }
 
-        Events.emit_round_completed(self.state.current_round, self.state.cumulative_score)
+        emit_round_completed(self.state.current_round, self.state.cumulative_score)
         self.state.complete_round()
 
         return result
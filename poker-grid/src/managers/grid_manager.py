@@ -34,22 +34,17 @@ class GridManager:
         Cards are drawn WITH replacement (duplicates allowed).
         Emits Events.cards_dealt signal.
         """
-        from src.autoload.events import Events
+        from src.autoload.events import emit_cards_dealt, emit_grid_updated
 
-        for row_idx in range(self.config.grid_rows):
-            for col_idx in range(self.config.grid_cols):
-                cell = self.state.grid[row_idx][col_idx]
-
-                # Skip frozen cells
-                if cell.is_frozen:
-                    continue
+        # Skip frozen cells
+        cells = [cell for cell in self.state.cells if not cell.is_frozen]
 
-                # Draw from the shared deck (with replacement)
-                card = self.state.deck.draw_random()
-                cell.set_card(card)
+        # Draw from the shared deck (with replacement), one RNG call for all cells
+        for cell, card in zip(cells, self.state.deck.draw_random_bulk(len(cells))):
+            cell.set_card(card)
 
-        Events.emit_cards_dealt()
-        Events.emit_grid_updated()
+        emit_cards_dealt()
+        emit_grid_updated()
 
     def auto_freeze_highest_pair(self) -> None:
         """
@@ -151,10 +146,8 @@ class GridManager:
 
     def get_row_cards(self, row_index: int) -> List['CardResource']:
         """Get all cards in a row."""
-        return [cell.card for cell in self.state.grid[row_index] if cell.card]
+        return self.state.get_row(row_index)
 
     def get_col_cards(self, col_index: int) -> List['CardResource']:
         """Get all cards in a column."""
-        return [self.state.grid[row][col_index].card
-                for row in range(self.config.grid_rows)
-                if self.state.grid[row][col_index].card]
+        return self.state.get_col(col_index)
@@ -33,6 +33,9 @@ class JokerManager:
         self.active_jokers: List['JokerResource'] = []
         self.max_slots = max_slots
 
+        # Bumped whenever the joker set changes (lets ScoreManager drop cached effects)
+        self._version: int = 0
+
     def add_joker(self, joker: 'JokerResource') -> bool:
         """
         Add a joker to active slots.
@@ -42,11 +45,13 @@ class JokerManager:
             return False
 
         self.active_jokers.append(joker)
+        self._version += 1
         return True
 
     def remove_joker(self, index: int) -> 'JokerResource':
         """Remove and return joker at index."""
         if 0 <= index < len(self.active_jokers):
+            self._version += 1
             return self.active_jokers.pop(index)
         return None
 
@@ -58,6 +63,17 @@ class JokerManager:
         """Get number of active jokers."""
         return len(self.active_jokers)
 
+    def get_version(self) -> int:
+        """Get the joker set version (incremented on every add/remove)."""
+        return self._version
+
+    def has_per_line_growth(self) -> bool:
+        """Check if any joker grows each time it scores a line (effects have side effects)."""
+        return any(
+            joker.effect_type == "growing" and joker.grow_per == "line"
+            for joker in self.active_jokers
+        )
+
     def apply_joker_effects(
         self,
         hand: 'HandResource',
@@ -190,11 +206,8 @@ class JokerManager:
             elif bonus_type == "++":
                 # Special: both chips and mult (Scholar, Walkie Talkie)
                 count = self._count_matching_cards(joker, cards)
-                values = str(joker.bonus_value).split("c")
-                add_chips = int(values[0]) * count
-                add_mult = int(values[1].replace("m", "")) * count
-                chips += add_chips
-                mult += add_mult
+                chips += joker.combo_chips * count
+                mult += joker.combo_mult * count
 
         # Special cases
         if joker.condition_type == "card_position" and joker.condition_value == "first_face":
@@ -6,6 +6,8 @@ In Godot: extends Node
 
 from typing import List, Tuple
 
+from src.autoload.events import emit_columns_rerolled, emit_spin_completed
+
 
 class RerollManager:
     """
@@ -47,10 +49,11 @@ class RerollManager:
         if not column_indices:
             return False, "No columns specified"
 
-        # Check if all indices are valid
-        for col in column_indices:
-            if not (0 <= col < self.config.grid_cols):
-                return False, f"Invalid column index: {col}"
+        # Check if all indices are valid (min/max bound check; scan only to report)
+        grid_cols = self.config.grid_cols
+        if min(column_indices) < 0 or max(column_indices) >= grid_cols:
+            col = next(col for col in column_indices if not (0 <= col < grid_cols))
+            return False, f"Invalid column index: {col}"
 
         # Calculate cost
         cost = len(column_indices) * self.config.cost_per_column_reroll
@@ -71,8 +74,6 @@ class RerollManager:
         Returns:
             (success, message) tuple
         """
-        from src.autoload.events import Events
-
         # Validate
         can_reroll, message = self.can_reroll_columns(column_indices)
         if not can_reroll:
@@ -85,32 +86,23 @@ class RerollManager:
         if not self.state.spend_reroll_tokens(cost):
             return False, "Failed to spend tokens"
 
-        # Reroll each column (only unfrozen cells)
-        for col in column_indices:
-            self._reroll_column(col)
+        # Reroll the selected columns (only unfrozen cells), drawing all cards at once
+        flat = self.state.cells
+        num_cols = self.config.grid_cols
+        cells = [
+            cell
+            for col in column_indices
+            for cell in flat[col::num_cols]
+            if not cell.is_frozen
+        ]
+        for cell, new_card in zip(cells, self.state.deck.draw_random_bulk(len(cells))):
+            cell.set_card(new_card)
 
         # Emit event
-        Events.emit_columns_rerolled(column_indices, cost)
+        emit_columns_rerolled(column_indices, cost)
 
         return True, f"Rerolled {len(column_indices)} column(s) for {cost} token(s)"
 
-    def _reroll_column(self, col: int) -> None:
-        """
-        Reroll a single column by redrawing unfrozen cells.
-
-        Args:
-            col: Column index to reroll
-        """
-        # Redraw each cell in the column (respecting freeze state)
-        for row in range(self.config.grid_rows):
-            cell = self.state.grid[row][col]
-
-            # Only redraw if not frozen
-            if not cell.is_frozen:
-                # Draw a new card from the shared deck
-                new_card = self.state.deck.draw_random()
-                cell.set_card(new_card)
-
     def get_reroll_cost(self, num_columns: int) -> int:
         """
         Calculate the cost to reroll N columns.
@@ -133,10 +125,8 @@ class RerollManager:
 
     def complete_spin(self) -> None:
         """Mark a spin as completed."""
-        from src.autoload.events import Events
-
         self.state.spins_taken += 1
-        Events.emit_spin_completed(self.state.spins_taken, self.config.spins_per_quota)
+        emit_spin_completed(self.state.spins_taken, self.config.spins_per_quota)
 
     def is_quota_complete(self) -> bool:
         """Check if all spins for this quota are used."""
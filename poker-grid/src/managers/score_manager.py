@@ -4,7 +4,15 @@ Manages scoring operations: evaluate hands, update scores.
 In Godot: extends Node
 """
 
-from typing import Tuple, List, Optional
+import heapq
+from typing import Dict, Tuple, List, Optional
+
+from src.autoload.events import emit_hands_scored, emit_poker_hand_scored, emit_score_updated
+from src.resources.hand_resource import HandResource
+from src.utils.poker_evaluator import PokerEvaluator
+
+# Max distinct line evaluations kept before the line cache is cleared
+_LINE_CACHE_MAX = 4096
 
 
 class ScoreManager:
@@ -35,6 +43,25 @@ class ScoreManager:
         self.config = config
         self.joker_manager = joker_manager
 
+        # Last scoring result, reused while the grid and jokers are unchanged
+        self._score_cache_key = None
+        self._score_cache_val = None
+
+        # Per-line evaluation cache: CardResource.code of each card in line order ->
+        # (hand_type, chips, mult, sorted card order). Rerolling one column leaves
+        # the other columns and the unchanged row cards hitting this cache.
+        self._line_cache: Dict[tuple, tuple] = {}
+
+        # Joker results per line: card-code key -> (final_chips, final_mult).
+        # Valid for one joker signature; bypassed while a joker grows per line
+        self._joker_effect_cache: Dict[tuple, Tuple[int, int]] = {}
+        self._joker_effect_signature = None
+        self._joker_effect_cacheable = False
+
+        # Scratch buffer for ranking scored lines, cleared and refilled each
+        # scoring (row_hands/col_hands are returned and cached, so stay fresh)
+        self._all_lines: List[tuple] = []
+
     def score_current_grid(self) -> Tuple[int, List['HandResource'], List['HandResource'], List[dict]]:
         """
         Score all rows and columns using flat chip scoring.
@@ -43,7 +70,9 @@ class ScoreManager:
         NEW: Only top 3 scoring lines count towards total_score (including ties).
         top_lines is a list of dicts with: {'type': 'row'/'col', 'index': int, 'score': int, 'rank': int}
 
-        Emits Events.poker_hand_scored for each poker hand evaluated.
+        Emits Events.poker_hand_scored for each poker hand evaluated, then
+        Events.hands_scored once with all row and column hands (listeners that
+        redraw per spin should prefer the batched signal).
 
         Scoring Formula (new system):
         - Each hand has flat chips (no per-hand mult)
@@ -51,22 +80,51 @@ class ScoreManager:
         - Jokers can add global +chips, +mult, or ×mult (applied when implemented)
         - Current: score = chips × 1 = chips (joker system pending)
         - Only top 3 lines are summed for total score
+
+        Results are cached per grid fingerprint, so re-scoring an unchanged
+        grid (e.g. reroll preview followed by play_hand) returns the cached
+        tuple without re-emitting events.
         """
-        from src.utils.poker_evaluator import PokerEvaluator
-        from src.autoload.events import Events
+        # Key is taken before scoring: growing jokers change their bonus while
+        # scoring, so they naturally miss the cache on the next call
+        joker_signature = self._get_joker_signature()
+        cache_key = (
+            self.state.grid_fingerprint(),
+            joker_signature,
+            self.config.lines_scored_per_spin,
+        )
+        if cache_key == self._score_cache_key:
+            return self._score_cache_val
+
+        if joker_signature != self._joker_effect_signature:
+            self._joker_effect_cache.clear()
+            self._joker_effect_signature = joker_signature
+        self._joker_effect_cacheable = bool(self.joker_manager) and not self.joker_manager.has_per_line_growth()
 
         row_hands = []
         col_hands = []
-        all_lines = []  # Track all scored lines for ranking
+        # Scored lines as (-score, 0 for row / 1 for col, index, hand): plain
+        # tuple order is the ranking order, so no key function is needed
+        all_lines = self._all_lines
+        all_lines.clear()
+
+        # Read all cells once; rows and columns are slices of this flat list.
+        # Line keys are slices of the matching tuple of card codes (0 = empty)
+        cards_flat = self.state.get_card_snapshot()
+        codes_flat = tuple([card.code if card else 0 for card in cards_flat])
+        num_cols = self.config.grid_cols
 
         # Score all rows (local chip × mult + jokers)
         for row_idx in range(self.config.grid_rows):
-            cards = self.state.get_row(row_idx)
+            cards = cards_flat[row_idx * num_cols:(row_idx + 1) * num_cols]
+            if not all(cards):
+                cards = [card for card in cards if card]  # Skip empty cells
             if len(cards) == 5:
-                hand = PokerEvaluator.evaluate_hand(cards)
+                line_key = codes_flat[row_idx * num_cols:(row_idx + 1) * num_cols]
+                hand = self._evaluate_line(cards, line_key)
 
                 # Apply joker effects
-                final_chips, final_mult = self._apply_jokers_to_hand(hand, cards)
+                final_chips, final_mult = self._apply_jokers_to_hand(hand, cards, line_key)
 
                 # Calculate line score with jokers
                 line_score = final_chips * final_mult
@@ -76,22 +134,20 @@ class ScoreManager:
                 hand.mult = final_mult
 
                 row_hands.append(hand)
-                all_lines.append({
-                    'type': 'row',
-                    'index': row_idx,
-                    'score': line_score,
-                    'hand': hand
-                })
-                Events.emit_poker_hand_scored(hand, is_row=True, index=row_idx)
+                all_lines.append((-line_score, 0, row_idx, hand))
+                emit_poker_hand_scored(hand, is_row=True, index=row_idx)
 
         # Score all columns (local chip × mult + jokers)
-        for col_idx in range(self.config.grid_cols):
-            cards = self.state.get_col(col_idx)
+        for col_idx in range(num_cols):
+            cards = cards_flat[col_idx::num_cols]
+            if not all(cards):
+                cards = [card for card in cards if card]  # Skip empty cells
             if len(cards) == 5:
-                hand = PokerEvaluator.evaluate_hand(cards)
+                line_key = codes_flat[col_idx::num_cols]
+                hand = self._evaluate_line(cards, line_key)
 
                 # Apply joker effects
-                final_chips, final_mult = self._apply_jokers_to_hand(hand, cards)
+                final_chips, final_mult = self._apply_jokers_to_hand(hand, cards, line_key)
 
                 # Calculate line score with jokers
                 line_score = final_chips * final_mult
@@ -101,20 +157,50 @@ class ScoreManager:
                 hand.mult = final_mult
 
                 col_hands.append(hand)
-                all_lines.append({
-                    'type': 'col',
-                    'index': col_idx,
-                    'score': line_score,
-                    'hand': hand
-                })
-                Events.emit_poker_hand_scored(hand, is_row=False, index=col_idx)
+                all_lines.append((-line_score, 1, col_idx, hand))
+                emit_poker_hand_scored(hand, is_row=False, index=col_idx)
+
+        emit_hands_scored(row_hands, col_hands)
 
         # Identify top-K scoring lines (including ties)
         top_lines, total_score = self._get_top_lines(all_lines)
 
-        return total_score, row_hands, col_hands, top_lines
+        self._score_cache_key = cache_key
+        self._score_cache_val = (total_score, row_hands, col_hands, top_lines)
+        return self._score_cache_val
 
-    def _get_top_lines(self, all_lines: List[dict]) -> Tuple[List[dict], int]:
+    def _evaluate_line(self, cards: List['CardResource'], key: Optional[tuple] = None) -> 'HandResource':
+        """
+        Evaluate a 5-card line, reusing the cached evaluation for identical cards.
+        Always returns a fresh HandResource (callers write joker-modified chips/mult
+        onto it), and jokers are still applied per call since growing jokers
+        change on every application.
+        """
+        if key is None:
+            key = tuple([card.code for card in cards])
+        cached = self._line_cache.get(key)
+        if cached is None:
+            hand = PokerEvaluator.evaluate_hand(cards)
+            # Same stable descending sort the evaluator applies to hand.cards
+            order = tuple(sorted(range(len(cards)), key=lambda i: cards[i].get_rank_value(), reverse=True))
+            if len(self._line_cache) >= _LINE_CACHE_MAX:
+                self._line_cache.clear()
+            self._line_cache[key] = (hand.hand_type, hand.chips, hand.mult, order)
+            return hand
+
+        hand_type, chips, mult, order = cached
+        return HandResource(cards=[cards[i] for i in order], hand_type=hand_type, chips=chips, mult=mult)
+
+    def _get_joker_signature(self) -> tuple:
+        """Identity and current bonus of each active joker (part of the score cache key)."""
+        if not self.joker_manager:
+            return ()
+        return (
+            self.joker_manager.get_version(),
+            tuple((id(joker), joker.current_bonus) for joker in self.joker_manager.active_jokers),
+        )
+
+    def _get_top_lines(self, all_lines: List[tuple]) -> Tuple[List[dict], int]:
         """
         Get top 3 scoring lines with deterministic priority (rows before cols).
         Returns (top_lines, total_score).
@@ -131,19 +217,19 @@ class ScoreManager:
         if not all_lines:
             return [], 0
 
-        # Define priority: rows first (0-4), then cols (0-4)
-        def get_priority(line):
-            if line['type'] == 'row':
-                return (0, line['index'])  # rows come first
-            else:  # 'col'
-                return (1, line['index'])  # cols come second
-
-        # Sort by: 1) score descending, 2) priority (rows before cols, then by index)
-        sorted_lines = sorted(all_lines, key=lambda x: (-x['score'], get_priority(x)))
-
-        # Take top-K positions
-        k = max(0, min(self.config.lines_scored_per_spin, len(sorted_lines)))
-        top_k_positions = sorted_lines[:k]
+        # Order by: 1) score descending, 2) priority (rows before cols, then by index)
+        # Take top-K positions with a k-sized heap instead of sorting every line;
+        # (type, index) is unique, so comparisons never reach the hand
+        k = max(0, min(self.config.lines_scored_per_spin, len(all_lines)))
+        top_k_positions = [
+            {
+                'type': 'col' if is_col else 'row',
+                'index': index,
+                'score': -neg_score,
+                'hand': hand
+            }
+            for neg_score, is_col, index, hand in heapq.nsmallest(k, all_lines)
+        ]
 
         if not top_k_positions:
             return [], 0
@@ -166,30 +252,46 @@ class ScoreManager:
 
         return top_k_positions, total_score
 
-    def _apply_jokers_to_hand(self, hand: 'HandResource', cards: List['CardResource']) -> Tuple[int, int]:
+    def _apply_jokers_to_hand(
+        self,
+        hand: 'HandResource',
+        cards: List['CardResource'],
+        key: Optional[tuple] = None
+    ) -> Tuple[int, int]:
         """
         Apply joker effects to a single hand/line.
         Returns (final_chips, final_mult) after joker modifications.
+
+        With a line key, results are reused while the joker signature is unchanged
+        (effects depend only on the cards, their hand and the jokers), unless a
+        joker grows per line and so must run on every application.
         """
         base_chips = hand.chips
         base_mult = hand.mult
 
-        if self.joker_manager:
-            return self.joker_manager.apply_joker_effects(hand, cards, base_chips, base_mult)
-        else:
+        if not self.joker_manager:
             return base_chips, base_mult
 
+        if key is None or not self._joker_effect_cacheable:
+            return self.joker_manager.apply_joker_effects(hand, cards, base_chips, base_mult)
+
+        result = self._joker_effect_cache.get(key)
+        if result is None:
+            result = self.joker_manager.apply_joker_effects(hand, cards, base_chips, base_mult)
+            if len(self._joker_effect_cache) >= _LINE_CACHE_MAX:
+                self._joker_effect_cache.clear()
+            self._joker_effect_cache[key] = result
+        return result
+
     def score_and_update(self) -> Tuple[int, List['HandResource'], List['HandResource'], List[dict]]:
         """
         Score the current grid and update cumulative score.
         Returns (current_score, row_hands, col_hands, top_lines).
         Emits Events.score_updated signal.
         """
-        from src.autoload.events import Events
-
         current_score, row_hands, col_hands, top_lines = self.score_current_grid()
         self.state.update_score(current_score)
 
-        Events.emit_score_updated(current_score, self.state.cumulative_score)
+        emit_score_updated(current_score, self.state.cumulative_score)
 
         return current_score, row_hands, col_hands, top_lines
@@ -4,8 +4,10 @@ Manages shop inventory, buying/selling jokers, and rerolls.
 In Godot: extends Node
 """
 
+import bisect
+import itertools
 import random
-from typing import List, Optional, Tuple
+from typing import Dict, FrozenSet, List, Optional, Sequence, Set, Tuple
 
 from src.resources.joker_resource import JokerResource
 from src.managers.joker_manager import JokerManager
@@ -42,7 +44,7 @@ class ShopManager:
         self,
         state: 'GameStateResource',
         joker_manager: JokerManager,
-        available_jokers: List[JokerResource],
+        available_jokers: Sequence[JokerResource],
         config: 'GameConfigResource' = None
     ):
         """
@@ -52,7 +54,7 @@ class ShopManager:
         Args:
             state: Game state (for money/token tracking)
             joker_manager: Manager for player's active jokers
-            available_jokers: Pool of all available jokers (from CSV)
+            available_jokers: Pool of all available jokers (from CSV, treated as read-only)
             config: Game configuration (for token system toggle)
         """
         self.state = state
@@ -60,6 +62,29 @@ class ShopManager:
         self.available_jokers = available_jokers
         self.config = config
 
+        # Shop-eligible rarities (weight > 0) and their weights, in the same order.
+        # Read from self.RARITY_WEIGHTS once per shop, so subclass overrides apply.
+        self._rarity_list: List[str] = [
+            rarity for rarity, weight in self.RARITY_WEIGHTS.items() if weight > 0
+        ]
+        self._rarity_weight_list: List[int] = [
+            self.RARITY_WEIGHTS[rarity] for rarity in self._rarity_list
+        ]
+
+        # Rarity-bucketed pool, indexed once (available_jokers is read-only).
+        # Shop-excluded rarities (weight 0) never enter a bucket.
+        self._pool_by_rarity: Dict[str, List[JokerResource]] = {
+            rarity: [] for rarity in self._rarity_list
+        }
+        for joker in available_jokers:
+            bucket = self._pool_by_rarity.get(joker.rarity)
+            if bucket is not None:
+                bucket.append(joker)
+        self._pool_ids_by_rarity: Dict[str, FrozenSet[str]] = {
+            rarity: frozenset(joker.id for joker in bucket)
+            for rarity, bucket in self._pool_by_rarity.items()
+        }
+
         # Shop state
         self.shop_inventory: List[Optional[JokerResource]] = []
         self.reroll_count: int = 0
@@ -81,60 +106,52 @@ class ShopManager:
         """
         self.shop_inventory = []
 
-        # Get jokers player already owns
-        owned_joker_ids = {joker.id for joker in self.joker_manager.active_jokers}
-
-        # Filter available jokers (not owned, available in shop)
-        available_pool = [
-            joker for joker in self.available_jokers
-            if joker.id not in owned_joker_ids
-            and self.RARITY_WEIGHTS.get(joker.rarity, 0) > 0
-        ]
+        # Owned and already-shown jokers are excluded; the buckets stay intact
+        banned = {joker.id for joker in self.joker_manager.active_jokers}
 
-        # Generate up to SHOP_SLOTS jokers
-        selected_ids = set()  # Track selected to avoid duplicates
+        # Total weight per rarity over its non-owned jokers, computed once per
+        # inventory (owned jokers only change between inventories)
+        rarity_weights = []
+        for rarity, weight in zip(self._rarity_list, self._rarity_weight_list):
+            pool_ids = self._pool_ids_by_rarity[rarity]
+            rarity_weights.append(weight * (len(pool_ids) - len(pool_ids & banned)))
 
         for _ in range(self.SHOP_SLOTS):
-            # Filter out already selected jokers
-            remaining_pool = [
-                joker for joker in available_pool
-                if joker.id not in selected_ids
-            ]
-
-            if not remaining_pool:
-                # No more jokers available, add empty slot
-                self.shop_inventory.append(None)
-                continue
-
-            # Select random joker weighted by rarity
-            selected_joker = self._select_random_by_rarity(remaining_pool)
+            # Select random joker weighted by rarity (None once pool exhausted)
+            selected_joker = self._select_random_by_rarity(banned, rarity_weights)
+            self.shop_inventory.append(selected_joker)
 
             if selected_joker:
-                self.shop_inventory.append(selected_joker)
-                selected_ids.add(selected_joker.id)
-            else:
-                self.shop_inventory.append(None)
+                banned.add(selected_joker.id)
 
-    def _select_random_by_rarity(self, joker_pool: List[JokerResource]) -> Optional[JokerResource]:
+    def _select_random_by_rarity(
+        self, banned: Set[str], rarity_weights: List[int]
+    ) -> Optional[JokerResource]:
         """
-        Select a random joker from pool, weighted by rarity.
+        Select a random joker not in banned, weighted by rarity.
+
+        rarity_weights holds each rarity's per-joker weight times its number of
+        eligible jokers, so every joker keeps the same odds as a flat weighted
+        draw; the picked rarity's entry is reduced by one joker's weight. The
+        rarity comes from one bisect over the cumulative weights; within the
+        bucket, rejection-sample until an eligible joker hits.
 
         Returns:
-            Selected joker or None if pool is empty
+            Selected joker or None if no eligible joker remains
         """
-        if not joker_pool:
-            return None
-
-        # Build weighted list
-        weighted_jokers = []
-        for joker in joker_pool:
-            weight = self.RARITY_WEIGHTS.get(joker.rarity, 0)
-            weighted_jokers.extend([joker] * weight)
+        cumulative = list(itertools.accumulate(rarity_weights))
+        total = cumulative[-1] if cumulative else 0
 
-        if not weighted_jokers:
+        if not total:
             return None
 
-        return random.choice(weighted_jokers)
+        rarity_index = bisect.bisect_right(cumulative, random.randrange(total))
+        rarity_weights[rarity_index] -= self._rarity_weight_list[rarity_index]
+        bucket = self._pool_by_rarity[self._rarity_list[rarity_index]]
+        while True:
+            joker = random.choice(bucket)
+            if joker.id not in banned:
+                return joker
 
     def buy_joker(self, shop_index: int) -> Tuple[bool, str]:
         """
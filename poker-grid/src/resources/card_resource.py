@@ -4,22 +4,41 @@ Represents a playing card as a custom Resource.
 In Godot: extends Resource
 """
 
-from dataclasses import dataclass
-from typing import ClassVar, Dict
+from dataclasses import dataclass, field
+from typing import ClassVar, Dict, Tuple
 
+from src.resources.game_config_resource import GameConfigResource, RANK_VALUE_TABLE
 
-@dataclass
+# Formatted display strings per (rank, suit), filled on first use (one per distinct card)
+_DISPLAY_PLAIN: Dict[Tuple[str, str], str] = {}
+_DISPLAY_COLORED: Dict[Tuple[str, str], str] = {}
+
+# Spelled-out suit names also accepted by CardResource (tests and tools use them)
+_SUIT_NAMES = ("Heart", "Hearts", "Diamond", "Diamonds", "Club", "Clubs", "Spade", "Spades")
+
+# Suit -> small int for CardResource.code (config suits first). Every accepted
+# spelling keeps its own index, so equal codes mean equal suit strings.
+_SUIT_INDEX: Dict[str, int] = {
+    suit: i for i, suit in enumerate((*GameConfigResource.SUITS, *_SUIT_NAMES))
+}
+
+
+@dataclass(frozen=True, slots=True)
 class CardResource:
     """
     Represents a single playing card.
     In Godot, this would extend Resource with @export vars.
 
+    Frozen and slotted: cards are immutable values (hashable by rank and suit)
+    with no per-instance __dict__; replace a card instead of editing it.
+
     GDScript equivalent:
     class_name CardResource
     extends Resource
 
     @export var rank: String
     @export var suit: String
+    var code: int  # rank value (2-14) | suit index << 4
     """
 
     # Class constants (would be const in Godot)
@@ -41,6 +60,19 @@ class CardResource:
 
     rank: str  # "2"-"9", "T", "J", "Q", "K", "A"
     suit: str  # "H", "D", "C", "S"
+    # Rank value in the low 4 bits, suit index above (set in __post_init__);
+    # lets scoring key and classify lines on ints instead of string pairs
+    code: int = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        """Validate rank/suit and compute the packed integer code (frozen, so set via object.__setattr__)."""
+        rank_value = GameConfigResource.RANK_VALUES.get(self.rank)
+        if rank_value is None:
+            raise ValueError(f"Unknown card rank: {self.rank!r}")
+        suit_index = _SUIT_INDEX.get(self.suit)
+        if suit_index is None:
+            raise ValueError(f"Unknown card suit: {self.suit!r}")
+        object.__setattr__(self, "code", rank_value | suit_index << 4)
 
     def get_display_string(self, colored: bool = False) -> str:
         """
@@ -52,22 +84,32 @@ class CardResource:
         Returns:
             Formatted card string (e.g., "A♥" or colored version)
         """
-        suit_symbol = self.SUIT_SYMBOLS.get(self.suit, self.suit)
-
-        if colored:
-            suit_color = self.SUIT_COLORS.get(self.suit, "")
-            return f"{self.rank}{suit_color}{suit_symbol}{self.COLOR_RESET}"
-        else:
-            return f"{self.rank}{suit_symbol}"
+        key = (self.rank, self.suit)
+        table = _DISPLAY_COLORED if colored else _DISPLAY_PLAIN
+        display = table.get(key)
+        if display is None:
+            suit_symbol = self.SUIT_SYMBOLS.get(self.suit, self.suit)
+            if colored:
+                suit_color = self.SUIT_COLORS.get(self.suit, "")
+                display = f"{self.rank}{suit_color}{suit_symbol}{self.COLOR_RESET}"
+            else:
+                display = f"{self.rank}{suit_symbol}"
+            table[key] = display
+        return display
 
     def get_rank_value(self) -> int:
-        """Returns numeric value for comparison (from config)."""
-        from src.resources.game_config_resource import GameConfigResource
-        return GameConfigResource.RANK_VALUES[self.rank]
+        """
+        Returns numeric value for comparison (config RANK_VALUES, via its byte table).
+        The rank was validated in __post_init__, so the table never yields 0 here.
+        """
+        return RANK_VALUE_TABLE[ord(self.rank)]
 
     def duplicate(self) -> 'CardResource':
-        """Create a copy of this card (Resource pattern)."""
-        return CardResource(rank=self.rank, suit=self.suit)
+        """
+        Return a copy of this card (Resource pattern).
+        Cards are immutable, so the card itself is returned.
+        """
+        return self
 
     def __str__(self) -> str:
         return self.get_display_string(colored=True)
@@ -9,7 +9,7 @@ from typing import List, Optional
 import random
 
 
-@dataclass
+@dataclass(slots=True)
 class DeckResource:
     """
     Represents the player's single persistent deck (Balatro-style).
@@ -47,6 +47,24 @@ class DeckResource:
         self._emit_card_drawn(drawn_card)
         return drawn_card
 
+    def draw_random_bulk(self, count: int) -> List['CardResource']:
+        """
+        Draw count random cards WITH replacement in one RNG call.
+        Same distribution as count draw_random() calls (card_drawn fires per card),
+        but random.choices consumes the RNG differently from random.choice, so a
+        seeded run draws different cards than the per-card loop did. All card_drawn
+        signals fire before the caller places any of the cards.
+        """
+        if not self.cards:
+            raise ValueError("Cannot draw from empty deck")
+
+        drawn_cards = [card.duplicate() for card in random.choices(self.cards, k=count)]
+
+        if self._on_card_drawn_callback:
+            for drawn_card in drawn_cards:
+                self._on_card_drawn_callback(drawn_card)
+        return drawn_cards
+
     def add_card(self, card: 'CardResource') -> None:
         """
         Add a card to the deck (for future deck mutation mechanics).
@@ -91,7 +109,7 @@ class DeckResource:
         self._on_card_drawn_callback = callback
 
     def duplicate(self) -> 'DeckResource':
-        """Create a copy of this deck (Resource pattern)."""
+        """Create a copy of this deck (Resource pattern; immutable cards are shared)."""
         return DeckResource(
-            cards=[card.duplicate() for card in self.cards]
+            cards=self.cards.copy()
         )
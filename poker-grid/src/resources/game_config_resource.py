@@ -5,7 +5,8 @@ In Godot: extends Resource with @export properties
 """
 
 from dataclasses import dataclass
-from typing import ClassVar, Dict, List
+from enum import IntEnum
+from typing import ClassVar, Dict, List, Tuple
 
 
 @dataclass
@@ -89,13 +90,14 @@ class GameConfigResource:
     # Per-round quotas (cumulative) - based on simulation data
     # Balanced for flat chip scoring without jokers (baseline)
     # With jokers, these become easier (expected progression)
-    round_quotas: List[int] = None
+    # Stored as an immutable tuple, so copies can share it
+    round_quotas: Tuple[int, ...] = None
 
     def __post_init__(self):
-        """Initialize mutable defaults after dataclass init."""
+        """Initialize defaults after dataclass init (round_quotas becomes a tuple)."""
         if self.round_quotas is None:
             # Adjusted for 5 spins (approximately 5/7 of original 7-spin quotas)
-            self.round_quotas = [
+            self.round_quotas = (
                 300,   # Round 1: ~286 scaled to 300
                 600,   # Round 2: ~593
                 920,   # Round 3: ~918
@@ -104,7 +106,9 @@ class GameConfigResource:
                 1960,  # Round 6: ~1957
                 2330,  # Round 7: ~2325
                 2710   # Round 8: ~2703 (final challenge)
-            ]
+            )
+        else:
+            self.round_quotas = tuple(self.round_quotas)
 
     # Future toggles
     use_global_replacement: bool = False
@@ -122,7 +126,7 @@ class GameConfigResource:
             cards_per_deck=self.cards_per_deck,
             rounds_per_session=self.rounds_per_session,
             quota_target=self.quota_target,
-            round_quotas=self.round_quotas.copy(),
+            round_quotas=self.round_quotas,
             use_global_replacement=self.use_global_replacement,
             use_token_system=self.use_token_system,
             tokens_per_round=self.tokens_per_round,
@@ -131,3 +135,37 @@ class GameConfigResource:
             cost_per_column_reroll=self.cost_per_column_reroll,
             spins_per_quota=self.spins_per_quota
         )
+
+
+# RANK_VALUES as a byte table indexed by ord(rank) (ranks are single characters),
+# so card rank values are read without hashing the rank string. Entry 0 means
+# "not a rank": only index it with ranks already checked against RANK_VALUES
+RANK_VALUE_TABLE = bytearray(128)
+for _rank, _value in GameConfigResource.RANK_VALUES.items():
+    RANK_VALUE_TABLE[ord(_rank)] = _value
+RANK_VALUE_TABLE = bytes(RANK_VALUE_TABLE)
+del _rank, _value
+
+
+class HandType(IntEnum):
+    """
+    Hand types as small ints, in HAND_SCORES order (best first).
+    In Godot: enum HandType { FIVE_KIND, ROYAL_FLUSH, ... }
+    """
+    FIVE_KIND = 0
+    ROYAL_FLUSH = 1
+    STRAIGHT_FLUSH = 2
+    FOUR_KIND = 3
+    FULL_HOUSE = 4
+    FLUSH = 5
+    STRAIGHT = 6
+    THREE_KIND = 7
+    TWO_PAIR = 8
+    ONE_PAIR = 9
+    HIGH_CARD = 10
+
+
+# HAND_SCORES flattened into tuples indexed by HandType, so scoring an evaluated
+# hand is a tuple index instead of a string-keyed dict lookup
+HAND_TYPE_NAMES: Tuple[str, ...] = tuple(GameConfigResource.HAND_SCORES)
+HAND_SCORE_TABLE: Tuple[int, ...] = tuple(GameConfigResource.HAND_SCORES.values())
@@ -5,10 +5,17 @@ In Godot: extends Resource with multiple signals
 """
 
 from dataclasses import dataclass, field
-from typing import List, Tuple, Optional
+from operator import attrgetter
+from typing import List, Optional, Set, Tuple
 
+_cell_card = attrgetter("card")
 
-@dataclass
+
+def _noop(*args) -> None:
+    """Default for unconnected signal callbacks, so emits can call unconditionally."""
+
+
+@dataclass(slots=True)
 class GameStateResource:
     """
     Main game state container (like a Godot Resource with state).
@@ -24,10 +31,11 @@ class GameStateResource:
     signal score_updated(new_score: int)
 
     var grid: Array[Array]  # 2D array of GridCellResource
+    var cells: Array[GridCellResource]  # Same cells, row-major (index row * cols + col)
     var deck: DeckResource  # Single shared deck (Balatro-style)
     var hands_left: int
     var hands_taken: int
-    var frozen_cells: Array[Vector2i]
+    var frozen_cells: Dictionary  # Vector2i -> true (used as a set)
     var current_round: int
     var cumulative_score: int
     var hand_scores: Array[int]
@@ -36,12 +44,16 @@ class GameStateResource:
 
     # Grid state
     grid: List[List['GridCellResource']] = field(default_factory=list)
+    # Same cell objects flattened row-major: cell (r, c) is cells[r * cols + c],
+    # row r is cells[r*cols:(r+1)*cols] and column c is cells[c::cols].
+    # Rebuilt on every grid assignment; edit cells in place, not grid's row lists
+    cells: List['GridCellResource'] = field(init=False, repr=False)
     deck: 'DeckResource' = None
 
     # Round state
     spins_left: int = 7
     spins_taken: int = 0
-    frozen_cells: List[Tuple[int, int]] = field(default_factory=list)
+    frozen_cells: Set[Tuple[int, int]] = field(default_factory=set)  # O(1) membership/add/discard
 
     # Reroll state (new system per GDD v1.1)
     reroll_tokens_left: int = 12  # Shared tokens per quota
@@ -59,25 +71,35 @@ class GameStateResource:
     config: 'GameConfigResource' = None
 
     # Callbacks for signals (in Godot, these would be signals)
-    _on_state_changed_callback: Optional[callable] = field(default=None, repr=False)
-    _on_hand_completed_callback: Optional[callable] = field(default=None, repr=False)
-    _on_round_completed_callback: Optional[callable] = field(default=None, repr=False)
-    _on_score_updated_callback: Optional[callable] = field(default=None, repr=False)
+    _on_state_changed_callback: callable = field(default=_noop, repr=False)
+    _on_hand_completed_callback: callable = field(default=_noop, repr=False)
+    _on_round_completed_callback: callable = field(default=_noop, repr=False)
+    _on_score_updated_callback: callable = field(default=_noop, repr=False)
+
+    def __post_init__(self):
+        """Accept any iterable of (row, col) for frozen_cells (cells is built when grid is set)."""
+        if not isinstance(self.frozen_cells, set):
+            self.frozen_cells = set(self.frozen_cells)
+
+    def __setattr__(self, name: str, value) -> None:
+        """Rebuild the flat cell list whenever grid is (re)assigned, so cells never goes stale."""
+        object.__setattr__(self, name, value)
+        if name == "grid":
+            object.__setattr__(self, "cells", [cell for row in value for cell in row])
 
     def reset_round(self) -> None:
         """Reset state for a new round."""
         self.spins_left = self.config.max_spins
         self.spins_taken = 0
-        self.frozen_cells = []
+        self.frozen_cells = set()
         self.spin_scores = []
 
         # Reset reroll tokens (no carryover per GDD v1.1)
         self.reroll_tokens_left = self.config.reroll_tokens_per_quota
 
         # Unfreeze all cells
-        for row in self.grid:
-            for cell in row:
-                cell.unfreeze()
+        for cell in self.cells:
+            cell.unfreeze()
 
         self._emit_state_changed()
 
@@ -93,8 +115,8 @@ class GameStateResource:
         if not self.can_freeze_more():
             return False  # At max freezes
 
-        self.grid[row][col].freeze()
-        self.frozen_cells.append((row, col))
+        self.cells[row * self.config.grid_cols + col].freeze()
+        self.frozen_cells.add((row, col))
         self._emit_state_changed()
         return True
 
@@ -103,27 +125,45 @@ class GameStateResource:
         if (row, col) not in self.frozen_cells:
             return False  # Not frozen
 
-        self.grid[row][col].unfreeze()
-        self.frozen_cells.remove((row, col))
+        self.cells[row * self.config.grid_cols + col].unfreeze()
+        self.frozen_cells.discard((row, col))
         self._emit_state_changed()
         return True
 
     def unfreeze_all(self) -> None:
         """Unfreeze all cells."""
-        for row, col in list(self.frozen_cells):
-            self.grid[row][col].unfreeze()
-        self.frozen_cells = []
+        cells = self.cells
+        cols = self.config.grid_cols
+        for row, col in self.frozen_cells:
+            cells[row * cols + col].unfreeze()
+        self.frozen_cells = set()
         self._emit_state_changed()
 
     def get_row(self, row_index: int) -> List['CardResource']:
         """Get all cards in a row."""
-        return [cell.card for cell in self.grid[row_index] if cell.card]
+        cols = self.config.grid_cols
+        return [card for card in map(_cell_card, self.cells[row_index * cols:(row_index + 1) * cols]) if card]
 
     def get_col(self, col_index: int) -> List['CardResource']:
         """Get all cards in a column."""
-        return [self.grid[row][col_index].card
-                for row in range(self.config.grid_rows)
-                if self.grid[row][col_index].card]
+        return [card for card in map(_cell_card, self.cells[col_index::self.config.grid_cols]) if card]
+
+    def get_card_snapshot(self) -> List[Optional['CardResource']]:
+        """
+        Every cell's card (or None) in row-major order, read in one pass.
+        Row r is snapshot[r*cols:(r+1)*cols]; column c is snapshot[c::cols].
+        """
+        return list(map(_cell_card, self.cells))
+
+    def grid_fingerprint(self) -> tuple:
+        """
+        Snapshot of every cell's (rank, suit, frozen) for change detection.
+        Any deal, reroll or freeze produces a different fingerprint.
+        """
+        return tuple(
+            (cell.card.rank, cell.card.suit, cell.is_frozen) if cell.card else None
+            for cell in self.cells
+        )
 
     def update_score(self, new_score: int) -> None:
         """Update cumulative score and emit signal."""
@@ -200,23 +240,19 @@ class GameStateResource:
     # Signal emission methods
     def _emit_state_changed(self) -> None:
         """Emit state_changed signal."""
-        if self._on_state_changed_callback:
-            self._on_state_changed_callback()
+        self._on_state_changed_callback()
 
     def _emit_hand_completed(self) -> None:
         """Emit hand_completed signal."""
-        if self._on_hand_completed_callback:
-            self._on_hand_completed_callback()
+        self._on_hand_completed_callback()
 
     def _emit_round_completed(self) -> None:
         """Emit round_completed signal."""
-        if self._on_round_completed_callback:
-            self._on_round_completed_callback()
+        self._on_round_completed_callback()
 
     def _emit_score_updated(self, score: int) -> None:
         """Emit score_updated signal."""
-        if self._on_score_updated_callback:
-            self._on_score_updated_callback(score)
+        self._on_score_updated_callback(score)
 
     # Signal connection methods
     def connect_state_changed(self, callback: callable) -> None:
@@ -8,7 +8,11 @@ from dataclasses import dataclass, field
 from typing import Optional
 
 
-@dataclass
+def _noop(*args) -> None:
+    """Default for unconnected signal callbacks, so emits can call unconditionally."""
+
+
+@dataclass(slots=True)
 class GridCellResource:
     """
     Represents a single cell in the grid.
@@ -33,8 +37,8 @@ class GridCellResource:
     is_frozen: bool = False
 
     # Callbacks for signals (in Godot, these would be signals)
-    _on_changed_callback: Optional[callable] = field(default=None, repr=False)
-    _on_freeze_changed_callback: Optional[callable] = field(default=None, repr=False)
+    _on_changed_callback: callable = field(default=_noop, repr=False)
+    _on_freeze_changed_callback: callable = field(default=_noop, repr=False)
 
     def set_card(self, card: 'CardResource') -> None:
         """Set the card for this cell and emit signal."""
@@ -57,13 +61,11 @@ class GridCellResource:
 
     def _emit_changed(self) -> None:
         """Emit cell_changed signal (callback in Python)."""
-        if self._on_changed_callback:
-            self._on_changed_callback(self)
+        self._on_changed_callback(self)
 
     def _emit_freeze_changed(self) -> None:
         """Emit freeze_changed signal (callback in Python)."""
-        if self._on_freeze_changed_callback:
-            self._on_freeze_changed_callback(self)
+        self._on_freeze_changed_callback(self)
 
     def connect_changed(self, callback: callable) -> None:
         """Connect to the changed signal."""
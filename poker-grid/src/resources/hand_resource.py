@@ -8,7 +8,7 @@ from dataclasses import dataclass, field
 from typing import List
 
 
-@dataclass
+@dataclass(slots=True)
 class HandResource:
     """
     Represents a 5-card poker hand with its evaluation.
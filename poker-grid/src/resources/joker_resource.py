@@ -5,10 +5,60 @@ In Godot: extends Resource
 """
 
 from dataclasses import dataclass, field
-from typing import Optional, List, Union
-
-
-@dataclass
+from sys import intern
+from types import MappingProxyType
+from typing import Callable, Dict, List, Optional, Tuple, Union
+
+# Rarity indicator shown before a joker's name
+_RARITY_SYMBOLS = MappingProxyType({
+    "Common": "",
+    "Uncommon": "◆",
+    "Rare": "★",
+    "Legendary": "♛"
+})
+
+
+# Instant-description pieces, dispatched on the joker's fields instead of an
+# if/elif ladder; a new effect or condition type is one more entry here.
+# Bonus text by bonus_type
+_BONUS_TEXT: Dict[str, Callable[['JokerResource'], str]] = {
+    "+m": lambda j: (
+        f"{j.bonus_value} Mult"
+        if isinstance(j.bonus_value, str) and 'x' in j.bonus_value.lower()
+        else f"+{int(j.bonus_value)} Mult"
+    ),
+    "+c": lambda j: f"+{int(j.bonus_value)} Chips",
+    "Xm": lambda j: f"×{j.bonus_value} Mult",
+    # Special case: both chips and mult (Scholar, Walkie Talkie)
+    "++": lambda j: f"+{j.combo_chips} Chips and +{j.combo_mult} Mult",
+}
+
+# Bonus types whose "always" jokers are described by the bonus alone
+_ALWAYS_BONUS_TYPES = frozenset(("+m", "+c", "Xm"))
+
+# Whole descriptions for conditions that don't read as "<bonus> per/if <condition>"
+_FIXED_DESCRIPTIONS: Dict[Tuple[str, str], str] = {
+    ("card_type", "lowest_rank"): "Adds 2× lowest held card rank to Mult",
+    ("card_position", "first_face"): "First face card in each line gets ×2 Mult",
+}
+
+
+def _scored(joker: 'JokerResource') -> List[str]:
+    """Trailing "scored" for per-card conditions."""
+    return ["scored"] if joker.per_card else []
+
+
+# Condition words by condition_type
+_CONDITION_TEXT: Dict[str, Callable[['JokerResource'], List[str]]] = {
+    "suit": lambda j: [f"{j.condition_value} card"] + _scored(j),
+    "hand_type": lambda j: [f"hand is a {j.condition_value}"],
+    "card_type": lambda j: ["face card"] + _scored(j) if j.condition_value == "face" else [],
+    "rank": lambda j: [" or ".join(j.condition_value.split("|"))] + _scored(j),
+    "rank_parity": lambda j: [f"{j.condition_value} rank card"] + _scored(j),
+}
+
+
+@dataclass(slots=True)
 class JokerResource:
     """
     Represents a joker card with its effects.
@@ -48,101 +98,73 @@ class JokerResource:
     notes: str = ""
     sell_value: Optional[int] = None
 
+    # "++" bonus ("20c4m") parsed once: chips and mult added per matching card
+    combo_chips: int = field(init=False, default=0, repr=False, compare=False)
+    combo_mult: int = field(init=False, default=0, repr=False, compare=False)
+
+    # Display text fixed at creation (instant descriptions never change;
+    # growing ones include current_bonus and are rebuilt on each call)
+    _display_name: str = field(init=False, default="", repr=False, compare=False)
+    _description: Optional[str] = field(init=False, default=None, repr=False, compare=False)
+
     def __post_init__(self):
         """Initialize computed values."""
+        # Fields from small fixed vocabularies (fresh strings per CSV row) are
+        # interned: jokers share one object per value, and == checks against
+        # identifier-like literals ("always", "suit") hit the identity fast path
+        self.rarity = intern(self.rarity)
+        self.effect_type = intern(self.effect_type)
+        self.trigger = intern(self.trigger)
+        self.condition_type = intern(self.condition_type)
+        self.condition_value = intern(self.condition_value)
+        self.bonus_type = intern(self.bonus_type)
+
         if self.sell_value is None:
             # Default sell value is half of cost
             self.sell_value = max(1, self.cost // 2)
 
+        if self.bonus_type == "++":
+            chips, mult = str(self.bonus_value).split("c")
+            self.combo_chips = int(chips)
+            self.combo_mult = int(mult.replace("m", ""))
+
+        self._display_name = f"{_RARITY_SYMBOLS.get(self.rarity, '')} {self.name}".strip()
+        if self.effect_type != "growing":
+            self._description = self._generate_instant_description()
+
     def get_display_name(self) -> str:
-        """Get display name with rarity indicator."""
-        rarity_symbols = {
-            "Common": "",
-            "Uncommon": "◆",
-            "Rare": "★",
-            "Legendary": "♛"
-        }
-        symbol = rarity_symbols.get(self.rarity, "")
-        return f"{symbol} {self.name}".strip()
+        """Get display name with rarity indicator (built once in __post_init__)."""
+        return self._display_name
 
     def get_description(self) -> str:
         """
         Generate description from joker data.
         Auto-generates based on effect type and conditions.
         """
-        # Growing jokers show current value
-        if self.effect_type == "growing":
+        # Growing jokers show current value; instant ones were built in __post_init__
+        if self._description is None:
             return self._generate_growing_description()
-        else:
-            return self._generate_instant_description()
+        return self._description
 
     def _generate_instant_description(self) -> str:
-        """Generate description for instant effects."""
+        """Generate description for instant effects (from the module dispatch tables)."""
         # Always active
-        if self.trigger == "always":
-            if self.bonus_type == "+m":
-                return f"+{int(self.bonus_value)} Mult"
-            elif self.bonus_type == "+c":
-                return f"+{int(self.bonus_value)} Chips"
-            elif self.bonus_type == "Xm":
-                return f"×{self.bonus_value} Mult"
-
-        # Conditional effects
-        desc_parts = []
+        if self.trigger == "always" and self.bonus_type in _ALWAYS_BONUS_TYPES:
+            return _BONUS_TEXT[self.bonus_type](self)
 
-        # Bonus description
-        if self.bonus_type == "+m":
-            # Handle numeric and special formats
-            if isinstance(self.bonus_value, str) and 'x' in self.bonus_value.lower():
-                desc_parts.append(f"{self.bonus_value} Mult")
-            else:
-                desc_parts.append(f"+{int(self.bonus_value)} Mult")
-        elif self.bonus_type == "+c":
-            desc_parts.append(f"+{int(self.bonus_value)} Chips")
-        elif self.bonus_type == "Xm":
-            desc_parts.append(f"×{self.bonus_value} Mult")
-        elif self.bonus_type == "++":
-            # Special case: both chips and mult (Scholar, Walkie Talkie)
-            values = str(self.bonus_value).split("c")
-            chips = values[0]
-            mult = values[1].replace("m", "")
-            desc_parts.append(f"+{chips} Chips and +{mult} Mult")
-
-        # Per card modifier
-        if self.per_card:
-            desc_parts.append("per")
-        else:
-            desc_parts.append("if")
-
-        # Condition description
-        if self.condition_type == "suit":
-            desc_parts.append(f"{self.condition_value} card")
-            if self.per_card:
-                desc_parts.append("scored")
-        elif self.condition_type == "hand_type":
-            desc_parts.append(f"hand is a {self.condition_value}")
-        elif self.condition_type == "card_type":
-            if self.condition_value == "face":
-                desc_parts.append("face card")
-                if self.per_card:
-                    desc_parts.append("scored")
-            elif self.condition_value == "lowest_rank":
-                return f"Adds 2× lowest held card rank to Mult"
-        elif self.condition_type == "rank":
-            ranks = self.condition_value.split("|")
-            if len(ranks) > 1:
-                desc_parts.append(f"{' or '.join(ranks)}")
-            else:
-                desc_parts.append(f"{self.condition_value}")
-            if self.per_card:
-                desc_parts.append("scored")
-        elif self.condition_type == "rank_parity":
-            desc_parts.append(f"{self.condition_value} rank card")
-            if self.per_card:
-                desc_parts.append("scored")
-        elif self.condition_type == "card_position":
-            if self.condition_value == "first_face":
-                return "First face card in each line gets ×2 Mult"
+        fixed = _FIXED_DESCRIPTIONS.get((self.condition_type, self.condition_value))
+        if fixed is not None:
+            return fixed
+
+        # Conditional effects: "<bonus> per|if <condition>"
+        desc_parts = []
+        bonus_text = _BONUS_TEXT.get(self.bonus_type)
+        if bonus_text is not None:
+            desc_parts.append(bonus_text(self))
+        desc_parts.append("per" if self.per_card else "if")
+        condition_text = _CONDITION_TEXT.get(self.condition_type)
+        if condition_text is not None:
+            desc_parts.extend(condition_text(self))
 
         return " ".join(desc_parts)
 
@@ -174,7 +196,13 @@ class JokerResource:
             return self.bonus_value
 
     def duplicate(self) -> 'JokerResource':
-        """Create a copy of this joker (Resource pattern)."""
+        """
+        Create a copy of this joker (Resource pattern).
+        Only growing jokers carry per-owner state (current_bonus), so instant
+        jokers are shared: the loaded definition itself is returned.
+        """
+        if self.effect_type != "growing":
+            return self
         return JokerResource(
             id=self.id,
             name=self.name,
@@ -8,7 +8,7 @@ from dataclasses import dataclass, field
 from typing import List, Optional
 
 
-@dataclass
+@dataclass(slots=True)
 class ReelResource:
     """
     Represents a single column reel (52-card deck with no replacement).
@@ -23,12 +23,12 @@ class ReelResource:
 
     @export var col_index: int
     var deck: Array[CardResource]
-    var drawn_indices: Array[int]
+    var drawn: int  # Cards drawn so far (next draw reads deck[drawn])
     """
 
     col_index: int
     deck: List['CardResource'] = field(default_factory=list)
-    drawn_indices: List[int] = field(default_factory=list)
+    drawn: int = 0  # Draw cursor: cards are drawn in deck order, so a count is enough
 
     # Callbacks for signals (in Godot, these would be signals)
     _on_card_drawn_callback: Optional[callable] = field(default=None, repr=False)
@@ -36,23 +36,28 @@ class ReelResource:
     def reset(self, new_deck: List['CardResource']) -> None:
         """Reset the reel with a fresh shuffled deck."""
         self.deck = new_deck
-        self.drawn_indices = []
+        self.drawn = 0
 
     def draw(self) -> Optional['CardResource']:
         """Draw the next card from this reel and emit signal."""
-        if len(self.drawn_indices) >= len(self.deck):
+        next_index = self.drawn
+        if next_index >= len(self.deck):
             return None  # Deck exhausted
 
-        next_index = len(self.drawn_indices)
         card = self.deck[next_index]
-        self.drawn_indices.append(next_index)
+        self.drawn = next_index + 1
 
         self._emit_card_drawn(card)
         return card
 
     def cards_remaining(self) -> int:
         """Return number of cards left in this reel."""
-        return len(self.deck) - len(self.drawn_indices)
+        return len(self.deck) - self.drawn
+
+    @property
+    def drawn_indices(self) -> range:
+        """Indices drawn so far (always a prefix of the deck)."""
+        return range(self.drawn)
 
     def _emit_card_drawn(self, card: 'CardResource') -> None:
         """Emit card_drawn signal (callback in Python)."""
@@ -64,10 +69,9 @@ class ReelResource:
         self._on_card_drawn_callback = callback
 
     def duplicate(self) -> 'ReelResource':
-        """Create a copy of this reel (Resource pattern)."""
-        from src.resources.card_resource import CardResource
+        """Create a copy of this reel (Resource pattern; immutable cards are shared)."""
         return ReelResource(
             col_index=self.col_index,
-            deck=[card.duplicate() for card in self.deck],
-            drawn_indices=self.drawn_indices.copy()
+            deck=self.deck.copy(),
+            drawn=self.drawn
         )
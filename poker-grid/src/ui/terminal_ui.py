@@ -1,6 +1,9 @@
 # Poker Grid - Terminal UI
 # Display and input handling (like UI layer in Godot)
 
+import io
+import sys
+from contextlib import contextmanager
 from typing import List, Optional, TYPE_CHECKING
 
 if TYPE_CHECKING:
@@ -9,6 +12,23 @@ if TYPE_CHECKING:
     from src.ui_adapter import UIAdapter
 
 
+@contextmanager
+def batched_output():
+    """
+    Collect everything printed inside the block and write it out at once.
+    One write + flush per frame instead of one per print() call.
+    """
+    buffer = io.StringIO()
+    original = sys.stdout
+    sys.stdout = buffer
+    try:
+        yield
+    finally:
+        sys.stdout = original
+        original.write(buffer.getvalue())
+        original.flush()
+
+
 class TerminalUI:
     """Handles all terminal display and user input."""
 
@@ -274,8 +294,9 @@ class TerminalUI:
         print(f"Freezes: {freezes_used}/{config.max_freezes} used ({freezes_left} remaining)")
 
         if state.frozen_cells:
-            frozen_str = ", ".join(f"({r},{c})" for r, c in state.frozen_cells)
-            frozen_cards = [str(state.grid[r][c].card) for r, c in state.frozen_cells]
+            frozen = sorted(state.frozen_cells)
+            frozen_str = ", ".join(f"({r},{c})" for r, c in frozen)
+            frozen_cards = [str(state.grid[r][c].card) for r, c in frozen]
             print(f"Frozen cells: {frozen_str} -> {', '.join(frozen_cards)}")
         print()
 
@@ -445,6 +466,38 @@ class TerminalUI:
         except KeyboardInterrupt:
             return "q"
 
+    def wait_ack(self, timeout: float = 1.5):
+        """
+        Pause until Enter is pressed or the timeout expires.
+        Replaces blocking input() pauses so rapid play isn't stalled.
+        """
+        print("Press Enter to continue...", end="", flush=True)
+        acknowledged = False
+        try:
+            if sys.platform == "win32":
+                import msvcrt
+                import time
+                deadline = time.monotonic() + timeout
+                while time.monotonic() < deadline:
+                    if msvcrt.kbhit():
+                        # Drain buffered keys so they don't leak into the next prompt
+                        while msvcrt.kbhit():
+                            msvcrt.getwch()
+                        break
+                    time.sleep(0.01)
+            else:
+                import select
+                ready, _, _ = select.select([sys.stdin], [], [], timeout)
+                if ready:
+                    # Consume only the acknowledging line (Enter echoes its own newline)
+                    sys.stdin.readline()
+                    acknowledged = True
+        except (OSError, ValueError):
+            # stdin is not selectable (e.g. redirected) - just continue
+            pass
+        if not acknowledged:
+            print()
+
     def parse_command(self, cmd: str) -> tuple:
         """
         Parse user command.
@@ -460,7 +513,7 @@ class TerminalUI:
         if action.startswith("r") and len(action) > 1:
             # Support "r1", "r12", "r034" format (no spaces)
             try:
-                column_indices = [int(char) for char in action[1:]]
+                column_indices = list(map(int, action[1:]))
                 return ("reroll", column_indices)
             except ValueError:
                 return ("invalid", [])
@@ -468,7 +521,7 @@ class TerminalUI:
         elif action == "r" and len(parts) >= 2:
             # Reroll columns with spaces: "r 0 2 4"
             try:
-                column_indices = [int(col) for col in parts[1:]]
+                column_indices = list(map(int, parts[1:]))
                 return ("reroll", column_indices)
             except ValueError:
                 return ("invalid", [])
@@ -564,13 +617,14 @@ class TerminalUI:
             print()
             return
 
-        frozen_cards = [state.grid[r][c].card for r, c in state.frozen_cells]
-        frozen_str = ", ".join(f"({r},{c})" for r, c in state.frozen_cells)
+        frozen = sorted(state.frozen_cells)
+        frozen_cards = [state.grid[r][c].card for r, c in frozen]
+        frozen_str = ", ".join(f"({r},{c})" for r, c in frozen)
 
         # Determine freeze type
         if len(frozen_cards) == 2:
             card1, card2 = frozen_cards
-            pos1, pos2 = state.frozen_cells
+            pos1, pos2 = frozen
 
             # Check if it's a pair
             if card1.rank == card2.rank:
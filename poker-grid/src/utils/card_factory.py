@@ -4,8 +4,9 @@ Static utility class for creating and shuffling decks.
 In Godot: class with static functions (no extends)
 """
 
+import functools
 import random
-from typing import List
+from typing import List, Tuple
 
 
 class CardFactory:
@@ -24,16 +25,25 @@ class CardFactory:
     """
 
     @staticmethod
-    def create_deck() -> List['CardResource']:
-        """Create a standard 52-card deck."""
+    @functools.lru_cache(maxsize=1)
+    def _standard_cards() -> Tuple['CardResource', ...]:
+        """
+        The 52 standard cards, built once per process.
+        Cards are immutable, so every deck shares these instances.
+        """
         from src.resources.card_resource import CardResource
         from src.resources.game_config_resource import GameConfigResource
 
-        deck = []
-        for suit in GameConfigResource.SUITS:
-            for rank in GameConfigResource.RANKS:
-                deck.append(CardResource(rank=rank, suit=suit))
-        return deck
+        return tuple(
+            CardResource(rank=rank, suit=suit)
+            for suit in GameConfigResource.SUITS
+            for rank in GameConfigResource.RANKS
+        )
+
+    @staticmethod
+    def create_deck() -> List['CardResource']:
+        """Create a standard 52-card deck (a fresh list of the shared cards)."""
+        return list(CardFactory._standard_cards())
 
     @staticmethod
     def shuffle_deck(deck: List['CardResource']) -> None:
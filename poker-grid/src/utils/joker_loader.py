@@ -4,7 +4,8 @@ Utility for loading and parsing joker data from jokers_structured.csv.
 """
 
 import csv
-from typing import List
+import functools
+from typing import List, Tuple
 from pathlib import Path
 
 from src.resources.joker_resource import JokerResource
@@ -157,7 +158,7 @@ class JokerLoader:
         - Special formats: "20c4m" -> 20c4m (as string converted to float for ++ type)
 
         Note: For "++" bonus_type, bonus_value stays as string (e.g., "20c4m")
-        and is parsed in joker_manager._apply_effect().
+        and is parsed once by JokerResource.__post_init__ (combo_chips/combo_mult).
         """
         value_str = value_str.strip()
 
@@ -199,6 +200,11 @@ class JokerLoader:
         return JokerLoader.load_from_csv(JokerLoader.get_default_csv_path())
 
     @staticmethod
-    def load_p0_jokers() -> List[JokerResource]:
-        """Load all P0 priority jokers from default CSV location."""
-        return JokerLoader.load_by_priority(JokerLoader.get_default_csv_path(), 'P0')
+    @functools.lru_cache(maxsize=1)
+    def load_p0_jokers() -> Tuple[JokerResource, ...]:
+        """
+        Load all P0 priority jokers from default CSV location.
+        Parsed once per process and returned as a read-only tuple
+        (the shop duplicates a joker when it is bought).
+        """
+        return tuple(JokerLoader.load_by_priority(JokerLoader.get_default_csv_path(), 'P0'))
@@ -4,9 +4,23 @@ Static utility class for evaluating poker hands.
 In Godot: class with static functions (no extends)
 """
 
-from typing import List
+from typing import List, Sequence
 from collections import Counter
 
+from src.resources.game_config_resource import HandType
+
+# Rank-value bitmask (bit v for rank value v) of every straight, wheel A-2-3-4-5 included
+_STRAIGHT_MASKS = frozenset([0b11111 << low for low in range(2, 11)] + [1 << 14 | 0b1111 << 2])
+_ROYAL_MASK = 0b11111 << 10  # T-J-Q-K-A
+
+# Hand type by the number of equal-rank card pairs in a 5-card hand (sum of
+# C(n, 2) over ranks); flushes and straights are only possible at 0 pairs
+# or are outranked, so they are checked separately
+_TYPE_BY_PAIRS = (
+    HandType.HIGH_CARD, HandType.ONE_PAIR, HandType.TWO_PAIR, HandType.THREE_KIND,
+    HandType.FULL_HOUSE, None, HandType.FOUR_KIND, None, None, None, HandType.FIVE_KIND,
+)
+
 
 class PokerEvaluator:
     """
@@ -27,45 +41,59 @@ class PokerEvaluator:
         Uses new flat chip scoring (no per-hand mult).
         """
         from src.resources.hand_resource import HandResource
-        from src.resources.game_config_resource import GameConfigResource
+        from src.resources.game_config_resource import (
+            GameConfigResource, HAND_SCORE_TABLE, HAND_TYPE_NAMES
+        )
 
         if len(cards) != 5:
             # Invalid hand
             return HandResource(cards=cards, hand_type="Invalid", chips=0, mult=1)
 
         # Sort cards by value for easier evaluation
-        sorted_cards = sorted(cards, key=lambda c: c.get_rank_value(), reverse=True)
-
-        # Check all hand types from best to worst
-        if PokerEvaluator._is_five_of_a_kind(sorted_cards):
-            hand_type = "Five of a Kind"
-        elif PokerEvaluator._is_royal_flush(sorted_cards):
-            hand_type = "Royal Flush"
-        elif PokerEvaluator._is_straight_flush(sorted_cards):
-            hand_type = "Straight Flush"
-        elif PokerEvaluator._is_four_of_a_kind(sorted_cards):
-            hand_type = "Four of a Kind"
-        elif PokerEvaluator._is_full_house(sorted_cards):
-            hand_type = "Full House"
-        elif PokerEvaluator._is_flush(sorted_cards):
-            hand_type = "Flush"
-        elif PokerEvaluator._is_straight(sorted_cards):
-            hand_type = "Straight"
-        elif PokerEvaluator._is_three_of_a_kind(sorted_cards):
-            hand_type = "Three of a Kind"
-        elif PokerEvaluator._is_two_pair(sorted_cards):
-            hand_type = "Two Pair"
-        elif PokerEvaluator._is_one_pair(sorted_cards):
-            hand_type = "One Pair"
-        else:
-            hand_type = "High Card"
+        rank_values = GameConfigResource.RANK_VALUES
+        sorted_cards = sorted(cards, key=lambda c: rank_values[c.rank], reverse=True)
+
+        hand_type = PokerEvaluator.classify_codes([card.code for card in sorted_cards])
 
-        # Get flat chips from config (new scoring system)
-        chips = GameConfigResource.HAND_SCORES[hand_type]
+        # Get flat chips from config (new scoring system), indexed by HandType
+        chips = HAND_SCORE_TABLE[hand_type]
         # Base mult is always 1 (jokers provide global mult bonuses)
         mult = 1
 
-        return HandResource(cards=sorted_cards, hand_type=hand_type, chips=chips, mult=mult)
+        return HandResource(cards=sorted_cards, hand_type=HAND_TYPE_NAMES[hand_type], chips=chips, mult=mult)
+
+    @staticmethod
+    def classify_codes(codes: Sequence[int]) -> HandType:
+        """
+        Hand type of 5 cards given as CardResource.code ints (rank value | suit index << 4).
+        One pass of bit operations: per-rank 4-bit counters give the pair count,
+        a rank bitmask gives straights and a suit bitmask gives flushes
+        (same precedence as the _is_* helpers).
+        """
+        counters = 0
+        pairs = 0
+        rank_mask = 0
+        suit_mask = 0
+        for code in codes:
+            value = code & 15
+            shift = value << 2
+            pairs += counters >> shift & 15  # Pairs this card forms with earlier ones
+            counters += 1 << shift
+            rank_mask |= 1 << value
+            suit_mask |= 1 << (code >> 4)
+
+        hand_type = _TYPE_BY_PAIRS[pairs]
+        if hand_type <= HandType.FULL_HOUSE:
+            return hand_type  # Five/four of a kind and full house outrank flushes
+
+        is_straight = pairs == 0 and rank_mask in _STRAIGHT_MASKS
+        if suit_mask & (suit_mask - 1) == 0:  # One suit bit set
+            if is_straight:
+                return HandType.ROYAL_FLUSH if rank_mask == _ROYAL_MASK else HandType.STRAIGHT_FLUSH
+            return HandType.FLUSH
+        if is_straight:
+            return HandType.STRAIGHT
+        return hand_type
 
     # Helper methods for hand detection
 
@@ -83,7 +111,8 @@ class PokerEvaluator:
     @staticmethod
     def _is_straight(cards: List['CardResource']) -> bool:
         """Check if cards form a straight."""
-        values = sorted([card.get_rank_value() for card in cards])
+        values = [card.get_rank_value() for card in cards]
+        values.sort()
 
         # Check normal straight
         if values == list(range(values[0], values[0] + 5)):
@@ -3,7 +3,10 @@ Test GameConfigResource
 Tests configuration and constants
 """
 import pytest
-from src.resources.game_config_resource import GameConfigResource
+from src.resources.game_config_resource import (
+    GameConfigResource, HandType, HAND_SCORE_TABLE, HAND_TYPE_NAMES
+)
+from src.resources.card_resource import CardResource
 
 
 class TestConfigDefaults:
@@ -49,6 +52,13 @@ class TestCardConstants:
         assert config.RANK_VALUES['A'] == 14
         assert config.RANK_VALUES['A'] > config.RANK_VALUES['K']
 
+    def test_card_rank_value_matches_config(self, config):
+        """get_rank_value agrees with RANK_VALUES; unknown ranks never rank as 0"""
+        for rank in config.RANKS:
+            assert CardResource(rank, 'H').get_rank_value() == config.RANK_VALUES[rank]
+        with pytest.raises(ValueError):
+            CardResource('1', 'H')
+
 
 class TestHandScores:
     """Test poker hand score constants"""
@@ -112,6 +122,15 @@ class TestHandScores:
             if hand_type != "Five of a Kind":
                 assert five_kind_score > chips, f"Five of a Kind ({five_kind_score}) should be > {hand_type} ({chips})"
 
+    def test_hand_score_table_matches_hand_scores(self, config):
+        """HandType-indexed tables agree with HAND_SCORES"""
+        assert len(HandType) == len(config.HAND_SCORES)
+        assert HAND_TYPE_NAMES[HandType.FIVE_KIND] == "Five of a Kind"
+        assert HAND_TYPE_NAMES[HandType.ONE_PAIR] == "One Pair"
+        assert HAND_TYPE_NAMES[HandType.HIGH_CARD] == "High Card"
+        for hand_type in HandType:
+            assert HAND_SCORE_TABLE[hand_type] == config.HAND_SCORES[HAND_TYPE_NAMES[hand_type]]
+
 
 class TestConfigModification:
     """Test config can be modified"""
@@ -69,12 +69,15 @@ class TestDrawWithReplacement:
         assert standard_deck.size() == 52
 
     def test_drawn_cards_are_independent(self, standard_deck):
-        """Each drawn card is a duplicate (not same instance)"""
+        """Drawn cards are immutable values that cannot affect the deck"""
         card1 = standard_deck.draw_random()
         card2 = standard_deck.draw_random()
 
-        # They might be same card, but not same instance
-        assert card1 is not card2
+        # They might be the same (shared, frozen) card; the deck itself is untouched
+        with pytest.raises(AttributeError):
+            card1.rank = "2"
+        assert card1 in standard_deck.cards and card2 in standard_deck.cards
+        assert standard_deck.size() == 52
 
     def test_duplicates_possible(self, standard_deck):
         """Drawing can produce duplicate cards"""
@@ -92,6 +95,14 @@ class TestDrawWithReplacement:
         # If all 25 are unique, that's fine but unlikely
         assert len(card_strings) == 25  # Drew 25 cards
 
+    def test_draw_random_bulk_leaves_deck_unchanged(self, standard_deck):
+        """draw_random_bulk() draws N cards with replacement without changing the deck"""
+        drawn_cards = standard_deck.draw_random_bulk(25)
+
+        assert len(drawn_cards) == 25
+        assert all(card in standard_deck.cards for card in drawn_cards)
+        assert standard_deck.size() == 52
+
     def test_draw_from_empty_deck_raises_error(self, empty_deck):
         """Drawing from empty deck raises ValueError"""
         with pytest.raises(ValueError, match="Cannot draw from empty deck"):
@@ -194,3 +205,28 @@ class TestCardFactory:
 
         assert deck1 is not deck2
         assert deck1.cards is not deck2.cards
+
+
+class TestCardValidation:
+    """Test CardResource rank/suit validation"""
+
+    def test_unknown_rank_raises(self):
+        """Ranks outside RANK_VALUES are rejected, including multi-character ones"""
+        with pytest.raises(ValueError):
+            CardResource("10", "H")
+        with pytest.raises(ValueError):
+            CardResource("X", "H")
+
+    def test_unknown_suit_raises(self):
+        """Unknown suits are rejected without growing the suit table"""
+        from src.resources import card_resource
+
+        known_suits = dict(card_resource._SUIT_INDEX)
+        with pytest.raises(ValueError):
+            CardResource("A", "Hx")
+        assert card_resource._SUIT_INDEX == known_suits
+
+    def test_spelled_out_suits_keep_distinct_codes(self):
+        """Suit codes match suit string equality"""
+        assert CardResource("A", "Spade").code != CardResource("A", "S").code
+        assert CardResource("A", "Spade").code == CardResource("A", "Spade").code
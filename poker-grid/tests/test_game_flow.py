@@ -5,6 +5,8 @@ Tests GameManager orchestration
 import pytest
 from src.managers.game_manager import GameManager
 from src.resources.game_config_resource import GameConfigResource
+from src.ui.terminal_ui import TerminalUI
+from src.ui_adapter import UIAdapter
 
 
 class TestGameInitialization:
@@ -193,6 +195,18 @@ class TestFreezeSystem:
         assert game.state.grid[0][0].is_frozen == False
         assert game.state.grid[1][1].is_frozen == False
 
+    def test_freeze_info_printed_on_every_frame(self, started_game, capsys):
+        """print_freeze_info always prints the freeze line, even when unchanged"""
+        game = started_game
+        game.config.enable_freeze = True
+        ui = TerminalUI(UIAdapter(game))
+
+        ui.print_freeze_info()
+        assert "Freezes:" in capsys.readouterr().out
+
+        ui.print_freeze_info()
+        assert "Freezes:" in capsys.readouterr().out
+
 
 class TestRoundCompletion:
     """Test round completion logic"""
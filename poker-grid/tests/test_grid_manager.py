@@ -407,3 +407,17 @@ class TestGetRowColCards:
         assert len(cards) == game.config.grid_rows
         for card in cards:
             assert card is not None
+
+    def test_reassigned_grid_rebuilds_cells(self, started_game):
+        """Rebinding state.grid rebuilds the flat cell list used by row/col helpers"""
+        game = started_game
+        config = game.config
+        grid = [
+            [GridCellResource(row=r, col=c, card=CardResource('A', 'S')) for c in range(config.grid_cols)]
+            for r in range(config.grid_rows)
+        ]
+
+        game.state.grid = grid
+
+        assert game.state.cells == [cell for row in grid for cell in row]
+        assert game.grid_manager.get_row_cards(0) == [CardResource('A', 'S')] * config.grid_cols
@@ -101,6 +101,27 @@ class TestJokerManager:
         manager.add_joker(joker.duplicate())
         assert manager.has_empty_slot() is False
 
+    def test_duplicate_shares_instant_and_copies_growing_jokers(self):
+        """Instant jokers are shared on duplicate; growing jokers get their own bonus."""
+        instant = JokerResource(
+            id="test_001", name="Test Joker", rarity="Common", cost=5,
+            effect_type="instant", trigger="always", condition_type="",
+            condition_value="", bonus_type="+m", bonus_value=10, per_card=False
+        )
+        growing = JokerResource(
+            id="test_002", name="Growing Joker", rarity="Common", cost=5,
+            effect_type="growing", trigger="on_scored", condition_type="",
+            condition_value="", bonus_type="+c", bonus_value=5, per_card=False,
+            grow_per="hand"
+        )
+
+        assert instant.duplicate() is instant
+
+        copy = growing.duplicate()
+        copy.grow()
+        assert copy is not growing
+        assert growing.current_bonus == 0
+
 
 class TestJokerEffectApplication:
     """Test joker effect logic (without hardcoding specific values)."""
@@ -281,6 +302,33 @@ class TestJokerEffectApplication:
         # Mult should be multiplied, not added
         assert mult == base_mult * 2
 
+    def test_chips_and_mult_joker_adds_both_per_matching_card(self):
+        """++ jokers parse their "NcMm" bonus once and add both per matching card."""
+        manager = JokerManager(max_slots=5)
+
+        joker = JokerResource(
+            id="test_006", name="Combo Joker", rarity="Common", cost=5,
+            effect_type="instant", trigger="on_scored", condition_type="rank",
+            condition_value="A", bonus_type="++", bonus_value="20c4m", per_card=False
+        )
+        manager.add_joker(joker)
+        assert (joker.combo_chips, joker.combo_mult) == (20, 4)
+
+        cards = [
+            CardResource("A", "Spade"),
+            CardResource("A", "Heart"),
+            CardResource("K", "Spade"),
+            CardResource("Q", "Spade"),
+            CardResource("J", "Spade")
+        ]
+        hand = PokerEvaluator.evaluate_hand(cards)
+
+        chips, mult = manager.apply_joker_effects(hand, cards, hand.chips, hand.mult)
+
+        # Two aces match the condition
+        assert chips == hand.chips + 2 * 20
+        assert mult == hand.mult + 2 * 4
+
 
 class TestMultipleJokersStacking:
     """Test multiple jokers working together."""
@@ -448,3 +496,28 @@ class TestJokerScoringIntegration:
 
         # Score with jokers should be higher
         assert score_with_jokers > score_no_jokers
+
+    def test_per_line_growing_joker_grows_on_every_line_with_effect_cache(self):
+        """Cached joker results must not skip per-line growth."""
+        from src.managers.game_manager import GameManager
+
+        config = GameConfigResource()
+        game = GameManager(config)
+        game.start_new_round()
+
+        joker_manager = JokerManager(max_slots=5)
+        joker = JokerResource(
+            id="test_004", name="Growing Joker", rarity="Common", cost=5,
+            effect_type="growing", trigger="always", condition_type="",
+            condition_value="", bonus_type="+m", bonus_value=1,
+            per_card=False, grow_per="line"
+        )
+        joker_manager.add_joker(joker)
+        game.score_manager.joker_manager = joker_manager
+
+        game.score_manager.score_current_grid()
+        assert joker.current_bonus == 10
+
+        # Same lines, new joker bonus: every line is applied again
+        game.score_manager.score_current_grid()
+        assert joker.current_bonus == 20
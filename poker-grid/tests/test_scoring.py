@@ -274,6 +274,29 @@ class TestEdgeCases:
         assert hand.cards[3].rank == '5'
         assert hand.cards[4].rank == '2'
 
+    def test_classify_codes_matches_helper_checks(self):
+        """Bitwise classification agrees with the _is_* helpers in precedence order"""
+        import random
+        rng = random.Random(0)
+        deck = [CardResource(rank=r, suit=s) for r in GameConfigResource.RANKS for s in GameConfigResource.SUITS]
+        checks = [
+            ("Five of a Kind", PokerEvaluator._is_five_of_a_kind),
+            ("Royal Flush", PokerEvaluator._is_royal_flush),
+            ("Straight Flush", PokerEvaluator._is_straight_flush),
+            ("Four of a Kind", PokerEvaluator._is_four_of_a_kind),
+            ("Full House", PokerEvaluator._is_full_house),
+            ("Flush", PokerEvaluator._is_flush),
+            ("Straight", PokerEvaluator._is_straight),
+            ("Three of a Kind", PokerEvaluator._is_three_of_a_kind),
+            ("Two Pair", PokerEvaluator._is_two_pair),
+            ("One Pair", PokerEvaluator._is_one_pair),
+        ]
+
+        for _ in range(2000):
+            cards = rng.choices(deck, k=5)  # With replacement, like the grid
+            expected = next((name for name, check in checks if check(cards)), "High Card")
+            assert PokerEvaluator.evaluate_hand(cards).hand_type == expected
+
 
 class TestScoreManager:
     """Test ScoreManager functionality"""
@@ -323,6 +346,55 @@ class TestScoreManager:
         assert game.state.cumulative_score == score1 + score2
         assert len(game.state.spin_scores) == 2
 
+    def test_unchanged_grid_reuses_cached_result(self, started_game):
+        """Re-scoring an unchanged grid returns the cached result"""
+        game = started_game
+
+        first = game.score_manager.score_current_grid()
+        second = game.score_manager.score_current_grid()
+
+        assert second is first
+
+    def test_hands_scored_emitted_once_per_scoring(self, started_game):
+        """hands_scored fires once with all lines; cached re-scores stay silent"""
+        from src.autoload.events import Events
+        game = started_game
+        received = []
+        callback = lambda rows, cols: received.append((rows, cols))
+        Events.connect("hands_scored", callback)
+        try:
+            _, row_hands, col_hands, _ = game.score_manager.score_current_grid()
+            game.score_manager.score_current_grid()
+        finally:
+            Events.disconnect("hands_scored", callback)
+
+        assert received == [(row_hands, col_hands)]
+
+    def test_changed_card_invalidates_cached_result(self, started_game):
+        """Changing any card forces a fresh score"""
+        game = started_game
+
+        first = game.score_manager.score_current_grid()
+        new_rank = '2' if game.state.grid[0][0].card.rank == 'A' else 'A'
+        game.state.grid[0][0].card = CardResource(new_rank, 'H')
+        second = game.score_manager.score_current_grid()
+
+        assert second is not first
+
+    def test_line_cache_matches_fresh_evaluation(self, started_game):
+        """Cached line evaluations match PokerEvaluator for the same cards"""
+        game = started_game
+        cards = game.state.get_row(0)
+
+        fresh = PokerEvaluator.evaluate_hand(cards)
+        first = game.score_manager._evaluate_line(cards)
+        cached = game.score_manager._evaluate_line(cards)
+
+        assert cached is not first
+        assert cached.hand_type == fresh.hand_type
+        assert cached.chips == fresh.chips
+        assert cached.cards == fresh.cards
+
 
 class TestScoringIntegration:
     """Test scoring integration with game flow"""
@@ -2,14 +2,24 @@
 Twin Hands - Terminal UI (PHASE A: Minimal Playable)
 Balatro-inspired UI with clean, information-dense layout.
 Run this to play the game!
+
+Usage:
+    python run.py                 # Twin Hands (default)
+    python run.py --phase grid    # Poker Grid prototype (poker-grid/)
 """
 
-from src.managers.game_manager import GameManager
-from src.resources.twin_hands_config_resource import TwinHandsConfig
-from src.ui.terminal_ui import TerminalUI
+import argparse
+import os
+import sys
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    # Type hints only - game modules are imported lazily by the selected phase
+    from src.managers.game_manager import GameManager
+    from src.ui.terminal_ui import TerminalUI
 
 
-def parse_card_selection(input_str: str, game: GameManager):
+def parse_card_selection(input_str: str, game: 'GameManager'):
     """
     Parse unified card selection with dynamic deck sizes (handles trading).
 
@@ -30,10 +40,10 @@ def parse_card_selection(input_str: str, game: GameManager):
         if ' ' in input_str or ',' in input_str:
             # Split by spaces and/or commas
             parts = input_str.replace(',', ' ').split()
-            card_nums = [int(p) for p in parts]
+            card_nums = list(map(int, parts))
         else:
             # Parse as individual digits (for convenience: "123" = [1,2,3])
-            card_nums = [int(c) for c in input_str if c.isdigit()]
+            card_nums = list(map(int, filter(str.isdigit, input_str)))
 
         if not card_nums:
             return None
@@ -48,30 +58,28 @@ def parse_card_selection(input_str: str, game: GameManager):
                 index_to_deck_card[unified_idx] = (deck_idx, card_idx)
                 unified_idx += 1
 
-        # Map user input to (deck, card) pairs
-        selections = []
+        # Map user input to parallel deck / card index lists
+        selected_decks = []
+        card_indices = []
         for card_num in card_nums:
             if card_num not in index_to_deck_card:
                 return None  # Invalid card number
-            selections.append(index_to_deck_card[card_num])
+            deck_idx, card_idx = index_to_deck_card[card_num]
+            selected_decks.append(deck_idx)
+            card_indices.append(card_idx)
 
-        if not selections:
-            return None
-
-        # All cards must be from same deck
-        first_deck = selections[0][0]
-        if not all(deck == first_deck for deck, _ in selections):
+        # All cards must be from same deck (list.count runs in C)
+        first_deck = selected_decks[0]
+        if selected_decks.count(first_deck) != len(selected_decks):
             return None  # Mixed decks
 
-        # Extract card indices for that deck
-        card_indices = [card_idx for _, card_idx in selections]
         return (first_deck, card_indices, len(card_nums))
 
     except (ValueError, IndexError, KeyError):
         return None
 
 
-def play_round(game: GameManager, ui: TerminalUI):
+def play_round(game: 'GameManager', ui: 'TerminalUI'):
     """Play one round with Balatro-style UI (GDD v6.1: with Trading)."""
     game.start_game()
 
@@ -104,7 +112,7 @@ def play_round(game: GameManager, ui: TerminalUI):
             for hand_type in ui.available_hand_types:
                 print(f"    {ui.GRAY}•{ui.RESET} {hand_type}")
             print()
-            input("Press Enter to continue...")
+            ui.wait_ack(timeout=5.0)
             continue
 
         # Handle filter toggle command - "f1 Flush", "f2 Pair", etc.
@@ -114,7 +122,7 @@ def play_round(game: GameManager, ui: TerminalUI):
                 parts = user_input[1:].split(maxsplit=1)
                 if len(parts) != 2:
                     ui.display_error("Invalid filter command. Use format: f<deck> <type> (e.g., 'f1 Flush')")
-                    input("\nPress Enter to continue...")
+                    ui.wait_ack()
                     continue
 
                 deck_num = int(parts[0])
@@ -123,7 +131,7 @@ def play_round(game: GameManager, ui: TerminalUI):
                 # Validate deck number
                 if deck_num < 1 or deck_num > game.config.num_decks:
                     ui.display_error(f"Invalid deck number. Use 1-{game.config.num_decks}")
-                    input("\nPress Enter to continue...")
+                    ui.wait_ack()
                     continue
 
                 # Find matching hand type (case-insensitive, partial match)
@@ -136,7 +144,7 @@ def play_round(game: GameManager, ui: TerminalUI):
 
                 if hand_type is None:
                     ui.display_error(f"Unknown hand type: '{hand_type_input}'. Use 'filters' to see available types.")
-                    input("\nPress Enter to continue...")
+                    ui.wait_ack()
                     continue
 
                 # Toggle the filter
@@ -147,12 +155,12 @@ def play_round(game: GameManager, ui: TerminalUI):
                 status = f"{ui.GREEN}enabled{ui.RESET}" if enabled else f"{ui.GRAY}disabled{ui.RESET}"
                 print(f"\n  {ui.CYAN}{ui.BOLD}[FILTER TOGGLED]{ui.RESET}")
                 print(f"  {ui.GRAY}Deck {deck_num} - {hand_type}: {status}{ui.RESET}\n")
-                input("Press Enter to continue...")
+                ui.wait_ack()
                 continue
 
             except (ValueError, IndexError) as e:
                 ui.display_error(f"Error toggling filter - {e}")
-                input("\nPress Enter to continue...")
+                ui.wait_ack()
                 continue
 
         # Handle discard command - accepts "d123", "d 123", "discard 123"
@@ -162,29 +170,21 @@ def play_round(game: GameManager, ui: TerminalUI):
                 # Not a discard command, fall through
                 pass
             else:
-                # Extract card numbers after "discard" or "d"
-                if user_input.startswith("discard"):
-                    if len(user_input) > 7 and user_input[7] == ' ':
-                        discard_input = user_input[8:].strip()  # "discard 123"
-                    else:
-                        discard_input = user_input[7:].strip()  # "discard123"
-                elif user_input.startswith("d"):
-                    if len(user_input) > 1 and user_input[1] == ' ':
-                        discard_input = user_input[2:].strip()  # "d 123"
-                    else:
-                        discard_input = user_input[1:].strip()  # "d123"
+                # Extract card numbers after "discard" or "d" ("discard 123", "d123", "d 123")
+                prefix_len = 7 if user_input[:7] == "discard" else 1
+                discard_input = user_input[prefix_len:].strip()
 
                 # Skip if it's just "d" or "discard" with no cards
                 if not discard_input:
                     ui.display_error("Invalid discard. Enter card numbers (e.g., 'd123' or 'd 10 11')")
-                    input("\nPress Enter to continue...")
+                    ui.wait_ack()
                     continue
 
                 parsed = parse_card_selection(discard_input, game)
 
                 if parsed is None:
                     ui.display_error("Invalid discard. Enter 1-5 cards from ONE deck (e.g., 'd123' or 'd 10 11')")
-                    input("\nPress Enter to continue...")
+                    ui.wait_ack()
                     continue
 
                 deck_index, card_indices, num_cards = parsed
@@ -192,7 +192,7 @@ def play_round(game: GameManager, ui: TerminalUI):
                 # Validate 1-5 cards
                 if num_cards < 1 or num_cards > 5:
                     ui.display_error(f"Can only discard 1-5 cards (you selected {num_cards})")
-                    input("\nPress Enter to continue...")
+                    ui.wait_ack()
                     continue
 
                 try:
@@ -201,42 +201,34 @@ def play_round(game: GameManager, ui: TerminalUI):
                     if result["success"]:
                         print(f"\n  {ui.YELLOW}{ui.BOLD}[DISCARDED!]{ui.RESET}")
                         print(f"  {ui.GRAY}Discarded {result['num_cards']} card{'s' if result['num_cards'] > 1 else ''} from Deck {deck_index + 1}{ui.RESET}\n")
-                        input("Press Enter to continue...")
+                        ui.wait_ack()
                     else:
-                        ui.display_error(result["error"])
-                        input("\nPress Enter to continue...")
+                        ui.display_error(result["error"].describe(result))
+                        ui.wait_ack()
 
                 except (ValueError, IndexError) as e:
                     ui.display_error(f"Error discarding cards - {e}")
-                    input("\nPress Enter to continue...")
+                    ui.wait_ack()
 
                 continue
 
         # Handle trade command (PHASE B) - accepts "t123", "t 123", "trade 123"
-        if user_input.startswith("trade") or user_input.startswith("t"):
-            # Extract card numbers after "trade" or "t"
-            if user_input.startswith("trade"):
-                if len(user_input) > 5 and user_input[5] == ' ':
-                    trade_input = user_input[6:].strip()  # "trade 123"
-                else:
-                    trade_input = user_input[5:].strip()  # "trade123"
-            elif user_input.startswith("t"):
-                if len(user_input) > 1 and user_input[1] == ' ':
-                    trade_input = user_input[2:].strip()  # "t 123"
-                else:
-                    trade_input = user_input[1:].strip()  # "t123"
+        if user_input[:1] == "t":
+            # Extract card numbers after "trade" or "t" ("trade 123", "t123", "t 123")
+            prefix_len = 5 if user_input[:5] == "trade" else 1
+            trade_input = user_input[prefix_len:].strip()
 
             # Skip if it's just "t" or "trade" with no cards
             if not trade_input:
                 ui.display_error("Invalid trade. Enter card numbers (e.g., 't123' or 't 10 11')")
-                input("\nPress Enter to continue...")
+                ui.wait_ack()
                 continue
 
             parsed = parse_card_selection(trade_input, game)
 
             if parsed is None:
                 ui.display_error("Invalid trade. Enter 1 card number (e.g., 't1' or 't 10')")
-                input("\nPress Enter to continue...")
+                ui.wait_ack()
                 continue
 
             source_deck, card_indices, num_cards = parsed
@@ -244,7 +236,7 @@ def play_round(game: GameManager, ui: TerminalUI):
             # GDD v6.1: Only 1 card per trade
             if num_cards != 1:
                 ui.display_error(f"Can only trade 1 card at a time (GDD v6.1). You selected {num_cards} cards.")
-                input("\nPress Enter to continue...")
+                ui.wait_ack()
                 continue
 
             # Determine target deck (simple: trade to opposite deck)
@@ -255,14 +247,14 @@ def play_round(game: GameManager, ui: TerminalUI):
 
                 if result["success"]:
                     ui.display_trade_result(1, source_deck)
-                    input("\nPress Enter to continue...")
+                    ui.wait_ack()
                 else:
                     ui.display_error(result["error"])
-                    input("\nPress Enter to continue...")
+                    ui.wait_ack()
 
             except (ValueError, IndexError) as e:
                 ui.display_error(f"Error trading card - {e}")
-                input("\nPress Enter to continue...")
+                ui.wait_ack()
 
             continue
 
@@ -270,14 +262,14 @@ def play_round(game: GameManager, ui: TerminalUI):
         # Allow: "123", "10 11 12", "10,11,12"
         if not all(c.isdigit() or c in ' ,' for c in user_input):
             ui.display_error("Invalid input. Enter only card numbers (e.g., '123' or '10 11 12')")
-            input("\nPress Enter to continue...")
+            ui.wait_ack()
             continue
 
         parsed = parse_card_selection(user_input, game)
 
         if parsed is None:
             ui.display_error("Invalid selection. Enter 1-4 cards from ONE deck (e.g., '123' or '10 11')")
-            input("\nPress Enter to continue...")
+            ui.wait_ack()
             continue
 
         deck_index, card_indices, num_cards = parsed
@@ -285,7 +277,7 @@ def play_round(game: GameManager, ui: TerminalUI):
         # Validate 1-5 cards (GDD v6.1 4-7)
         if num_cards < 1 or num_cards > 5:
             ui.display_error(f"Can only play 1-5 cards per hand (you selected {num_cards})")
-            input("\nPress Enter to continue...")
+            ui.wait_ack()
             continue
 
         try:
@@ -303,17 +295,17 @@ def play_round(game: GameManager, ui: TerminalUI):
                     print(f"  {ui.GREEN}{ui.BOLD}[QUOTA REACHED!]{ui.RESET}")
                     print(f"  {ui.GRAY}Score: {current_score:,} / {quota:,}{ui.RESET}")
                     print(f"  {ui.GRAY}Round ending automatically (GDD 4-6)...{ui.RESET}\n")
-                    input("Press Enter to continue...")
+                    ui.wait_ack()
                     break  # End round immediately
 
-                input("\nPress Enter to continue...")
+                ui.wait_ack()
             else:
                 ui.display_error(result["error"])
-                input("\nPress Enter to continue...")
+                ui.wait_ack()
 
         except (ValueError, IndexError) as e:
             ui.display_error(f"Error playing hand - {e}")
-            input("\nPress Enter to continue...")
+            ui.wait_ack()
 
     # Round over - display results
     final_score = game.calculate_round_score()
@@ -323,8 +315,12 @@ def play_round(game: GameManager, ui: TerminalUI):
     ui.display_round_end(final_score, quota, success)
 
 
-def main():
-    """Main entry point."""
+def _play_twin_hands():
+    """Play Twin Hands (this project's src/ package)."""
+    from src.managers.game_manager import GameManager
+    from src.resources.twin_hands_config_resource import TwinHandsConfig
+    from src.ui.terminal_ui import TerminalUI
+
     config = TwinHandsConfig()
     game = GameManager(config)
     ui = TerminalUI(game)
@@ -362,5 +358,35 @@ def main():
     print(f"{ui.GRAY}Coming soon: Discard system, Hand highlighting, Jokers, Shop, 8-round progression!{ui.RESET}\n")
 
 
+def _play_grid():
+    """
+    Play the Poker Grid prototype.
+    poker-grid/ ships its own src/ package, so it must be put on sys.path
+    before anything from this project's src/ has been imported.
+    """
+    import runpy
+
+    grid_root = os.path.join(os.path.dirname(os.path.abspath(__file__)), "poker-grid")
+    sys.path.insert(0, grid_root)
+    runpy.run_path(os.path.join(grid_root, "run.py"), run_name="__main__")
+
+
+def main():
+    """Main entry point - dispatch to the selected game without loading the other."""
+    parser = argparse.ArgumentParser(description="Twin Hands / Poker Grid prototypes")
+    parser.add_argument(
+        "--phase",
+        choices=["twin", "grid"],
+        default="twin",
+        help="twin = Twin Hands (default), grid = Poker Grid"
+    )
+    args = parser.parse_args()
+
+    if args.phase == "grid":
+        _play_grid()
+    else:
+        _play_twin_hands()
+
+
 if __name__ == "__main__":
     main()
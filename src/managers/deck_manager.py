@@ -49,6 +49,7 @@ class DeckManager:
         num_decks = self.config.num_decks
         cards_per_deck = 52 // num_decks  # 26 for 2 decks
         visible_count = self.config.visible_cards_per_deck  # 7 in v6.1
+        decks = self.state.decks
 
         for i in range(num_decks):
             # Get this deck's cards
@@ -59,16 +60,17 @@ class DeckManager:
             # Deal initial visible cards (GDD v6.1: 7 cards)
             visible_cards = deck_cards[:visible_count]
             draw_pile = deck_cards[visible_count:]
+            draw_pile.reverse()  # Top of the draw pile is the tail (O(1) pop)
 
             # Create DeckResource (GDD v6.1 deckbuilder model)
             deck = DeckResource(
-                draw_pile=list(draw_pile),
+                draw_pile=draw_pile,  # Slices are already fresh lists
                 discard_pile=[],  # Empty at start
-                visible_cards=list(visible_cards)
+                visible_cards=visible_cards
             )
 
             # Store in state
-            self.state.decks[i] = deck
+            decks[i] = deck
 
     def draw_cards(self, deck_index: int, count: int) -> None:
         """
@@ -84,16 +86,27 @@ class DeckManager:
             count: Number of cards to draw
         """
         deck = self.state.decks[deck_index]
+        self._draw_into(deck, deck.visible_cards, count)
 
-        for _ in range(count):
+    @staticmethod
+    def _draw_into(deck: DeckResource, visible: List[CardResource], count: int) -> None:
+        """
+        Move up to count cards from the top (tail) of deck's draw pile to visible.
+        Takes whole slices, reshuffling the discard pile only when the draw pile runs out.
+        """
+        while count > 0:
             # If draw pile empty, shuffle discard pile (GDD v6.1 4-2)
             if not deck.draw_pile:
                 deck.shuffle_discard_into_draw()
+                if not deck.draw_pile:
+                    return  # Nothing left to draw
 
-            # Draw from draw pile (if available)
-            if deck.draw_pile:
-                card = deck.draw_pile.pop(0)  # Draw from top
-                deck.visible_cards.append(card)
+            draw_pile = deck.draw_pile
+            take = min(count, len(draw_pile))
+            # Top card first, matching repeated pop() from the tail
+            visible.extend(draw_pile[:-take - 1:-1])
+            del draw_pile[-take:]
+            count -= take
 
     def discard_to_pile(self, deck_index: int, cards: List[CardResource]) -> None:
         """
@@ -106,3 +119,32 @@ class DeckManager:
         """
         deck = self.state.decks[deck_index]
         deck.discard_pile.extend(cards)
+
+    def play_and_refill(self, deck_index: int, card_indices: List[int]) -> List[CardResource]:
+        """
+        GDD v6.1 4-2: Remove cards from visible cards, discard them, then redraw.
+        Fuses the remove → discard_to_pile → draw_cards sequence used by both
+        playing and discarding into a single pass.
+
+        Args:
+            deck_index: Which deck the cards come from (0-indexed)
+            card_indices: Indices of cards in visible_cards to remove
+
+        Returns:
+            Removed cards (in visible_cards order)
+        """
+        deck = self.state.decks[deck_index]
+        visible = deck.visible_cards
+
+        # Split visible cards by an index bitmask instead of per-index pop() (no tail shifting)
+        mask = 0
+        for i in card_indices:
+            mask |= 1 << i
+        removed = [card for j, card in enumerate(visible) if mask >> j & 1]
+        visible[:] = [card for j, card in enumerate(visible) if not mask >> j & 1]
+        deck.discard_pile.extend(removed)
+
+        # Redraw one card per removed card (auto-reshuffle if draw pile empty)
+        self._draw_into(deck, visible, len(removed))
+
+        return removed
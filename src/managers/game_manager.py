@@ -3,7 +3,9 @@ GameManager - Main game orchestration logic.
 In Godot: extends Node
 """
 
-from typing import List, Dict, Any
+from enum import IntEnum
+from types import MappingProxyType
+from typing import List, Dict, Any, Mapping, Optional
 from src.resources.twin_hands_config_resource import TwinHandsConfig
 from src.resources.twin_hands_state_resource import TwinHandsState
 from src.resources.card_resource import CardResource
@@ -14,6 +16,44 @@ from src.managers.scoring_manager import ScoringManager
 from src.managers.trade_manager import TradeManager
 
 
+class PlayError(IntEnum):
+    """
+    Failure codes returned in result["error"] by GameManager actions.
+    str() gives the player-facing message, so text is only built when shown;
+    describe(result) adds per-call details carried in the result dict.
+
+    In Godot: enum PlayError { MAX_HANDS_REACHED = 1, ... }
+    """
+
+    MAX_HANDS_REACHED = 1
+    INVALID_CARD_INDICES = 2
+    NO_DISCARD_TOKENS = 3
+    INVALID_DISCARD_COUNT = 4
+    NO_TRADE_TOKENS = 5
+    SAME_DECK_TRADE = 6
+    EMPTY_SOURCE_DECK = 7
+
+    def __str__(self) -> str:
+        return _PLAY_ERROR_MESSAGES[self]
+
+    def describe(self, result: Dict[str, Any]) -> str:
+        """Full message for a failed result, including details such as the selected count."""
+        if self is PlayError.INVALID_DISCARD_COUNT:
+            return f"{self} (you selected {result['num_cards']})"
+        return str(self)
+
+
+_PLAY_ERROR_MESSAGES: Dict[PlayError, str] = {
+    PlayError.MAX_HANDS_REACHED: "Cannot play hand: Max hands per deck reached (GDD v6.1: max 2)",
+    PlayError.INVALID_CARD_INDICES: "Invalid card indices",
+    PlayError.NO_DISCARD_TOKENS: "No discard tokens remaining (GDD v6.1: 3 per round)",
+    PlayError.INVALID_DISCARD_COUNT: "Can only discard 1-5 cards",
+    PlayError.NO_TRADE_TOKENS: "No trade tokens remaining (GDD v6.1: 2 per round)",
+    PlayError.SAME_DECK_TRADE: "Cannot trade to same deck",
+    PlayError.EMPTY_SOURCE_DECK: "Source deck has no visible cards",
+}
+
+
 class GameManager:
     """
     Main game orchestrator (PHASE A: basic game flow).
@@ -37,10 +77,18 @@ class GameManager:
         self.deck_manager = DeckManager(config, self.state)
         self.token_manager = TokenManager(config, self.state)
         self.scoring_manager = ScoringManager(config, self.state)
-        self.trade_manager = TradeManager(config, self.state)  # PHASE B
+        self.trade_manager = TradeManager(config, self.state, self.deck_manager)  # PHASE B
+
+        # Track hands played this round (preallocated: at most max_hands_per_deck per deck)
+        self._max_hands = config.num_decks * config.max_hands_per_deck
+        self._hands_played: List[Optional[HandResource]] = [None] * self._max_hands
+        self._hands_count: int = 0
+        self._round_score_cache: int = 0  # Running total of _hands_played scores
 
-        # Track hands played this round
-        self._hands_played: List[HandResource] = []
+        # UI summary: one dict updated in place, exposed read-only
+        self._state_summary: Dict[str, Any] = {}
+        self._state_summary_view: Mapping[str, Any] = MappingProxyType(self._state_summary)
+        self._refresh_state_summary()
 
     def start_game(self) -> None:
         """
@@ -51,6 +99,12 @@ class GameManager:
         # Split deck and draw initial cards
         self.deck_manager.split_deck()
 
+        # Reset round tracking
+        self._hands_played = [None] * self._max_hands
+        self._hands_count = 0
+        self._round_score_cache = 0
+        self._refresh_state_summary()
+
     def play_hand(self, deck_index: int, card_indices: List[int]) -> Dict[str, Any]:
         """
         Play a hand from the specified deck.
@@ -63,46 +117,47 @@ class GameManager:
             Dict with:
                 - success: bool (True if hand played successfully)
                 - hand: HandResource (if success)
-                - error: str (if failure)
+                - error: PlayError (if failure; str() for message)
         """
-        # Validate can play hand (GDD v6.1: unlimited hands, but max 2 per deck)
-        if not self.token_manager.can_play_hand(deck_index):
+        # Get cards from visible_cards
+        visible = self.state.decks[deck_index].visible_cards
+        num_visible = len(visible)
+        # Range/duplicate-check up front: play_and_refill's bitmask would wrap negative
+        # indices and merge repeated ones
+        if len(set(card_indices)) != len(card_indices) or not all(0 <= i < num_visible for i in card_indices):
+            # Max-hands error still takes precedence over bad indices
+            if not self.token_manager.can_play_hand(deck_index):
+                return {
+                    "success": False,
+                    "error": PlayError.MAX_HANDS_REACHED
+                }
             return {
                 "success": False,
-                "error": "Cannot play hand: Max hands per deck reached (GDD v6.1: max 2)"
+                "error": PlayError.INVALID_CARD_INDICES
             }
+        cards = [visible[i] for i in card_indices]
 
-        # Get cards from visible_cards
-        deck = self.state.decks[deck_index]
-        try:
-            cards = [deck.visible_cards[i] for i in card_indices]
-        except IndexError:
+        # Validate and record in one step (GDD v6.1: unlimited hands, but max 2 per deck)
+        if not self.token_manager.record_hand_played(deck_index):
             return {
                 "success": False,
-                "error": "Invalid card indices"
+                "error": PlayError.MAX_HANDS_REACHED
             }
 
         # Evaluate hand
         hand = self.scoring_manager.evaluate_hand(cards)
 
-        # Record hand played (GDD v6.1: no token spending, just tracking)
-        self.token_manager.record_hand_played(deck_index)
-
-        # Remove played cards from visible_cards
-        # Sort indices in reverse to avoid index shifting
-        played_cards = []
-        for i in sorted(card_indices, reverse=True):
-            played_cards.append(deck.visible_cards.pop(i))
-
-        # Move played cards to discard pile (GDD v6.1 deckbuilder model)
-        self.deck_manager.discard_to_pile(deck_index, played_cards)
-
-        # Draw replacement cards (GDD v6.1: redraw from draw pile, auto-reshuffle if empty)
-        num_to_draw = len(card_indices)
-        self.deck_manager.draw_cards(deck_index, num_to_draw)
+        # Move played cards to discard pile and redraw (GDD v6.1 deckbuilder model)
+        self.deck_manager.play_and_refill(deck_index, card_indices)
 
         # Track hand for scoring
-        self._hands_played.append(hand)
+        if self._hands_count < self._max_hands:
+            self._hands_played[self._hands_count] = hand
+        else:
+            self._hands_played.append(hand)  # Safety: config changed mid-round
+        self._hands_count += 1
+        self._round_score_cache += hand.base_score
+        self._refresh_state_summary()
 
         return {
             "success": True,
@@ -123,47 +178,38 @@ class GameManager:
         Returns:
             Dict with:
                 - success: bool (True if discard successful)
-                - error: str (if failure)
+                - num_cards: int (cards discarded, or cards selected on a count error)
+                - error: PlayError (if failure; describe(result) for message)
         """
         # Validate can discard
         if not self.token_manager.can_discard():
             return {
                 "success": False,
-                "error": "No discard tokens remaining (GDD v6.1: 3 per round)"
+                "error": PlayError.NO_DISCARD_TOKENS
             }
 
         # Validate 1-5 cards
         if len(card_indices) < 1 or len(card_indices) > 5:
             return {
                 "success": False,
-                "error": f"Can only discard 1-5 cards (you selected {len(card_indices)})"
+                "error": PlayError.INVALID_DISCARD_COUNT,
+                "num_cards": len(card_indices)
             }
 
-        # Get cards from visible_cards
-        deck = self.state.decks[deck_index]
-        try:
-            cards = [deck.visible_cards[i] for i in card_indices]
-        except IndexError:
+        # Validate card indices
+        num_visible = len(self.state.decks[deck_index].visible_cards)
+        if len(set(card_indices)) != len(card_indices) or not all(0 <= i < num_visible for i in card_indices):
             return {
                 "success": False,
-                "error": "Invalid card indices"
+                "error": PlayError.INVALID_CARD_INDICES
             }
 
-        # Remove discarded cards from visible_cards
-        # Sort indices in reverse to avoid index shifting
-        discarded_cards = []
-        for i in sorted(card_indices, reverse=True):
-            discarded_cards.append(deck.visible_cards.pop(i))
-
-        # Move discarded cards to discard pile (GDD v6.1 deckbuilder model)
-        self.deck_manager.discard_to_pile(deck_index, discarded_cards)
-
-        # Draw replacement cards (GDD v6.1: redraw from draw pile, auto-reshuffle if empty)
-        num_to_draw = len(card_indices)
-        self.deck_manager.draw_cards(deck_index, num_to_draw)
+        # Move discarded cards to discard pile and redraw (GDD v6.1 deckbuilder model)
+        self.deck_manager.play_and_refill(deck_index, card_indices)
 
         # Spend discard token
         self.token_manager.spend_discard_token()
+        self._refresh_state_summary()
 
         return {
             "success": True,
@@ -184,17 +230,17 @@ class GameManager:
         Returns:
             Dict with:
                 - success: bool (True if trade successful)
-                - error: str (if failure)
+                - error: PlayError (if failure; str() for message)
         """
         # Validate trade
         if not self.trade_manager.can_trade(source_deck, target_deck):
             # Determine error reason
             if self.state.trade_tokens <= 0:
-                error = "No trade tokens remaining (GDD v6.1: 2 per round)"
+                error = PlayError.NO_TRADE_TOKENS
             elif source_deck == target_deck:
-                error = "Cannot trade to same deck"
+                error = PlayError.SAME_DECK_TRADE
             else:
-                error = "Source deck has no visible cards"
+                error = PlayError.EMPTY_SOURCE_DECK
 
             return {
                 "success": False,
@@ -203,6 +249,7 @@ class GameManager:
 
         # Execute trade (GDD v6.1: 1 card only)
         success = self.trade_manager.trade_card(source_deck, target_deck, card_index)
+        self._refresh_state_summary()
 
         return {
             "success": success
@@ -212,11 +259,21 @@ class GameManager:
         """
         Calculate total score for the round.
         PHASE A: Simple sum of all hand scores (no Jokers).
+        Kept as a running total updated in play_hand (O(1) per call).
 
         Returns:
             Total score
         """
-        return self.scoring_manager.calculate_total_score(self._hands_played)
+        return self._round_score_cache
+
+    def get_hands_played(self) -> List[HandResource]:
+        """
+        Get hands played this round, in play order.
+
+        Returns:
+            List of HandResource objects
+        """
+        return self._hands_played[:self._hands_count]
 
     def get_visible_cards(self, deck_index: int) -> List[CardResource]:
         """
@@ -230,18 +287,26 @@ class GameManager:
         """
         return self.state.decks[deck_index].visible_cards
 
-    def get_game_state_summary(self) -> Dict[str, Any]:
+    def get_game_state_summary(self) -> Mapping[str, Any]:
         """
         Get current game state summary for UI.
+        Returns the same read-only view every call. It is refreshed in place
+        here (covering direct token_manager/state edits) and after every game
+        action, so a view held across actions stays current too.
 
         Returns:
-            Dict with game state info
+            Read-only mapping with game state info
         """
-        return {
-            "round": self.state.current_round,
-            "discard_tokens": self.state.discard_tokens,  # GDD v6.1
-            "trade_tokens": self.state.trade_tokens,      # GDD v6.1
-            "hands_played_per_deck": self.state.hands_played_per_deck,
-            "hands_this_round": len(self._hands_played),
-            "current_score": self.calculate_round_score()
-        }
+        self._refresh_state_summary()
+        return self._state_summary_view
+
+    def _refresh_state_summary(self) -> None:
+        """Update the UI summary dict in place from state."""
+        self._state_summary.update(
+            round=self.state.current_round,
+            discard_tokens=self.state.discard_tokens,  # GDD v6.1
+            trade_tokens=self.state.trade_tokens,      # GDD v6.1
+            hands_played_per_deck=self.state.hands_played_per_deck,
+            hands_this_round=self._hands_count,
+            current_score=self._round_score_cache,
+        )
@@ -3,13 +3,30 @@ ScoringManager - Logic for hand evaluation and scoring.
 In Godot: extends Node
 """
 
-from typing import List
-from collections import Counter
-from src.resources.twin_hands_config_resource import TwinHandsConfig
+import hashlib
+import os
+import pickle
+import sys
+from itertools import combinations_with_replacement
+from pathlib import Path
+from typing import Dict, List, Optional
+from operator import attrgetter
+from src.resources.twin_hands_config_resource import HAND_SCORES, RANK_VALUES, TwinHandsConfig
 from src.resources.twin_hands_state_resource import TwinHandsState
 from src.resources.card_resource import CardResource
 from src.resources.hand_resource import HandResource
 
+_base_score = attrgetter("base_score")
+
+# Bit 0 of each of the 13 per-rank nibbles in CardResource.rank_nibble sums
+_NIBBLE_BIT0 = sum(1 << (4 * i) for i in range(13))
+
+# Runs of 2-4 consecutive rank bits (bit 0 = A low ... bit 12 = K, bit 13 = A high)
+_STRAIGHT_MASKS = frozenset(
+    ((1 << length) - 1) << low for length in (2, 3, 4) for low in range(14 - length + 1)
+)
+_ROYAL_MASK = 0b1111 << 10  # J, Q, K, A (high)
+
 
 class ScoringManager:
     """
@@ -46,15 +63,22 @@ class ScoringManager:
             # Invalid hand
             return HandResource(cards=cards, hand_type="Invalid", base_score=0)
 
-        # Get hand type and base score
-        hand_type = self._determine_hand_type(cards)
-        base_score = self.config.HAND_SCORES.get(hand_type, 0)
+        # Get hand type from the precomputed table (key: rank counters + flush bit)
+        rank_nibbles = 0
+        suit_or = 0
+        for card in cards:
+            rank_nibbles += card.rank_nibble
+            suit_or |= card.suit_bit
+        hand_type = _HAND_LUT[rank_nibbles << 1 | (suit_or & (suit_or - 1) == 0)]
+        base_score = HAND_SCORES.get(hand_type, 0)
 
         return HandResource(cards=cards, hand_type=hand_type, base_score=base_score)
 
-    def _determine_hand_type(self, cards: List[CardResource]) -> str:
+    @staticmethod
+    def _determine_hand_type(cards: List[CardResource]) -> str:
         """
         Determine poker hand type for 1-4 cards (GDD 4-7).
+        Reference rules; evaluate_hand reads the _HAND_LUT built from this.
 
         Args:
             cards: List of 1-4 cards
@@ -64,26 +88,40 @@ class ScoringManager:
         """
         num_cards = len(cards)
 
-        # Count ranks and suits
-        ranks = [card.rank for card in cards]
-        suits = [card.suit for card in cards]
-        rank_counts = Counter(ranks)
-        suit_counts = Counter(suits)
-
-        # Check for same suit (Flush potential)
-        is_flush = len(suit_counts) == 1
-
-        # Check for sequential ranks (Straight potential)
-        is_straight = self._is_sequential(cards)
+        # Fold cards into bitmasks: rank set, suit set, and per-rank 4-bit counters
+        rank_or = 0
+        suit_or = 0
+        rank_nibbles = 0
+        for card in cards:
+            rank_or |= card.rank_bit
+            suit_or |= card.suit_bit
+            rank_nibbles += card.rank_nibble
+
+        # Check for same suit (Flush potential): exactly one suit bit set
+        is_flush = suit_or & (suit_or - 1) == 0
+
+        # Check for sequential ranks (Straight potential): distinct ranks forming one
+        # run, with A low (bit 0) or high (moved to bit 13)
+        rank_or_ace_high = (rank_or & ~1) | ((rank_or & 1) << 13)
+        is_straight = rank_or.bit_count() == num_cards and (
+            rank_or in _STRAIGHT_MASKS or rank_or_ace_high in _STRAIGHT_MASKS
+        )
+
+        # Rank multiplicities, one bit per rank: count 4 / count 3 / count 2
+        ones = rank_nibbles & _NIBBLE_BIT0
+        twos = (rank_nibbles >> 1) & _NIBBLE_BIT0
+        has_four = (rank_nibbles >> 2) & _NIBBLE_BIT0 != 0
+        has_three = twos & ones != 0
+        pair_count = (twos & ~ones).bit_count()
 
         # 4-card hands
         if num_cards == 4:
             # Four of a Kind
-            if max(rank_counts.values()) == 4:
+            if has_four:
                 return "Four of a Kind"
 
             # Royal Flush (A-K-Q-J same suit)
-            if is_flush and is_straight and self._is_royal(cards):
+            if is_flush and is_straight and rank_or_ace_high == _ROYAL_MASK:
                 return "Royal Flush"
 
             # Straight Flush
@@ -99,11 +137,11 @@ class ScoringManager:
                 return "Straight"
 
             # Two Pair
-            if list(rank_counts.values()).count(2) == 2:
+            if pair_count == 2:
                 return "Two Pair"
 
-            # Pair
-            if max(rank_counts.values()) == 2:
+            # Pair (highest count exactly 2)
+            if pair_count and not has_three:
                 return "Pair"
 
             # High Card
@@ -112,7 +150,7 @@ class ScoringManager:
         # 3-card hands
         if num_cards == 3:
             # Three of a Kind
-            if max(rank_counts.values()) == 3:
+            if has_three:
                 return "Three of a Kind"
 
             # Straight
@@ -120,7 +158,7 @@ class ScoringManager:
                 return "Straight"
 
             # Pair
-            if max(rank_counts.values()) == 2:
+            if pair_count:
                 return "Pair"
 
             # High Card
@@ -129,7 +167,7 @@ class ScoringManager:
         # 2-card hands
         if num_cards == 2:
             # Pair
-            if max(rank_counts.values()) == 2:
+            if pair_count:
                 return "Pair"
 
             # Straight (2 sequential cards)
@@ -142,41 +180,6 @@ class ScoringManager:
         # 1-card hand
         return "High Card"
 
-    def _is_sequential(self, cards: List[CardResource]) -> bool:
-        """Check if cards form a sequential straight."""
-        if len(cards) < 2:
-            return False
-
-        # Define rank order (A can be high or low)
-        rank_order = ["A", "2", "3", "4", "5", "6", "7", "8", "9", "10", "J", "Q", "K", "A"]
-
-        # Get rank indices
-        indices = []
-        for card in cards:
-            # Get all possible indices for this rank (A appears twice)
-            card_indices = [i for i, r in enumerate(rank_order) if r == card.rank]
-            indices.append(card_indices)
-
-        # Try to find a sequential pattern
-        # For now, simple check: sort by first occurrence
-        first_indices = [idx_list[0] for idx_list in indices]
-        sorted_indices = sorted(first_indices)
-
-        # Check if consecutive
-        for i in range(len(sorted_indices) - 1):
-            if sorted_indices[i + 1] - sorted_indices[i] != 1:
-                return False
-
-        return True
-
-    def _is_royal(self, cards: List[CardResource]) -> bool:
-        """Check if cards are A-K-Q-J (Royal Flush)."""
-        if len(cards) != 4:
-            return False
-
-        ranks = set(card.rank for card in cards)
-        return ranks == {"A", "K", "Q", "J"}
-
     def calculate_total_score(self, hands: List[HandResource]) -> int:
         """
         Calculate total score from all hands (PHASE A: simple sum).
@@ -187,4 +190,75 @@ class ScoringManager:
         Returns:
             Total score (sum of base_scores)
         """
-        return sum(hand.base_score for hand in hands)
+        return sum(map(_base_score, hands))
+
+
+def _build_hand_lut() -> Dict[int, str]:
+    """
+    Run _determine_hand_type once for every 1-4 card rank multiset, suited and not.
+    Key: sum of card rank_nibble values << 1 | flush bit (a hand type depends only on these).
+    """
+    ranks = tuple(RANK_VALUES)
+    lut: Dict[int, str] = {}
+    for num_cards in range(1, 5):
+        for combo in combinations_with_replacement(ranks, num_cards):
+            for is_flush in (True, False):
+                if not is_flush and num_cards == 1:
+                    continue  # A single card is always one suit
+                suits = ("hearts",) * num_cards if is_flush else ("hearts", "spades") * 2
+                cards = [CardResource(rank=rank, suit=suit) for rank, suit in zip(combo, suits)]
+                key = sum(card.rank_nibble for card in cards) << 1 | is_flush
+                lut[key] = ScoringManager._determine_hand_type(cards)
+    return lut
+
+
+# Optional on-disk copy of the LUT. Opt-in only: set TWIN_HANDS_LUT_CACHE to a
+# file path you own. Unset (the default), the ~20 ms build runs on every import
+# and nothing is read from or written to disk.
+_HAND_LUT_CACHE_ENV = "TWIN_HANDS_LUT_CACHE"
+
+
+def _hand_lut_digest() -> str:
+    """Digest of every source the LUT depends on (evaluator + card encodings + ranks)."""
+    digest = hashlib.blake2b(digest_size=16)
+    for module_name in (__name__, CardResource.__module__, TwinHandsConfig.__module__):
+        digest.update(Path(sys.modules[module_name].__file__).read_bytes())
+    return digest.hexdigest()
+
+
+def _load_hand_lut(cache_path: Optional[Path] = None) -> Dict[int, str]:
+    """
+    Build the LUT, or load it from cache_path if that file was built from the
+    current sources. The cache is pickled, so only point it at a file you trust.
+    Writing it back is best effort (a failed write leaves no temp file behind).
+    """
+    if cache_path is None:
+        return _build_hand_lut()
+
+    digest = _hand_lut_digest()
+    try:
+        with open(cache_path, "rb") as cache_file:
+            cached_digest, lut = pickle.load(cache_file)
+        if cached_digest == digest:
+            return lut
+    except (OSError, pickle.UnpicklingError, EOFError, ValueError, TypeError):
+        pass
+
+    lut = _build_hand_lut()
+    tmp_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+    try:
+        with open(tmp_path, "wb") as cache_file:
+            pickle.dump((digest, lut), cache_file, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        try:
+            tmp_path.unlink()
+        except OSError:
+            pass
+    return lut
+
+
+# Hand type lookup table, loaded/built once at import (~4.7k entries)
+_cache_env = os.environ.get(_HAND_LUT_CACHE_ENV)
+_HAND_LUT: Dict[int, str] = _load_hand_lut(Path(_cache_env) if _cache_env else None)
+del _cache_env
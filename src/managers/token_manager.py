@@ -3,6 +3,8 @@ TokenManager - Logic for token spending and validation (GDD v6.1).
 In Godot: extends Node
 """
 
+from array import array
+
 from src.resources.twin_hands_config_resource import TwinHandsConfig
 from src.resources.twin_hands_state_resource import TwinHandsState
 
@@ -67,12 +69,14 @@ class TokenManager:
         Side effects:
             - Increments state.hands_played_per_deck[deck_index]
         """
-        # Validate can play
-        if not self.can_play_hand(deck_index):
+        # Validate can play (same check as can_play_hand, inlined)
+        hands_played = self.state.hands_played_per_deck
+        played = hands_played[deck_index]
+        if played >= self.config.max_hands_per_deck:
             return False
 
         # Record hand played
-        self.state.hands_played_per_deck[deck_index] += 1
+        hands_played[deck_index] = played + 1
 
         return True
 
@@ -99,10 +103,12 @@ class TokenManager:
         Side effects:
             - Decrements state.discard_tokens
         """
-        if not self.can_discard():
+        state = self.state
+        tokens = state.discard_tokens
+        if tokens <= 0:
             return False
 
-        self.state.discard_tokens -= 1
+        state.discard_tokens = tokens - 1
         return True
 
     # === TRADE TOKENS (GDD v6.1: 2 per round) ===
@@ -128,10 +134,12 @@ class TokenManager:
         Side effects:
             - Decrements state.trade_tokens
         """
-        if not self.can_trade():
+        state = self.state
+        tokens = state.trade_tokens
+        if tokens <= 0:
             return False
 
-        self.state.trade_tokens -= 1
+        state.trade_tokens = tokens - 1
         return True
 
     # === ROUND MANAGEMENT ===
@@ -144,8 +152,16 @@ class TokenManager:
         Side effects:
             - Resets state.discard_tokens to config value
             - Resets state.trade_tokens to config value
-            - Resets state.hands_played_per_deck to [0, 0, ...]
+            - Resets state.hands_played_per_deck to array('B', [0, 0, ...])
         """
         self.state.discard_tokens = self.config.discard_tokens_per_round
         self.state.trade_tokens = self.config.trade_tokens_per_round
-        self.state.hands_played_per_deck = [0] * self.config.num_decks
+
+        # Zero the existing per-deck counters in place (reallocate only if the
+        # deck count no longer matches)
+        hands_played = self.state.hands_played_per_deck
+        if len(hands_played) == self.config.num_decks:
+            for deck_index in range(len(hands_played)):
+                hands_played[deck_index] = 0
+        else:
+            self.state.hands_played_per_deck = array('B', [0]) * self.config.num_decks
@@ -3,6 +3,9 @@ TradeManager - Logic for trading cards between decks (GDD v6.1).
 In Godot: extends Node
 """
 
+from typing import Optional
+
+from src.managers.deck_manager import DeckManager
 from src.resources.twin_hands_config_resource import TwinHandsConfig
 from src.resources.twin_hands_state_resource import TwinHandsState
 from src.resources.card_resource import CardResource
@@ -23,16 +26,23 @@ class TradeManager:
     In Godot: extends Node
     """
 
-    def __init__(self, config: TwinHandsConfig, state: TwinHandsState):
+    def __init__(
+        self,
+        config: TwinHandsConfig,
+        state: TwinHandsState,
+        deck_manager: Optional[DeckManager] = None
+    ):
         """
         Initialize manager with config and state.
 
         Args:
             config: Game configuration (immutable)
             state: Game state (mutable)
+            deck_manager: DeckManager for source-deck redraws (created if not given)
         """
         self.config = config
         self.state = state
+        self.deck_manager = deck_manager or DeckManager(config, state)
 
     def can_trade(self, source_deck: int, target_deck: int) -> bool:
         """
@@ -50,17 +60,18 @@ class TradeManager:
             - Source deck must have visible cards to give
             - Cannot trade to same deck
         """
-        # Must have trade tokens
-        if self.state.trade_tokens <= 0:
+        # Cannot trade to self (no attribute loads needed)
+        if source_deck == target_deck:
             return False
 
-        # Cannot trade to self
-        if source_deck == target_deck:
+        state = self.state
+
+        # Must have trade tokens
+        if state.trade_tokens <= 0:
             return False
 
         # Source deck must have visible cards
-        source = self.state.decks[source_deck]
-        if len(source.visible_cards) == 0:
+        if not state.decks[source_deck].visible_cards:
             return False
 
         return True
@@ -105,9 +116,7 @@ class TradeManager:
         target.visible_cards.append(traded_card)
 
         # Source deck redraws 1 card (GDD v6.1: stays at 7 baseline)
-        from src.managers.deck_manager import DeckManager
-        deck_mgr = DeckManager(self.config, self.state)
-        deck_mgr.draw_cards(source_deck, 1)
+        self.deck_manager.draw_cards(source_deck, 1)
 
         # Spend trade token
         self.state.trade_tokens -= 1
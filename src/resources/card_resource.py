@@ -4,16 +4,49 @@ Represents a playing card as a custom Resource.
 In Godot: extends Resource
 """
 
-from dataclasses import dataclass
-from typing import ClassVar, Dict
+from dataclasses import dataclass, field
+from typing import ClassVar, Dict, Tuple
 
+from src.resources.twin_hands_config_resource import RANK_VALUE_TABLE
 
-@dataclass
+# Rank/suit bit positions for bitmask hand evaluation (A is low here, like rank_order
+# in ScoringManager; A-high straights are handled by the evaluator)
+_RANK_INDEX: Dict[str, int] = {
+    rank: i for i, rank in enumerate(("A", "2", "3", "4", "5", "6", "7", "8", "9", "10", "J", "Q", "K"))
+}
+_SUIT_INDEX: Dict[str, int] = {
+    "hearts": 0, "diamonds": 1, "clubs": 2, "spades": 3,
+    "H": 0, "D": 1, "C": 2, "S": 3,
+}
+
+# One-byte card code: low 4 bits = rank index (A=0 ... K=12), bits 4-5 = suit index.
+# Decoding uses the canonical long suit names that CardFactory deals.
+_CODE_TO_CARD: Dict[int, Tuple[str, str]] = {
+    rank_idx | suit_idx << 4: (rank, suit)
+    for rank, rank_idx in _RANK_INDEX.items()
+    for suit, suit_idx in (("hearts", 0), ("diamonds", 1), ("clubs", 2), ("spades", 3))
+}
+
+
+def encode_card(rank: str, suit: str) -> int:
+    """Pack a rank/suit pair into its one-byte card code (0-60)."""
+    return _RANK_INDEX[rank] | _SUIT_INDEX[suit] << 4
+
+
+def decode_card(code: int) -> Tuple[str, str]:
+    """Unpack a one-byte card code into (rank, suit)."""
+    return _CODE_TO_CARD[code]
+
+
+@dataclass(frozen=True, slots=True)
 class CardResource:
     """
     Represents a single playing card.
     In Godot, this would extend Resource with @export vars.
 
+    Frozen and slotted: cards are immutable values (hashable by rank and suit)
+    with no per-instance __dict__; replace a card instead of editing it.
+
     GDScript equivalent:
     class_name CardResource
     extends Resource
@@ -42,6 +75,31 @@ class CardResource:
     rank: str  # "2"-"9", "T", "J", "Q", "K", "A"
     suit: str  # "H", "D", "C", "S"
 
+    # Cached integer encodings (computed once in __post_init__, used by ScoringManager
+    # and UI sorting instead of comparing rank/suit strings)
+    rank_idx: int = field(init=False, repr=False, compare=False)     # A=0, 2=1 ... K=12
+    suit_idx: int = field(init=False, repr=False, compare=False)     # hearts/H=0 ... spades/S=3
+    code: int = field(init=False, repr=False, compare=False)         # encode_card(rank, suit)
+    rank_bit: int = field(init=False, repr=False, compare=False)     # 1 << rank index
+    suit_bit: int = field(init=False, repr=False, compare=False)     # 1 << suit index
+    rank_nibble: int = field(init=False, repr=False, compare=False)  # +1 in this rank's 4-bit counter
+
+    def __post_init__(self) -> None:
+        # Frozen dataclass: derived fields are set through object.__setattr__
+        rank_idx = _RANK_INDEX.get(self.rank)
+        if rank_idx is None:
+            raise ValueError(f"Unknown card rank: {self.rank!r}")
+        suit_idx = _SUIT_INDEX.get(self.suit)
+        if suit_idx is None:
+            raise ValueError(f"Unknown card suit: {self.suit!r}")
+        set_field = object.__setattr__
+        set_field(self, "rank_idx", rank_idx)
+        set_field(self, "suit_idx", suit_idx)
+        set_field(self, "code", rank_idx | suit_idx << 4)
+        set_field(self, "rank_bit", 1 << rank_idx)
+        set_field(self, "suit_bit", 1 << suit_idx)
+        set_field(self, "rank_nibble", 1 << (4 * rank_idx))
+
     def get_display_string(self, colored: bool = False) -> str:
         """
         Get display string for the card.
@@ -61,13 +119,15 @@ class CardResource:
             return f"{self.rank}{suit_symbol}"
 
     def get_rank_value(self) -> int:
-        """Returns numeric value for comparison (from config)."""
-        from src.resources.twin_hands_config_resource import TwinHandsConfig
-        return TwinHandsConfig.RANK_VALUES[self.rank]
+        """Returns numeric value for comparison (config RANK_VALUES, via its byte table)."""
+        return RANK_VALUE_TABLE[ord(self.rank[0])]
 
     def duplicate(self) -> 'CardResource':
-        """Create a copy of this card (Resource pattern)."""
-        return CardResource(rank=self.rank, suit=self.suit)
+        """
+        Return a copy of this card (Resource pattern).
+        Cards are immutable, so the card itself is returned.
+        """
+        return self
 
     def __str__(self) -> str:
         return self.get_display_string(colored=True)
@@ -9,13 +9,14 @@ from typing import List, Optional
 import random
 
 
-@dataclass
+@dataclass(slots=True)
 class DeckResource:
     """
     Represents ONE split deck in Twin Hands (GDD v6.1 4-1, 4-2).
 
     Deckbuilder Model (GDD v6.1 4-2):
-    - draw_pile: Cards not yet drawn (26 at start → decreases)
+    - draw_pile: Cards not yet drawn (26 at start → decreases); the top card is
+      the LAST element, so drawing is an O(1) pop() from the tail
     - discard_pile: Played/discarded cards (0 at start → increases)
     - visible_cards: Cards in hand (7 at start → can grow to 8-9 via trades)
 
@@ -57,6 +58,9 @@ class DeckResource:
         if not self.discard_pile:
             return  # Nothing to shuffle
 
+        # Top of the new draw pile is the tail, matching draw_cards() pop().
+        # Swap the two lists and clear the old draw pile in place, so both
+        # list buffers are reused instead of allocating a new discard pile.
         random.shuffle(self.discard_pile)
-        self.draw_pile = self.discard_pile
-        self.discard_pile = []
+        self.draw_pile, self.discard_pile = self.discard_pile, self.draw_pile
+        self.discard_pile.clear()
@@ -38,3 +38,7 @@ class HandResource:
 
     def __str__(self) -> str:
         return self.get_display_string()
+
+    def __repr__(self) -> str:
+        # Minimal: no per-card formatting when hands are logged or shown in asserts
+        return f"HandResource({self.hand_type!r}, {self.base_score})"
@@ -5,7 +5,9 @@ Stores all game configuration values from GDD.
 In Godot: extends Resource with @export variables
 """
 from dataclasses import dataclass, field
-from typing import List
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Mapping, Tuple
 
 
 @dataclass
@@ -61,19 +63,40 @@ class TwinHandsConfig:
     }
 
     @property
-    def round_quotas(self) -> List[int]:
+    def round_quotas(self) -> Tuple[int, ...]:
         """
         Calculate round quotas based on quota_scaling.
         GDD 5-3: Starts at 300, multiplies by 1.3× each round.
 
         Returns:
-            List of quota targets for each round (length = max_rounds)
+            Tuple of quota targets for each round (length = max_rounds),
+            shared between reads while max_rounds/quota_scaling are unchanged
         """
-        quotas = []
-        current_quota = 300  # GDD 5-3: Starting quota
+        return _round_quotas(self.max_rounds, self.quota_scaling)
 
-        for _ in range(self.max_rounds):
-            quotas.append(round(current_quota))
-            current_quota *= self.quota_scaling
 
-        return quotas
+@lru_cache(maxsize=None)
+def _round_quotas(max_rounds: int, quota_scaling: float) -> Tuple[int, ...]:
+    """Quota schedule for (max_rounds, quota_scaling), computed once per pair."""
+    quotas = []
+    current_quota = 300  # GDD 5-3: Starting quota
+
+    for _ in range(max_rounds):
+        quotas.append(round(current_quota))
+        current_quota *= quota_scaling
+
+    return tuple(quotas)
+
+
+# Read-only module-level views of the class tables (one global load instead of
+# self.config.HAND_SCORES, and nothing can mutate them through these names)
+HAND_SCORES: Mapping[str, int] = MappingProxyType(TwinHandsConfig.HAND_SCORES)
+RANK_VALUES: Mapping[str, int] = MappingProxyType(TwinHandsConfig.RANK_VALUES)
+
+# RANK_VALUES as a byte table indexed by ord(rank[0]) ("10" is the only rank
+# starting with "1"), so rank values are read without hashing the rank string
+RANK_VALUE_TABLE = bytearray(128)
+for _rank, _value in TwinHandsConfig.RANK_VALUES.items():
+    RANK_VALUE_TABLE[ord(_rank[0])] = _value
+RANK_VALUE_TABLE = bytes(RANK_VALUE_TABLE)
+del _rank, _value
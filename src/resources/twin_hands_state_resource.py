@@ -4,6 +4,7 @@ Stores current game state (data only, no logic).
 
 In Godot: extends Resource
 """
+from array import array
 from dataclasses import dataclass, field
 from typing import List, Optional
 from src.resources.deck_resource import DeckResource
@@ -27,7 +28,7 @@ class TwinHandsState:
     decks: List[Optional[DeckResource]] = field(default_factory=list)
 
     # === SCORING STATE (GDD 4-7) ===
-    scores: List[int] = field(default_factory=list)  # Per-deck scores
+    scores: array = field(default_factory=lambda: array('i'))  # Per-deck scores (packed C ints)
 
     # === TOKEN STATE (GDD v6.1 4-3) ===
     # GDD v6.1: Hand tokens unlimited (no tracking), discard + trade tokens limited
@@ -38,7 +39,8 @@ class TwinHandsState:
     current_round: int = 1  # Rounds start at 1, not 0
 
     # === PLAY TRACKING (GDD 4-3: max 2 hands per deck) ===
-    hands_played_per_deck: List[int] = field(default_factory=list)
+    # Packed unsigned bytes (array('B')): tiny counters stored unboxed and zeroed in place
+    hands_played_per_deck: array = field(default_factory=lambda: array('B'))
 
     def __post_init__(self):
         """
@@ -51,8 +53,8 @@ class TwinHandsState:
         self.decks = [None] * num_decks
 
         # Initialize per-deck tracking
-        self.scores = [0] * num_decks
-        self.hands_played_per_deck = [0] * num_decks
+        self.scores = array('i', [0]) * num_decks
+        self.hands_played_per_deck = array('B', [0]) * num_decks
 
         # Initialize tokens from config (GDD v6.1)
         self.discard_tokens = self.config.discard_tokens_per_round
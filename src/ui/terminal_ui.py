@@ -8,6 +8,7 @@ from typing import List, Optional
 from src.managers.game_manager import GameManager
 from src.resources.card_resource import CardResource
 from src.resources.hand_resource import HandResource
+from src.resources.twin_hands_config_resource import TwinHandsConfig
 from src.utils.hand_highlight_detector import HandHighlightDetector
 
 # Fix Windows console encoding for emoji support
@@ -19,6 +20,17 @@ if sys.platform == 'win32':
         import codecs
         sys.stdout = codecs.getwriter('utf-8')(sys.stdout.buffer, 'strict')
 
+    # Enable ANSI escape processing once so clear_screen() can use escape codes
+    try:
+        import ctypes
+        kernel32 = ctypes.windll.kernel32
+        handle = kernel32.GetStdHandle(-11)  # STD_OUTPUT_HANDLE
+        mode = ctypes.c_uint32()
+        if kernel32.GetConsoleMode(handle, ctypes.byref(mode)):
+            kernel32.SetConsoleMode(handle, mode.value | 0x0004)  # ENABLE_VIRTUAL_TERMINAL_PROCESSING
+    except (AttributeError, OSError):
+        pass
+
 
 class TerminalUI:
     """
@@ -82,10 +94,17 @@ class TerminalUI:
             "Three of a Kind", "Two Pair", "Pair"
         ]
 
+        # Pre-rendered "rank+suit" strings (color codes included), keyed by (rank, suit)
+        self._card_glyphs = {
+            (rank, suit): self._render_card_glyph(rank, suit)
+            for rank in TwinHandsConfig.RANK_VALUES
+            for suit in self.SUITS
+        }
+
     def clear_screen(self):
-        """Clear terminal (cross-platform)."""
-        import os
-        os.system('cls' if os.name == 'nt' else 'clear')
+        """Clear terminal (cross-platform) with ANSI cursor-home + erase instead of a subprocess."""
+        sys.stdout.write("\x1b[H\x1b[2J")
+        sys.stdout.flush()
 
     def format_card(self, card: CardResource, index: int = None, bg_color: str = None) -> str:
         """
@@ -99,22 +118,27 @@ class TerminalUI:
         Returns:
             Formatted string like "[0] K♥" (red) or "[1] 3♠" (white)
         """
-        suit_symbol = self.SUITS.get(card.suit, card.suit[0].upper())
-        suit_color = self.SUIT_COLORS.get(card.suit, self.WHITE)
-
-        # Pad rank to 2 chars for alignment (10 is special)
-        rank_str = f"{card.rank:>2}"
+        key = (card.rank, card.suit)
+        card_str = self._card_glyphs.get(key)
+        if card_str is None:
+            card_str = self._card_glyphs[key] = self._render_card_glyph(card.rank, card.suit)
 
         # Apply background color if provided (for highlighting)
         if bg_color:
-            card_str = f"{bg_color}{suit_color}{rank_str}{suit_symbol}{self.RESET}"
-        else:
-            card_str = f"{suit_color}{rank_str}{suit_symbol}{self.RESET}"
+            card_str = bg_color + card_str
 
         if index is not None:
             return f"{self.GRAY}[{index}]{self.RESET} {card_str}"
         return card_str
 
+    def _render_card_glyph(self, rank: str, suit: str) -> str:
+        """Render the colored "rank+suit" string for one card (cached by format_card)."""
+        suit_symbol = self.SUITS.get(suit, suit[0].upper())
+        suit_color = self.SUIT_COLORS.get(suit, self.WHITE)
+
+        # Pad rank to 2 chars for alignment (10 is special)
+        return f"{suit_color}{rank:>2}{suit_symbol}{self.RESET}"
+
     def format_hand_type(self, hand: HandResource) -> str:
         """Format hand type with score (Balatro style)."""
         score_color = self.CYAN if hand.base_score >= 15 else self.WHITE
@@ -131,16 +155,23 @@ class TerminalUI:
         bar_filled = "#" * (progress // 5)
         bar_empty = "-" * (20 - (progress // 5))
 
-        print(f"\n{self.BOLD}{'='*70}{self.RESET}")
-        print(f"{self.YELLOW}{self.BOLD}  TWIN HANDS{self.RESET} {self.GRAY}|{self.RESET} "
-              f"{self.CYAN}Round {state['round']}{self.RESET}")
-        print(f"{self.BOLD}{'='*70}{self.RESET}\n")
-
         # Score display (big numbers like Balatro)
         score_color = self.GREEN if current_score >= quota else self.RED
-        print(f"  {self.BOLD}Round Score:{self.RESET} {score_color}{self.BOLD}{current_score:,}{self.RESET} "
-              f"{self.GRAY}/{self.RESET} {self.CYAN}{quota:,}{self.RESET}")
-        print(f"  {self.GRAY}[{bar_filled}{bar_empty}] {progress}%{self.RESET}\n")
+
+        # Build the whole block, then emit it with one write
+        lines = [
+            "",
+            f"{self.BOLD}{'='*70}{self.RESET}",
+            f"{self.YELLOW}{self.BOLD}  TWIN HANDS{self.RESET} {self.GRAY}|{self.RESET} "
+            f"{self.CYAN}Round {state['round']}{self.RESET}",
+            f"{self.BOLD}{'='*70}{self.RESET}",
+            "",
+            f"  {self.BOLD}Round Score:{self.RESET} {score_color}{self.BOLD}{current_score:,}{self.RESET} "
+            f"{self.GRAY}/{self.RESET} {self.CYAN}{quota:,}{self.RESET}",
+            f"  {self.GRAY}[{bar_filled}{bar_empty}] {progress}%{self.RESET}",
+            "",
+        ]
+        sys.stdout.write("\n".join(lines) + "\n")
 
     def display_tokens(self):
         """Display token status (GDD v6.1: discard + trade tokens)."""
@@ -154,14 +185,16 @@ class TerminalUI:
         trade_color = self.CYAN if state["trade_tokens"] > 0 else self.GRAY
         trade_icons = "[T]" * state["trade_tokens"] + self.GRAY + "[_]" * (2 - state["trade_tokens"]) + self.RESET
 
-        print(f"  {self.BOLD}Discard Tokens:{self.RESET} {discard_color}{state['discard_tokens']}/3{self.RESET} {discard_icons}")
-        print(f"  {self.BOLD}Trade Tokens:{self.RESET} {trade_color}{state['trade_tokens']}/2{self.RESET} {trade_icons}\n")
+        sys.stdout.write(
+            f"  {self.BOLD}Discard Tokens:{self.RESET} {discard_color}{state['discard_tokens']}/3{self.RESET} {discard_icons}\n"
+            f"  {self.BOLD}Trade Tokens:{self.RESET} {trade_color}{state['trade_tokens']}/2{self.RESET} {trade_icons}\n\n"
+        )
 
     def display_deck_status(self):
         """Display per-deck hand counts (unique to Twin Hands)."""
         state = self.game.get_game_state_summary()
 
-        print(f"  {self.BOLD}Deck Status:{self.RESET}")
+        lines = [f"  {self.BOLD}Deck Status:{self.RESET}"]
         for i, count in enumerate(state["hands_played_per_deck"]):
             deck_num = i + 1
             max_hands = self.game.config.max_hands_per_deck
@@ -174,30 +207,31 @@ class TerminalUI:
                 status_color = self.GRAY
                 status = f"{count}/{max_hands} {self.RED}(MAX){self.RESET}"
 
-            print(f"    {self.CYAN}Deck {deck_num}:{self.RESET} {status_color}{status}{self.RESET} hands played")
-        print()
+            lines.append(f"    {self.CYAN}Deck {deck_num}:{self.RESET} {status_color}{status}{self.RESET} hands played")
+        lines.append("")
+        sys.stdout.write("\n".join(lines) + "\n")
 
     def _sort_cards(self, cards: List[CardResource]) -> List[CardResource]:
-        """Sort cards by rank first, then suit."""
-        rank_order = ["A", "2", "3", "4", "5", "6", "7", "8", "9", "10", "J", "Q", "K"]
+        """Sort cards in place by rank first, then suit (returns the same list)."""
+        suit_order = self.SUIT_ORDER
 
         def sort_key(card):
-            rank_idx = rank_order.index(card.rank) if card.rank in rank_order else 99
-            suit_idx = self.SUIT_ORDER.index(card.suit) if card.suit in self.SUIT_ORDER else 99
-            return (rank_idx, suit_idx)  # Rank first, suit second
+            # card.rank_idx is the cached A-low rank order (A, 2, ..., K)
+            suit_idx = suit_order.index(card.suit) if card.suit in suit_order else 99
+            return (card.rank_idx, suit_idx)  # Rank first, suit second
 
-        return sorted(cards, key=sort_key)
+        cards.sort(key=sort_key)
+        return cards
 
     def display_decks(self):
         """Display both decks with hand highlighting (GDD v6.1)."""
-        print(f"{self.BOLD}{'-'*70}{self.RESET}")
+        lines = [f"{self.BOLD}{'-'*70}{self.RESET}"]
 
         for deck_idx in range(self.game.config.num_decks):
             # Sort the actual visible_cards list (modifies state)
             # This ensures displayed order matches actual indices
             deck = self.game.state.decks[deck_idx]
-            deck.visible_cards = self._sort_cards(deck.visible_cards)
-            cards = deck.visible_cards
+            cards = self._sort_cards(deck.visible_cards)
             deck_num = deck_idx + 1
 
             # Deck header
@@ -211,8 +245,9 @@ class TerminalUI:
                 deck_color = self.GRAY
                 status = f"{self.RED}X{self.RESET}"  # Red X = maxed out
 
-            print(f"\n  {status} {deck_color}{self.BOLD}DECK {deck_num}{self.RESET} "
-                  f"{self.GRAY}({hands_played}/{max_hands} played){self.RESET}")
+            lines.append("")
+            lines.append(f"  {status} {deck_color}{self.BOLD}DECK {deck_num}{self.RESET} "
+                         f"{self.GRAY}({hands_played}/{max_hands} played){self.RESET}")
 
             # GDD v6.1: Detect highlights for this deck
             filters = self.enabled_filters.get(deck_idx, [])
@@ -239,17 +274,19 @@ class TerminalUI:
                 unified_idx = (deck_idx * 7) + i + 1  # 1-indexed
                 bg_color = highlight_map.get(i, None)
                 card_str += self.format_card(card, unified_idx, bg_color) + "  "
-            print(card_str)
+            lines.append(card_str)
 
-        print(f"\n{self.BOLD}{'-'*70}{self.RESET}\n")
+        lines.extend(("", f"{self.BOLD}{'-'*70}{self.RESET}", ""))
+        sys.stdout.write("\n".join(lines) + "\n")
 
     def display_hands_played(self):
         """Display hands played this round (like Balatro's hand history)."""
-        if not self.game._hands_played:
+        hands_played = self.game.get_hands_played()
+        if not hands_played:
             return
 
         print(f"  {self.BOLD}Hands Played This Round:{self.RESET}")
-        for i, hand in enumerate(self.game._hands_played, 1):
+        for i, hand in enumerate(hands_played, 1):
             print(f"    {self.GRAY}{i}.{self.RESET} {self.format_hand_type(hand)}")
         print()
 
@@ -365,3 +402,41 @@ class TerminalUI:
     def prompt_input(self) -> str:
         """Get user input with styled prompt."""
         return input(f"  {self.YELLOW}>{self.RESET} ").strip()
+
+    def wait_ack(self, timeout: float = 1.5):
+        """
+        Pause after a message until a key is pressed or timeout expires.
+
+        Non-blocking replacement for input("Press Enter to continue..."):
+        the prompt auto-advances so rapid play is not stalled, while an
+        early keypress still skips the remaining wait.
+
+        Args:
+            timeout: Seconds to wait before continuing automatically
+        """
+        print(f"  {self.GRAY}Press Enter to continue...{self.RESET}", end="", flush=True)
+        acknowledged = False
+        try:
+            if sys.platform == 'win32':
+                import msvcrt
+                import time
+                deadline = time.monotonic() + timeout
+                while time.monotonic() < deadline:
+                    if msvcrt.kbhit():
+                        # Drain buffered keys so they don't leak into the next prompt
+                        while msvcrt.kbhit():
+                            msvcrt.getwch()
+                        break
+                    time.sleep(0.01)
+            else:
+                import select
+                ready, _, _ = select.select([sys.stdin], [], [], timeout)
+                if ready:
+                    # Consume exactly the acknowledging line (Enter echoes its own newline)
+                    sys.stdin.readline()
+                    acknowledged = True
+        except (OSError, ValueError):
+            # stdin is not a selectable stream (e.g. redirected in tests) - just continue
+            pass
+        if not acknowledged:
+            print()
@@ -5,7 +5,10 @@ In Godot: class with static functions (no extends)
 """
 
 import random
-from typing import List
+from typing import List, Optional, Tuple
+
+# Prototype 52-card deck, built once (cards are never mutated after creation)
+_STANDARD_DECK: Optional[Tuple['CardResource', ...]] = None
 
 
 class CardFactory:
@@ -48,7 +51,11 @@ class CardFactory:
 
     @staticmethod
     def create_shuffled_deck() -> List['CardResource']:
-        """Create and shuffle a new deck."""
-        deck = CardFactory.create_deck()
-        CardFactory.shuffle_deck(deck)
-        return deck
+        """
+        Create and shuffle a new deck.
+        Samples from a cached prototype deck instead of rebuilding 52 cards.
+        """
+        global _STANDARD_DECK
+        if _STANDARD_DECK is None:
+            _STANDARD_DECK = tuple(CardFactory.create_deck())
+        return random.sample(_STANDARD_DECK, len(_STANDARD_DECK))
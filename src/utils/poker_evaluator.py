@@ -39,7 +39,7 @@ class PokerEvaluator:
             HandResource with hand_type and base score from TwinHandsConfig
         """
         from src.resources.hand_resource import HandResource
-        from src.resources.twin_hands_config_resource import TwinHandsConfig
+        from src.resources.twin_hands_config_resource import HAND_SCORES
 
         if len(cards) < 1 or len(cards) > 5:
             # Invalid hand
@@ -109,7 +109,7 @@ class PokerEvaluator:
             hand_type = "High Card"
 
         # Get base score from TwinHandsConfig (GDD v6.1 4-7)
-        base_score = TwinHandsConfig.HAND_SCORES[hand_type]
+        base_score = HAND_SCORES[hand_type]
         # Base mult is always 1.0 (Jokers will modify this in Phase B - GDD 4-5-3)
         mult = 1.0
 
@@ -131,7 +131,8 @@ class PokerEvaluator:
     @staticmethod
     def _is_straight(cards: List['CardResource']) -> bool:
         """Check if cards form a straight."""
-        values = sorted([card.get_rank_value() for card in cards])
+        values = [card.get_rank_value() for card in cards]
+        values.sort()
 
         # Check normal straight
         if values == list(range(values[0], values[0] + 5)):
@@ -5,7 +5,7 @@ Verifies game behavior matches GDD specification for hand evaluation and scoring
 """
 
 import pytest
-from src.managers.game_manager import GameManager
+from src.managers.game_manager import GameManager, PlayError
 from src.resources.twin_hands_config_resource import TwinHandsConfig
 from src.resources.card_resource import CardResource
 
@@ -68,6 +68,33 @@ class TestGDD_4_7_HandScoring:
         assert hand.hand_type == "Invalid"
         assert hand.base_score == 0
 
+    def test_negative_card_index_is_rejected(self, setup):
+        """Out-of-range indices fail before the hand counter is touched."""
+        game = setup
+        visible_before = list(game.state.decks[0].visible_cards)
+
+        result = game.play_hand(deck_index=0, card_indices=[-1])
+
+        assert result["success"] == False
+        assert result["error"] == PlayError.INVALID_CARD_INDICES
+        assert list(game.state.hands_played_per_deck) == [0, 0]
+        assert game.state.decks[0].visible_cards == visible_before
+
+    def test_duplicate_card_index_is_rejected(self, setup):
+        """Repeated indices fail before a hand is recorded or a discard token is spent."""
+        game = setup
+        visible_before = list(game.state.decks[0].visible_cards)
+        discard_tokens = game.state.discard_tokens
+
+        result = game.play_hand(deck_index=0, card_indices=[1, 1])
+        assert result["error"] == PlayError.INVALID_CARD_INDICES
+        assert list(game.state.hands_played_per_deck) == [0, 0]
+
+        result = game.discard_cards(deck_index=0, card_indices=[1, 1])
+        assert result["error"] == PlayError.INVALID_CARD_INDICES
+        assert game.state.discard_tokens == discard_tokens
+        assert game.state.decks[0].visible_cards == visible_before
+
     # Future tests (from GDD 4-7):
     # - test_royal_flush_scores_60
     # - test_straight_flush_scores_50
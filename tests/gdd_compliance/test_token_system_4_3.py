@@ -5,6 +5,8 @@ Verifies game behavior matches GDD specification for tokens.
 """
 
 import pytest
+from src.managers.game_manager import GameManager, PlayError
+from src.resources.twin_hands_config_resource import TwinHandsConfig
 
 
 class TestGDD_4_3_TokenSystem:
@@ -14,6 +16,17 @@ class TestGDD_4_3_TokenSystem:
         """Placeholder test - implement after TokenManager is created."""
         pass
 
+    def test_discard_count_error_reports_selection(self):
+        """GDD 4-3: Discarding more than 5 cards fails and reports the count."""
+        game = GameManager(TwinHandsConfig())
+        game.start_game()
+
+        result = game.discard_cards(deck_index=0, card_indices=[0, 1, 2, 3, 4, 5])
+
+        assert result["success"] == False
+        assert result["error"] == PlayError.INVALID_DISCARD_COUNT
+        assert "(you selected 6)" in result["error"].describe(result)
+
     # Future tests (from GDD 4-3):
     # - test_4_hand_tokens_per_round
     # - test_3_trade_tokens_per_round
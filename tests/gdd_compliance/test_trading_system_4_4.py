@@ -58,7 +58,7 @@ class TestGDD_4_4_TradingSystem:
         result = game.trade_card(source_deck=0, target_deck=1, card_index=0)
 
         assert result["success"] == False
-        assert "trade token" in result["error"].lower()
+        assert "trade token" in str(result["error"]).lower()
 
     def test_giving_deck_draws_replacements(self, setup):
         """GDD v6.1 4-4: Giving deck redraws 1 card (stays at 7 baseline)."""
@@ -127,6 +127,23 @@ class TestDeckManager:
         # Draw pile should have 3 fewer cards
         assert len(state.decks[0].draw_pile) == initial_draw_pile_count - 3
 
+    def test_play_and_refill_discards_and_redraws(self, setup):
+        """GDD v6.1 4-2: Removed cards go to discard pile and are replaced."""
+        config, state, manager = setup
+
+        manager.split_deck()
+        deck = state.decks[0]
+        initial_visible = len(deck.visible_cards)
+        initial_draw_pile_count = len(deck.draw_pile)
+        expected = [deck.visible_cards[0], deck.visible_cards[2]]
+
+        removed = manager.play_and_refill(deck_index=0, card_indices=[0, 2])
+
+        assert removed == expected
+        assert deck.discard_pile == expected
+        assert len(deck.visible_cards) == initial_visible
+        assert len(deck.draw_pile) == initial_draw_pile_count - 2
+
     def test_manager_is_logic_only(self, setup):
         """RULE 3: Manager is logic only, no data storage."""
         config, state, manager = setup
@@ -105,6 +105,7 @@ class TestGameManager:
 
         # Should be sum of the 2 hands
         assert total_score > 0  # At least High Card (3) per hand = 6+
+        assert total_score == game.scoring_manager.calculate_total_score(game.get_hands_played())
 
     def test_get_visible_cards(self, game):
         """Should be able to get visible cards for each deck."""
@@ -117,6 +118,31 @@ class TestGameManager:
         assert len(cards_deck_0) == game.config.visible_cards_per_deck
         assert len(cards_deck_1) == game.config.visible_cards_per_deck
 
+    def test_game_state_summary_tracks_played_hands(self, game):
+        """Summary view should reflect each hand played and be read-only."""
+        game.start_game()
+        summary = game.get_game_state_summary()
+
+        game.play_hand(deck_index=0, card_indices=[0, 1])
+
+        assert game.get_game_state_summary() is summary
+        assert summary["hands_this_round"] == 1
+        assert summary["current_score"] == game.calculate_round_score()
+        with pytest.raises(TypeError):
+            summary["current_score"] = 0
+
+    def test_game_state_summary_reflects_direct_state_changes(self, game):
+        """Summary should be current even when state changes outside GameManager actions."""
+        game.start_game()
+        game.get_game_state_summary()
+
+        game.token_manager.spend_discard_token()
+        game.state.current_round = 2
+
+        summary = game.get_game_state_summary()
+        assert summary["discard_tokens"] == game.state.discard_tokens
+        assert summary["round"] == 2
+
     def test_manager_is_logic_only(self, game):
         """RULE 3: Manager is logic only, stores manager refs."""
         assert hasattr(game, 'config')
@@ -5,6 +5,7 @@ Tests hand evaluation and scoring calculation (PHASE A: no Jokers).
 """
 
 import pytest
+from src.managers import scoring_manager
 from src.managers.scoring_manager import ScoringManager
 from src.resources.twin_hands_config_resource import TwinHandsConfig
 from src.resources.twin_hands_state_resource import TwinHandsState
@@ -104,6 +105,34 @@ class TestScoringManager:
         assert hand.hand_type == "High Card"
         assert hand.base_score == 3
 
+    def test_ace_high_straight(self, setup):
+        """GDD 4-7: A can be high in a straight (Q-K-A)."""
+        config, state, manager = setup
+
+        cards = [
+            CardResource(rank="Q", suit="hearts"),
+            CardResource(rank="K", suit="spades"),
+            CardResource(rank="A", suit="clubs")
+        ]
+
+        hand = manager.evaluate_hand(cards)
+        assert hand.hand_type == "Straight"
+
+    def test_evaluate_royal_flush(self, setup):
+        """GDD 4-7: A-K-Q-J same suit is a Royal Flush."""
+        config, state, manager = setup
+
+        cards = [
+            CardResource(rank="A", suit="spades"),
+            CardResource(rank="K", suit="spades"),
+            CardResource(rank="Q", suit="spades"),
+            CardResource(rank="J", suit="spades")
+        ]
+
+        hand = manager.evaluate_hand(cards)
+        assert hand.hand_type == "Royal Flush"
+        assert hand.base_score == 60
+
     def test_calculate_total_score_basic(self, setup):
         """PHASE A: Total score is sum of base scores (no Jokers)."""
         config, state, manager = setup
@@ -124,3 +153,13 @@ class TestScoringManager:
         assert hasattr(manager, 'config')
         assert hasattr(manager, 'state')
         assert not hasattr(manager, 'score')  # This is in state
+
+    def test_hand_lut_cache_is_opt_in(self, tmp_path):
+        """The LUT touches disk only when given a cache path, and the cache round-trips."""
+        cache_path = tmp_path / "hand_lut.pkl"
+        built = scoring_manager._load_hand_lut()
+
+        assert scoring_manager._load_hand_lut(cache_path) == built
+        assert cache_path.exists()
+        assert scoring_manager._load_hand_lut(cache_path) == built
+        assert [p.name for p in tmp_path.iterdir()] == ["hand_lut.pkl"]
@@ -177,7 +177,7 @@ class TestTokenManager:
         # Tokens restored
         assert state.discard_tokens == config.discard_tokens_per_round
         assert state.trade_tokens == config.trade_tokens_per_round
-        assert state.hands_played_per_deck == [0, 0]
+        assert list(state.hands_played_per_deck) == [0, 0]
 
     # === GODOT-READY ===
 
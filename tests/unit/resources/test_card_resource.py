@@ -13,3 +13,26 @@ class TestCardResource:
     def test_placeholder(self):
         """Placeholder test - implement after CardResource is copied."""
         pass
+
+    def test_card_code_round_trips(self):
+        """Every card of a standard deck has a unique one-byte code that decodes back."""
+        from src.resources.card_resource import decode_card, encode_card
+        from src.utils.card_factory import CardFactory
+
+        deck = CardFactory.create_deck()
+        codes = {card.code for card in deck}
+
+        assert len(codes) == 52
+        assert max(codes) < 256
+        for card in deck:
+            assert encode_card(card.rank, card.suit) == card.code
+            assert decode_card(card.code) == (card.rank, card.suit)
+
+    def test_unknown_rank_or_suit_raises_value_error(self):
+        """Unknown ranks/suits fail with a ValueError naming the bad value."""
+        from src.resources.card_resource import CardResource
+
+        with pytest.raises(ValueError, match="'T'"):
+            CardResource(rank="T", suit="hearts")
+        with pytest.raises(ValueError, match="'Hx'"):
+            CardResource(rank="A", suit="Hx")